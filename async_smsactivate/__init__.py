@@ -0,0 +1,92 @@
+"""Unofficial sms-activate.org API client.
+
+Public names are imported on first access, so ``from async_smsactivate import SMSActivateAPI``
+loads requests but not aiohttp, and ``AsyncSMSActivateAPI`` loads aiohttp but not requests.
+"""
+import importlib
+import sys
+import types
+from typing import TYPE_CHECKING
+
+__version__ = "1.5"
+
+# 名称 -> 所在子模块
+_EXPORTS = {
+    'API_URL': 'api',
+    'SMSActivateAPI': 'sync_api',
+    'AsyncSMSActivateAPI': 'async_api',
+    'BlockingSMSActivateAPI': 'blocking',
+    'SMSActivatePool': 'pool',
+    'AsyncSMSActivatePool': 'pool',
+    'RetryPolicy': 'retry',
+    'RateLimiter': 'ratelimit',
+    'CircuitBreaker': 'breaker',
+    'MirrorSelector': 'mirrors',
+    'shared_limiter': 'ratelimit',
+    'CatalogCache': 'cache',
+    'PriceBook': 'pricebook',
+    'ActivationWatcher': 'watcher',
+    'CodeEvent': 'watcher',
+    'RentManager': 'rent',
+    'ActivationJournal': 'journal',
+    'Timeouts': 'deadline',
+    'AiohttpTransport': 'transport',
+    'HttpxTransport': 'transport',
+    'DeadlineExceeded': 'deadline',
+    'deadline': 'deadline',
+    'MetricsSink': 'metrics',
+    'InMemoryMetrics': 'metrics',
+    'CallbackSink': 'metrics',
+    'ActivationStatus': 'models',
+    'PurchaseResult': 'bulk',
+}
+
+__all__ = list(_EXPORTS)
+
+# 与所在子模块同名的导出
+_SHADOWED = frozenset({'deadline'})
+
+if TYPE_CHECKING:
+    from .api import API_URL
+    from .async_api import AsyncSMSActivateAPI
+    from .blocking import BlockingSMSActivateAPI
+    from .breaker import CircuitBreaker
+    from .bulk import PurchaseResult
+    from .cache import CatalogCache
+    from .deadline import DeadlineExceeded, Timeouts, deadline
+    from .journal import ActivationJournal
+    from .metrics import CallbackSink, InMemoryMetrics, MetricsSink
+    from .mirrors import MirrorSelector
+    from .models import ActivationStatus
+    from .pool import AsyncSMSActivatePool, SMSActivatePool
+    from .pricebook import PriceBook
+    from .ratelimit import RateLimiter, shared_limiter
+    from .rent import RentManager
+    from .retry import RetryPolicy
+    from .sync_api import SMSActivateAPI
+    from .transport import AiohttpTransport, HttpxTransport
+    from .watcher import ActivationWatcher, CodeEvent
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    value = getattr(importlib.import_module('.' + module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+class _Package(types.ModuleType):
+    def __setattr__(self, name, value):
+        # 首次导入子模块时 import 系统会把同名的包属性设为子模块本身，这里改为子模块中的同名对象
+        if name in _SHADOWED and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
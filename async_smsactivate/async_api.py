@@ -0,0 +1,268 @@
+import asyncio
+import time
+from functools import partial
+from typing import Optional, Dict, Any, AsyncIterator, Iterable, Mapping, Tuple, Union
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from .api import API_URL
+from .breaker import CircuitBreaker, CircuitOpen
+from .bulk import PurchaseResult, buy_numbers, gather_limited, status_updates
+from .cache import CatalogCache
+from .deadline import DeadlineExceeded, Timeouts, check_remaining, remaining
+from .dispatch import Dispatch
+from .endpoint_methods import AsyncEndpoints
+from .journal import JOURNALED_ACTIONS, ActivationJournal
+from .jsonlib import Loads, get_loads
+from .metrics import MetricsSink
+from .mirrors import MirrorSelector
+from .models import ActivationStatus
+from .parsers import (CODES, ERRORS, PARSERS, RENT_CODES, TYPED_PARSERS, http_error, parse_response,
+                      parse_status)
+from .polling import backoff_schedule
+from .ratelimit import RateLimiter
+from .rent import RentManager
+from .retry import RetryPolicy, transient_error
+from .transport import AiohttpTransport, Transport
+from .watcher import CodeEvent, stream_codes
+
+# 默认时限：连接 10 秒、两次读取之间 30 秒、整个请求 60 秒
+DEFAULT_TIMEOUTS = Timeouts(connect=10.0, read=30.0, total=60.0)
+
+
+class AsyncSMSActivateAPI(AsyncEndpoints):
+
+    def __init__(self, api_key: str, limit: int = 100, limit_per_host: int = 0,
+                 use_dns_cache: bool = True, ttl_dns_cache: Optional[int] = 10,
+                 keepalive_timeout: float = 15.0, session: Optional[aiohttp.ClientSession] = None,
+                 api_url: str = API_URL, json_backend: Union[str, Loads, None] = "auto",
+                 typed_results: bool = False, rate_limiter: Optional[RateLimiter] = None,
+                 retry_policy: Optional[RetryPolicy] = None, cache: Optional[CatalogCache] = None,
+                 metrics: Optional[MetricsSink] = None, journal: Optional[ActivationJournal] = None,
+                 timeout: Union[Timeouts, float, None] = DEFAULT_TIMEOUTS, transport: Optional[Transport] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 api_urls: Union[MirrorSelector, Iterable[str], None] = None):
+        # api_urls：多个镜像地址（或共享的 mirrors.MirrorSelector），按延迟和错误率选择并自动切换
+        self.mirrors = None if api_urls is None else MirrorSelector.coerce(api_urls)
+        if self.mirrors is not None:
+            api_url = self.mirrors.urls[0]
+        self.__api_url = api_url
+        self.__host = urlsplit(api_url).netloc
+        self.api_key = api_key
+        self.debug_mode = False
+        self.json_loads = get_loads(json_backend)
+        # 为 True 时 getNumber / getRentNumber / getPrices 等返回 models.py 中的 __slots__ 结果对象
+        self.parsers = TYPED_PARSERS if typed_results else PARSERS
+        # 限流器：多个客户端传入同一个 RateLimiter 即共享请求预算（见 ratelimit.shared_limiter）
+        self.rate_limiter = rate_limiter
+        # 重试策略：None 表示不重试，见 retry.RetryPolicy
+        self.retry_policy = retry_policy
+        # 熔断器：按 (主机, 接口) 统计失败率，熔断期间直接返回 CIRCUIT_OPEN，None 表示不熔断
+        self.circuit_breaker = circuit_breaker
+        # 目录类接口（getPrices、getCountries、getOperators 等）的缓存，None 表示不缓存
+        self.cache = cache
+        # 指标：每次 HTTP 请求回调一次 metrics.MetricsSink，None 表示不采集
+        self.metrics = metrics
+        # 激活日志：购买、状态变更和验证码写入 journal.ActivationJournal，重启后可回放
+        self.journal = journal
+        # 单次请求的 connect / read / total 时限（秒）；数值表示 total，None 表示不限制。
+        # 在 deadline() 块中调用时，各项时限不会超过剩余时间
+        self.timeouts = Timeouts.coerce(timeout)
+        # HTTP 传输：默认 aiohttp（limit 为连接池总连接数，0 表示不限制，limit_per_host 为单个主机的连接数上限），
+        # 会话在第一次请求时才创建，绑定到实际运行的事件循环；传入的共享会话 / 传输不会被 close() 关闭
+        if transport is None:
+            transport = AiohttpTransport(limit=limit, limit_per_host=limit_per_host, use_dns_cache=use_dns_cache,
+                                         ttl_dns_cache=ttl_dns_cache, keepalive_timeout=keepalive_timeout,
+                                         session=session)
+            self.__owns_transport = True
+        else:
+            self.__owns_transport = False
+        self.transport = transport
+
+        self.__CODES = CODES
+        self.__RENT_CODES = RENT_CODES
+        self.__ERRORS = ERRORS
+
+    def version(self) -> str:
+        return "1.5"
+
+    def check_error(self, response: str) -> bool:
+        return self.__ERRORS.get(response) is not None
+
+    def get_error(self, error: str) -> Optional[str]:
+        return self.__ERRORS.get(error)
+
+    def __debugLog(self, data: Any) -> None:
+        if self.debug_mode:
+            print('[Debug]', data)
+
+    def response(self, action: str, response: Union[str, bytes]) -> Dict[str, Any]:
+        self.__debugLog(response)
+        return parse_response(action, response, self.json_loads, self.parsers)
+
+    def __result(self, action: str, status: int, body: bytes) -> Any:
+        # 非 2xx 的响应体（网关错误页等）不是接口的回复，不交给解析器
+        error = http_error(status)
+        if error is not None:
+            self.__debugLog(body)
+            return error
+        return self.response(action, body)
+
+    def activationStatus(self, status: str) -> Dict[str, Optional[str]]:
+        return {"status": status, "message": self.__CODES.get(status)}
+
+    def rentStatus(self, status: str) -> Optional[str]:
+        return self.__RENT_CODES.get(status)
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """The ``aiohttp.ClientSession`` of the default ``AiohttpTransport``."""
+        transport = self.transport
+        if not isinstance(transport, AiohttpTransport):
+            # 其他传输没有 aiohttp 会话：hasattr(api, "session") 为 False
+            raise AttributeError("session is only available with AiohttpTransport, not %s"
+                                 % type(transport).__name__)
+        return transport.session
+
+    async def __cached_request(self, cache: CatalogCache, action: str, params: Dict[str, Any]) -> Any:
+        async def fetch():
+            return self.__result(action, *await self.__make_request(dict(params)))
+
+        params['api_key'] = self.api_key
+        return await cache.get(action, params, fetch)
+
+    async def __make_request(self, params: Dict[str, Any]) -> Tuple[int, bytes]:
+        params['api_key'] = self.api_key
+        action = params['action']
+        # 镜像选择、熔断统计和重试 / 切换规则见 dispatch.Dispatch，这里只负责发送请求和等待
+        dispatch = Dispatch(action, self.__api_url, self.__host, self.mirrors, self.circuit_breaker,
+                            self.retry_policy, self.metrics)
+        transport = self.transport
+        while True:
+            url = dispatch.start()
+            try:
+                if self.rate_limiter is None:
+                    status, body = await self.__fetch(dispatch, url, params)
+                else:
+                    async with self.rate_limiter.limit_async(action):
+                        status, body = await self.__fetch(dispatch, url, params)
+            except transport.errors as e:
+                delay = dispatch.failed(e, transport.unsent(e))
+                if delay is None:
+                    raise
+            except BaseException as e:
+                # 取消：归还半开状态的探测名额
+                dispatch.cancelled(e)
+                raise
+            else:
+                delay = dispatch.answered(status, body)
+                if delay is None:
+                    return status, body
+            if delay:
+                await asyncio.sleep(delay)
+
+    async def __fetch(self, dispatch: Dispatch, url: str, params: Dict[str, Any]) -> Tuple[int, bytes]:
+        timeouts = self.timeouts.bounded(check_remaining())
+        # 在限流之后计时，延迟中不包含排队等待的时间
+        dispatch.sending()
+        return await self.transport.get(url, params, timeouts)
+
+    # --------------------------- 接口方法 ---------------------------
+    # getBalance、getNumber、getStatus 等继承自 endpoint_methods（由 endpoints.ENDPOINTS 生成），统一经过 _request
+    async def _request(self, action: str, params: Dict[str, Any]) -> Any:
+        try:
+            if self.cache is not None and action in self.cache:
+                return await self.__cached_request(self.cache, action, params)
+            result = self.__result(action, *await self.__make_request(params))
+        except CircuitOpen as e:
+            return e.as_error()
+        if self.journal is not None and action in JOURNALED_ACTIONS:
+            self.journal.observe(action, params, result)
+        return result
+
+    # --------------------------- 批量购买 ---------------------------
+    def getNumbers(self, service: str, count: int, countries: Optional[Iterable[Any]] = None,
+                   operators: Optional[Iterable[Optional[str]]] = None, maxPrice: Optional[str] = None,
+                   concurrency: int = 10, v2: bool = False, **kwargs: Any) -> AsyncIterator[PurchaseResult]:
+        """Buy ``count`` numbers concurrently, falling back across countries/operators, see ``bulk.buy_numbers``.
+
+            async for result in api.getNumbers("vk", 50, countries=[0, 6], maxPrice="20", concurrency=8):
+                if result.ok:
+                    print(result.activation["activation_id"])
+        """
+        return buy_numbers(self, service, count, countries=countries, operators=operators, maxPrice=maxPrice,
+                           concurrency=concurrency, v2=v2, **kwargs)
+
+    # --------------------------- 批量状态操作 ---------------------------
+    async def setStatusBatch(self, ids: Union[Iterable[Any], Mapping[Any, Any]], status: Optional[str] = None,
+                             forward: Optional[str] = None, concurrency: int = 20,
+                             purchased_at: Optional[Mapping[Any, float]] = None) -> Dict[Any, Any]:
+        # ids 可以是 id 列表（统一设置为 status），也可以是 {id: status}；取消（8）优先发送，见 bulk.status_updates
+        updates = status_updates(ids, status, purchased_at)
+        return await gather_limited([(id, partial(self.setStatus, id=id, forward=forward, status=value))
+                                     for id, value in updates], concurrency)
+
+    async def getStatusBatch(self, ids: Iterable[Any], concurrency: int = 20) -> Dict[Any, Any]:
+        return await gather_limited([(id, partial(self.getStatus, id=id)) for id in ids], concurrency)
+
+    # --------------------------- 租赁服务 ---------------------------
+    def rent_manager(self, **kwargs: Any) -> RentManager:
+        """Renew rents ahead of expiry and collect their messages, see ``rent.RentManager``."""
+        return RentManager(self, **kwargs)
+
+    # --------------------------- 等待验证码 ---------------------------
+    async def wait_for_code(self, activation_id: int, timeout: float = 600.0,
+                            schedule: Optional[Iterable[float]] = None) -> Union[ActivationStatus, Dict[str, Any]]:
+        """Poll getStatus until the code arrives.
+
+        Returns the ``STATUS_OK`` status, or the error dict (e.g. ``STATUS_CANCEL``) as soon as the
+        server reports a terminal error; transient ones (``NO_CONNECTION``, HTTP 5xx, network errors,
+        ...) are polled through. Raises ``asyncio.TimeoutError`` after ``timeout`` seconds, which also
+        bounds a ``getStatus`` call still in flight, or earlier at the end of an enclosing
+        ``deadline()`` block. ``schedule`` overrides the delays between polls, see
+        ``polling.backoff_schedule``; the last delay of a finite schedule is repeated.
+        """
+        budget = remaining()
+        if budget is not None:
+            timeout = max(0.0, min(timeout, budget))
+        loop = asyncio.get_running_loop()
+        expiry = loop.time() + timeout
+        delays = iter(schedule) if schedule is not None else backoff_schedule()
+        delay = 1.0
+        while True:
+            try:
+                # 每次查询都不超过剩余时间
+                result = await asyncio.wait_for(self.getStatus(activation_id), max(expiry - loop.time(), 0.0))
+            except DeadlineExceeded:
+                raise
+            except self.transport.errors:
+                # 网络错误（包括本次查询超时）算作一次失败的查询
+                result = None
+            if isinstance(result, dict):
+                if not transient_error(result.get('error')):
+                    return result
+            elif result is not None:
+                status = result if isinstance(result, ActivationStatus) else parse_status(result)
+                if status.received:
+                    return status
+            left = expiry - loop.time()
+            if left <= 0:
+                raise asyncio.TimeoutError("No sms for activation %s after %ss" % (activation_id, timeout))
+            # 有限的 schedule 用完后重复最后一个间隔
+            delay = next(delays, delay)
+            await asyncio.sleep(min(delay, left))
+
+    def stream_codes(self, interval: float = 5.0, full_text: bool = True) -> AsyncIterator[CodeEvent]:
+        """Yield ``(activation_id, code, full_text)`` for every open activation, see ``watcher.stream_codes``."""
+        return stream_codes(self, interval=interval, full_text=full_text)
+
+    async def close(self) -> None:
+        if self.__owns_transport:
+            await self.transport.close()
+
+    async def __aenter__(self) -> "AsyncSMSActivateAPI":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
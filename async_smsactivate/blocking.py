@@ -0,0 +1,106 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Coroutine, Dict, Iterable, List, Mapping, Optional, Union
+
+from .bulk import PurchaseResult
+from .deadline import deadline, remaining
+from .endpoint_methods import BlockingEndpoints
+
+
+async def _within_deadline(awaitable: Awaitable[Any]) -> Any:
+    # deadline() 经 contextvars 随协程进入事件循环线程，在那里按剩余时间取消并抛出 DeadlineExceeded
+    async with deadline(None):
+        return await awaitable
+
+
+class BlockingSMSActivateAPI(BlockingEndpoints):
+    """Blocking facade over ``AsyncSMSActivateAPI`` (or ``AsyncSMSActivatePool``).
+
+    Calls are submitted to an event loop running in a background thread, so any number of threads
+    share the async client's connection pool, cache, rate limiter and retry policy. Pass ``api`` and
+    ``loop`` to drive a client that already runs on an application loop in another thread; otherwise
+    a client is created from ``api_key`` and ``client_kwargs`` on a private loop thread.
+
+        with BlockingSMSActivateAPI("你的 API Key", limit=200, retry_policy=RetryPolicy()) as api:
+            activation = api.getNumber(service="vk", country="0")
+            status = api.wait_for_code(activation["activation_id"], timeout=300)
+    """
+
+    def __init__(self, api_key: Optional[str] = None, api: Any = None,
+                 loop: Optional[asyncio.AbstractEventLoop] = None, timeout: Optional[float] = None,
+                 **client_kwargs: Any):
+        if api is None:
+            if api_key is None:
+                raise ValueError("api_key or api is required")
+            from .async_api import AsyncSMSActivateAPI
+
+            api = AsyncSMSActivateAPI(api_key, **client_kwargs)
+            self.__owns_api = True
+        else:
+            self.__owns_api = False
+        self.api = api
+        # 单次调用的等待上限（秒），超时后取消事件循环中的协程并抛出 TimeoutError
+        self.timeout = timeout
+        self.__thread: Optional[threading.Thread] = None
+        if loop is None:
+            loop = asyncio.new_event_loop()
+            self.__thread = threading.Thread(target=loop.run_forever, name='smsactivate-loop', daemon=True)
+            self.__thread.start()
+        self.loop = loop
+
+    def run(self, awaitable: Coroutine[Any, Any, Any]) -> Any:
+        """Run a coroutine on the background loop and wait for its result."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self.loop:
+            awaitable.close()
+            raise RuntimeError("BlockingSMSActivateAPI cannot be called from its own event loop; "
+                               "await the async client instead")
+        if remaining() is not None:
+            awaitable = _within_deadline(awaitable)
+        future = asyncio.run_coroutine_threadsafe(awaitable, self.loop)
+        try:
+            return future.result(self.timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def getNumbers(self, service: str, count: int, countries: Optional[Iterable[Any]] = None,
+                   operators: Optional[Iterable[Optional[str]]] = None, maxPrice: Optional[str] = None,
+                   concurrency: int = 10, v2: bool = False, **kwargs: Any) -> List[PurchaseResult]:
+        async def collect():
+            return [result async for result in self.api.getNumbers(service, count, countries=countries,
+                                                                   operators=operators, maxPrice=maxPrice,
+                                                                   concurrency=concurrency, v2=v2, **kwargs)]
+
+        return self.run(collect())
+
+    def setStatusBatch(self, ids: Union[Iterable[Any], Mapping[Any, Any]], status: Optional[str] = None,
+                       forward: Optional[str] = None, concurrency: int = 20,
+                       purchased_at: Optional[Mapping[Any, float]] = None) -> Dict[Any, Any]:
+        return self.run(self.api.setStatusBatch(ids, status=status, forward=forward, concurrency=concurrency,
+                                                purchased_at=purchased_at))
+
+    def getStatusBatch(self, ids: Iterable[Any], concurrency: int = 20) -> Dict[Any, Any]:
+        return self.run(self.api.getStatusBatch(ids, concurrency=concurrency))
+
+    def wait_for_code(self, activation_id: int, timeout: float = 600.0,
+                      schedule: Optional[Iterable[float]] = None) -> Any:
+        return self.run(self.api.wait_for_code(activation_id, timeout=timeout, schedule=schedule))
+
+    def close(self) -> None:
+        if self.__owns_api:
+            self.run(self.api.close())
+        if self.__thread is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.__thread.join()
+            self.loop.close()
+            self.__thread = None
+
+    def __enter__(self) -> "BlockingSMSActivateAPI":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,211 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from .retry import transient_response
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+Key = Tuple[str, str]
+
+
+class CircuitOpen(Exception):
+    """Raised by ``CircuitBreaker.acquire`` while the circuit of a host/action refuses requests."""
+
+    def __init__(self, host: str, action: str, retry_after: float):
+        super().__init__("Circuit open for %s on %s, retry in %.1fs" % (action, host, retry_after))
+        self.host = host
+        self.action = action
+        self.retry_after = retry_after
+
+    def as_error(self) -> Dict[str, Any]:
+        return {"error": "CIRCUIT_OPEN", "message": str(self)}
+
+
+class Circuit:
+    """State of one ``(host, action)``: the outcomes of the last ``window`` calls and the open/half-open timers."""
+
+    __slots__ = ('state', 'outcomes', 'failures', 'slow', 'opened_at', 'probes', 'successes', 'generation', 'trips')
+
+    def __init__(self, window: int):
+        self.state = CLOSED
+        # (失败, 慢调用) 二元组，滑动窗口
+        self.outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=window)
+        self.failures = 0
+        self.slow = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        self.successes = 0
+        # 状态每次切换加一，切换前发出的请求的结果不再计入
+        self.generation = 0
+        self.trips = 0
+
+
+class Attempt:
+    """One request admitted by ``CircuitBreaker.acquire``; report its outcome exactly once."""
+
+    __slots__ = ('breaker', 'key', 'generation', 'probe', 'done')
+
+    def __init__(self, breaker: "CircuitBreaker", key: Key, generation: int, probe: bool):
+        self.breaker = breaker
+        self.key = key
+        self.generation = generation
+        self.probe = probe
+        self.done = False
+
+    def record(self, latency: float, status: int, body: bytes) -> None:
+        self.breaker._finish(self, latency, self.breaker.is_failure(status, body))
+
+    def failure(self, latency: float) -> None:
+        self.breaker._finish(self, latency, True)
+
+    def release(self) -> None:
+        # 请求被取消或因 deadline() 超时：不计入统计，只归还半开状态的探测名额
+        self.breaker._finish(self, None, False)
+
+
+class CircuitBreaker:
+    """Fail fast while sms-activate is degraded instead of letting every caller wait out its own failure.
+
+    Each ``(host, action)`` keeps the outcomes of its last ``window`` requests. Once at least
+    ``min_calls`` are recorded and the share of failures (network errors, HTTP 5xx/429, empty bodies,
+    ``NO_CONNECTION`` / ``ERROR_SQL``) reaches ``failure_rate`` - or the share of requests slower than
+    ``slow_call_duration`` reaches ``slow_call_rate`` - the circuit opens: requests are refused with
+    ``CIRCUIT_OPEN`` for ``open_for`` seconds. Then up to ``half_open_probes`` requests are let through;
+    if they all succeed the circuit closes, a failure opens it again. Share one instance between
+    clients, like ``RateLimiter``.
+
+        breaker = CircuitBreaker(failure_rate=0.5, window=20, open_for=30, slow_call_duration=5)
+        api = AsyncSMSActivateAPI(api_key, circuit_breaker=breaker)
+        await api.getStatus(id)  # {"error": "CIRCUIT_OPEN", ...} while open
+    """
+
+    def __init__(self, failure_rate: float = 0.5, window: int = 20, min_calls: int = 10, open_for: float = 30.0,
+                 half_open_probes: int = 1, slow_call_duration: Optional[float] = None, slow_call_rate: float = 0.5,
+                 on_state_change: Optional[Callable[[str, str, str, str], None]] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_rate = failure_rate
+        self.window = window
+        self.min_calls = min(min_calls, window)
+        self.open_for = open_for
+        self.half_open_probes = half_open_probes
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate = slow_call_rate
+        # on_state_change(host, action, 旧状态, 新状态)，可用于导出指标或报警
+        self.on_state_change = on_state_change
+        self.clock = clock
+        self.circuits: Dict[Key, Circuit] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_failure(status: int, body: bytes) -> bool:
+        return transient_response(status, body)
+
+    def state(self, host: str, action: str) -> str:
+        circuit = self.circuits.get((host, action))
+        if circuit is None:
+            return CLOSED
+        if circuit.state == OPEN and self.clock() - circuit.opened_at >= self.open_for:
+            return HALF_OPEN
+        return circuit.state
+
+    def acquire(self, host: str, action: str) -> Attempt:
+        """Admit one request or raise ``CircuitOpen``."""
+        key = (host, action)
+        changed = None
+        with self._lock:
+            circuit = self.circuits.get(key)
+            if circuit is None:
+                circuit = self.circuits[key] = Circuit(self.window)
+            if circuit.state == OPEN:
+                left = circuit.opened_at + self.open_for - self.clock()
+                if left > 0:
+                    raise CircuitOpen(host, action, left)
+                changed = self._switch(circuit, HALF_OPEN)
+            probe = circuit.state == HALF_OPEN
+            if probe:
+                if circuit.probes >= self.half_open_probes:
+                    raise CircuitOpen(host, action, 0.0)
+                circuit.probes += 1
+            attempt = Attempt(self, key, circuit.generation, probe)
+        self._notify(key, changed)
+        return attempt
+
+    def _finish(self, attempt: Attempt, latency: Optional[float], failed: bool) -> None:
+        if attempt.done:
+            return
+        attempt.done = True
+        changed = None
+        with self._lock:
+            circuit = self.circuits[attempt.key]
+            if attempt.generation != circuit.generation:
+                return
+            if attempt.probe:
+                circuit.probes -= 1
+                if latency is None:
+                    return
+                if failed or self._is_slow(latency):
+                    changed = self._switch(circuit, OPEN)
+                else:
+                    circuit.successes += 1
+                    if circuit.successes >= self.half_open_probes:
+                        changed = self._switch(circuit, CLOSED)
+            elif latency is not None:
+                slow = self._is_slow(latency)
+                if len(circuit.outcomes) == circuit.outcomes.maxlen:
+                    old_failed, old_slow = circuit.outcomes[0]
+                    circuit.failures -= old_failed
+                    circuit.slow -= old_slow
+                circuit.outcomes.append((failed, slow))
+                circuit.failures += failed
+                circuit.slow += slow
+                calls = len(circuit.outcomes)
+                if calls >= self.min_calls and (circuit.failures >= self.failure_rate * calls
+                                                or (self.slow_call_duration is not None
+                                                    and circuit.slow >= self.slow_call_rate * calls)):
+                    changed = self._switch(circuit, OPEN)
+        self._notify(attempt.key, changed)
+
+    def _is_slow(self, latency: float) -> bool:
+        return self.slow_call_duration is not None and latency >= self.slow_call_duration
+
+    def _switch(self, circuit: Circuit, state: str) -> Tuple[str, str]:
+        old = circuit.state
+        circuit.state = state
+        circuit.generation += 1
+        circuit.probes = circuit.successes = 0
+        if state == OPEN:
+            circuit.opened_at = self.clock()
+            circuit.trips += 1
+        if state == CLOSED:
+            circuit.outcomes.clear()
+            circuit.failures = circuit.slow = 0
+        return old, state
+
+    def _notify(self, key: Key, changed: Optional[Tuple[str, str]]) -> None:
+        if changed is not None and self.on_state_change is not None:
+            self.on_state_change(key[0], key[1], *changed)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.circuits.clear()
+
+    def snapshot(self) -> Dict[Key, Dict[str, Any]]:
+        """Per ``(host, action)``: state, calls and failure/slow rates in the window, trips, seconds until a probe."""
+        now = self.clock()
+        with self._lock:
+            result = {}
+            for key, circuit in self.circuits.items():
+                calls = len(circuit.outcomes)
+                result[key] = {
+                    'state': self.state(*key),
+                    'calls': calls,
+                    'failure_rate': circuit.failures / calls if calls else 0.0,
+                    'slow_rate': circuit.slow / calls if calls else 0.0,
+                    'trips': circuit.trips,
+                    'retry_after': max(0.0, circuit.opened_at + self.open_for - now) if circuit.state == OPEN else 0.0,
+                }
+            return result
@@ -0,0 +1,173 @@
+import asyncio
+from functools import partial
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from .models import Record
+from .parsers import ERRORS
+
+# 当前国家/运营商没有号码，换下一个组合继续购买
+EXHAUSTED_ERRORS = frozenset({'NO_NUMBERS', 'ACCOUNT_INACTIVE', 'WHATSAPP_NOT_AVAILABLE'})
+# 账户级错误，剩余的购买不再发出请求
+FATAL_ERRORS = frozenset({'NO_BALANCE', 'BAD_KEY', 'NO_KEY', 'BANNED'})
+
+
+class PurchaseResult(Record):
+    __slots__ = ('index', 'activation', 'error', 'country', 'operator')
+
+    def __init__(self, index: int, activation: Any = None, error: Optional[Dict[str, Any]] = None,
+                 country: Any = None, operator: Optional[str] = None):
+        self.index = index
+        self.activation = activation
+        self.error = error
+        self.country = country
+        self.operator = operator
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def failure(exc: BaseException) -> Dict[str, Any]:
+    return {"error": type(exc).__name__, "message": str(exc)}
+
+
+def _error(result: Any) -> Optional[Dict[str, Any]]:
+    if isinstance(result, dict) and 'error' in result:
+        return result
+    if isinstance(result, dict) and result.get('status') == 'error':
+        return {"error": result.get('error') or result.get('message'), "message": result.get('message')}
+    return None
+
+
+async def buy_numbers(api: Any, service: str, count: int, countries: Optional[Iterable[Any]] = None,
+                      operators: Optional[Iterable[Optional[str]]] = None, maxPrice: Optional[str] = None,
+                      concurrency: int = 10, v2: bool = False, **kwargs: Any) -> AsyncIterator[PurchaseResult]:
+    """Buy ``count`` numbers with at most ``concurrency`` purchases in flight.
+
+    Country/operator pairs are tried in the given order; a pair that answers ``NO_NUMBERS`` is skipped
+    by every worker from then on. Results are yielded as they complete, one per requested number,
+    with failures reported in ``PurchaseResult.error`` instead of raised. An account-level error
+    (``NO_BALANCE``, ``BANNED``, ...) fails the remaining items without further requests.
+
+    When the consumer stops early (``break``, ``aclose()``, cancellation) no new purchases start, the
+    ones already in flight are awaited, and numbers bought but not yet yielded are cancelled with
+    ``setStatus(id, 8)`` so they are refunded instead of lost. Wrap the iterator in
+    ``contextlib.aclosing`` to run this cleanup right at ``break`` rather than when the generator
+    is finalized.
+    """
+    routes: List[Tuple[Any, Optional[str]]] = [(country, operator)
+                                               for country in (list(countries) if countries is not None else [None])
+                                               for operator in (list(operators) if operators is not None else [None])]
+    buy = api.getNumberV2 if v2 else api.getNumber
+    state: Dict[str, Any] = {'route': 0, 'next': 0, 'fatal': None, 'stopped': False}
+    results: asyncio.Queue = asyncio.Queue()
+
+    async def purchase(index: int) -> PurchaseResult:
+        last_error = None
+        while state['fatal'] is None and not state['stopped']:
+            position = state['route']
+            if position >= len(routes):
+                break
+            country, operator = routes[position]
+            try:
+                result = await buy(service=service, maxPrice=maxPrice, country=country, operator=operator, **kwargs)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                return PurchaseResult(index, error=failure(e), country=country, operator=operator)
+            error = _error(result)
+            if error is None:
+                return PurchaseResult(index, activation=result, country=country, operator=operator)
+            last_error = error
+            if error.get('error') in EXHAUSTED_ERRORS:
+                # 只有第一个发现的协程推进路由，其余协程直接重试新的组合
+                if state['route'] == position:
+                    state['route'] = position + 1
+                continue
+            if error.get('error') in FATAL_ERRORS:
+                state['fatal'] = error
+            return PurchaseResult(index, error=error, country=country, operator=operator)
+        error = state['fatal'] or last_error or {"error": "NO_NUMBERS", "message": ERRORS['NO_NUMBERS']}
+        return PurchaseResult(index, error=error)
+
+    # 已购买但尚未交给调用方的号码不超过 concurrency 个：调用方停止读取后不会继续购买
+    slots = asyncio.Semaphore(max(1, min(concurrency, count)))
+
+    async def worker() -> None:
+        while True:
+            await slots.acquire()
+            if state['next'] >= count or state['stopped']:
+                return
+            index = state['next']
+            state['next'] += 1
+            await results.put(await purchase(index))
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(max(1, min(concurrency, count)))]
+    try:
+        for _ in range(count):
+            result = await results.get()
+            slots.release()
+            yield result
+    finally:
+        # 不取消进行中的购买（服务端可能已经扣费），等它们完成后退还未交给调用方的号码
+        state['stopped'] = True
+        for _ in workers:
+            slots.release()
+        await asyncio.gather(*workers, return_exceptions=True)
+        abandoned = []
+        while not results.empty():
+            result = results.get_nowait()
+            if result.ok:
+                abandoned.append(activation_id(result.activation))
+        if abandoned:
+            await gather_limited([(id, partial(api.setStatus, id=id, status=CANCEL_STATUS))
+                                  for id in abandoned if id is not None], len(abandoned))
+
+
+def activation_id(activation: Any) -> Any:
+    # getNumber 返回 activation_id，getNumberV2 返回 activationId
+    if isinstance(activation, Mapping):
+        return activation.get('activation_id', activation.get('activationId'))
+    return None
+
+
+# --------------------------- 批量状态操作 ---------------------------
+CANCEL_STATUS = '8'
+
+
+def status_updates(ids: Union[Iterable[Any], Mapping[Any, Any]], status: Any = None,
+                   purchased_at: Optional[Mapping[Any, float]] = None) -> List[Tuple[Any, Any]]:
+    """Order ``(id, status)`` pairs so that cancels (status 8) go first.
+
+    Cancelling is only refunded within the activation window, so cancels are sent before anything
+    else and, when ``purchased_at`` is given, oldest purchase first.
+    """
+    updates = list(ids.items()) if isinstance(ids, Mapping) else [(id, status) for id in ids]
+
+    def priority(update: Tuple[Any, Any]) -> Tuple[int, float]:
+        id, value = update
+        if str(value) != CANCEL_STATUS:
+            return 1, 0.0
+        return 0, purchased_at.get(id, float('inf')) if purchased_at else 0.0
+
+    return sorted(updates, key=priority)
+
+
+async def gather_limited(calls: Iterable[Tuple[Any, Callable[[], Awaitable[Any]]]],
+                         concurrency: int) -> Dict[Any, Any]:
+    """Run ``(key, factory)`` calls with at most ``concurrency`` in flight, started in the given order."""
+    calls = list(calls)
+    results: Dict[Any, Any] = {key: None for key, _ in calls}
+    pending = iter(calls)
+
+    async def worker() -> None:
+        for key, factory in pending:
+            try:
+                results[key] = await factory()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                results[key] = failure(e)
+
+    await asyncio.gather(*[worker() for _ in range(max(1, min(concurrency, len(calls))))])
+    return results
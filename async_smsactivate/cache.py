@@ -0,0 +1,102 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+# 目录类接口的默认缓存时间（秒）
+DEFAULT_TTLS = {
+    'getCountries': 3600.0,
+    'getOperators': 600.0,
+    'getRentServicesAndCountries': 300.0,
+    'getPrices': 60.0,
+    'getTopCountriesByService': 60.0,
+}
+
+# (action, (参数名, 参数值), ...)
+_Key = Tuple[Any, ...]
+
+
+class CatalogCache:
+    """TTL + LRU cache for slowly changing catalog responses, keyed by action and request params.
+
+    Concurrent misses for the same key share one in-flight request. With ``stale_while_revalidate``
+    set, an entry that expired less than that many seconds ago is still served while a single
+    background refresh runs. Error responses are never stored. Cached results are shared between
+    callers and must not be mutated.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, max_entries: int = 256,
+                 stale_while_revalidate: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.max_entries = max_entries
+        self.stale_while_revalidate = stale_while_revalidate
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[_Key, Tuple[Any, float]]" = OrderedDict()
+        self._inflight: Dict[_Key, asyncio.Task] = {}
+        self._refreshing: Set[asyncio.Task] = set()
+
+    def __contains__(self, action: str) -> bool:
+        return action in self.ttls
+
+    @staticmethod
+    def key(action: str, params: Dict[str, Any]) -> _Key:
+        return (action,) + tuple(sorted((k, str(v)) for k, v in params.items() if k != 'action'))
+
+    async def get(self, action: str, params: Dict[str, Any], fetch: Callable[[], Awaitable[Any]]) -> Any:
+        ttl = self.ttls.get(action)
+        if ttl is None:
+            return await fetch()
+        key = self.key(action, params)
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, fetched_at = entry
+            age = self.clock() - fetched_at
+            if age < ttl:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return value
+            if self.stale_while_revalidate is not None and age < ttl + self.stale_while_revalidate:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                if key not in self._inflight:
+                    task = self._start(key, fetch)
+                    self._refreshing.add(task)
+                    task.add_done_callback(self._refreshed)
+                return value
+        self.misses += 1
+        inflight = self._inflight.get(key)
+        task = inflight if inflight is not None else self._start(key, fetch)
+        # shield：某个等待者被取消时不影响共享的请求
+        return await asyncio.shield(task)
+
+    def invalidate(self, action: Optional[str] = None) -> None:
+        if action is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[0] == action]:
+            del self._entries[key]
+
+    def _refreshed(self, task: asyncio.Task) -> None:
+        self._refreshing.discard(task)
+        if not task.cancelled():
+            # 后台刷新失败时保留旧值，下次请求再试
+            task.exception()
+
+    def _start(self, key: _Key, fetch: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        task = asyncio.get_running_loop().create_task(self._fill(key, fetch))
+        self._inflight[key] = task
+        return task
+
+    async def _fill(self, key: _Key, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            value = await fetch()
+        finally:
+            self._inflight.pop(key, None)
+        if not (isinstance(value, dict) and 'error' in value):
+            self._entries[key] = (value, self.clock())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
@@ -0,0 +1,141 @@
+import asyncio
+import time
+from contextvars import ContextVar, Token
+from typing import NamedTuple, Optional, Tuple, Union
+
+
+class DeadlineExceeded(asyncio.TimeoutError):
+    """The time budget of a ``deadline()`` block ran out."""
+
+
+class Timeouts(NamedTuple):
+    """Per-request limits in seconds; None means no limit.
+
+    ``connect`` bounds establishing the connection, ``read`` the wait for each chunk of the response,
+    ``total`` the whole request including the time spent waiting for a pooled connection.
+    """
+    connect: Optional[float] = None
+    read: Optional[float] = None
+    total: Optional[float] = None
+
+    @classmethod
+    def coerce(cls, value: Union["Timeouts", float, Tuple[Optional[float], Optional[float]], None]) -> "Timeouts":
+        # 数值表示总时限；(connect, read) 元组与 requests 一致
+        if value is None:
+            return cls()
+        if isinstance(value, Timeouts):
+            return value
+        if isinstance(value, tuple):
+            return cls(value[0], value[1])
+        return cls(total=float(value))
+
+    def bounded(self, remaining: Optional[float]) -> "Timeouts":
+        """The limits, with every one of them capped at ``remaining`` seconds."""
+        if remaining is None:
+            return self
+        return Timeouts(*(remaining if value is None else min(value, remaining) for value in self))
+
+
+# 当前上下文的截止时间（time.monotonic），每个 asyncio 任务 / 线程各自独立
+_deadline: ContextVar[Optional[float]] = ContextVar('smsactivate_deadline', default=None)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left in the innermost ``deadline()`` block, or None outside of one."""
+    expiry = _deadline.get()
+    if expiry is None:
+        return None
+    return expiry - time.monotonic()
+
+
+def check_remaining() -> Optional[float]:
+    """Like ``remaining()`` but raises ``DeadlineExceeded`` once the budget is used up."""
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceeded("Deadline exceeded")
+    return left
+
+
+def expired() -> bool:
+    """True once the budget of the current ``deadline()`` is used up."""
+    left = remaining()
+    return left is not None and left <= 0
+
+
+def overruns(delay: float) -> bool:
+    """True if sleeping ``delay`` seconds before a retry would outlast the current ``deadline()``."""
+    left = remaining()
+    return left is not None and delay >= left
+
+
+def bounded_timeout(timeout: Union[float, Tuple[Optional[float], Optional[float]], None],
+                    remaining: Optional[float]) -> Union[float, Tuple[Optional[float], Optional[float]], None]:
+    """A requests-style timeout (number or ``(connect, read)``) capped at ``remaining`` seconds."""
+    if remaining is None:
+        return timeout
+    if timeout is None:
+        return remaining
+    if isinstance(timeout, tuple):
+        return (remaining if timeout[0] is None else min(timeout[0], remaining),
+                remaining if timeout[1] is None else min(timeout[1], remaining))
+    return min(timeout, remaining)
+
+
+class deadline:
+    """One time budget for everything the clients do inside the block.
+
+    Every request made in the block is sent with its timeouts capped at the time left, retries stop
+    once the next backoff would overrun it, and ``wait_for_code`` gives up at the deadline. Nested
+    blocks can only shorten the budget. ``async with`` additionally cancels the task when the budget
+    runs out, turning the cancellation into ``DeadlineExceeded``; plain ``with`` only bounds the
+    requests (and is what sync code uses).
+
+        async with deadline(120):
+            activation = await api.getNumber(service="vk")
+            status = await api.wait_for_code(activation["activation_id"])
+            await api.setStatus(activation["activation_id"], status="6")
+    """
+
+    def __init__(self, seconds: Optional[float]):
+        self.seconds = seconds
+        self.expired = False
+        self._token: Optional[Token] = None
+        self._handle: Optional[asyncio.TimerHandle] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def __enter__(self) -> "deadline":
+        expiry = None if self.seconds is None else time.monotonic() + self.seconds
+        outer = _deadline.get()
+        if outer is not None and (expiry is None or outer < expiry):
+            expiry = outer
+        self._token = _deadline.set(expiry)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if self._token is not None:
+            _deadline.reset(self._token)
+
+    async def __aenter__(self) -> "deadline":
+        self.__enter__()
+        left = remaining()
+        if left is not None:
+            self._task = asyncio.current_task()
+            self._handle = asyncio.get_running_loop().call_later(max(left, 0.0), self._expire)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> Optional[bool]:
+        if self._handle is not None:
+            self._handle.cancel()
+        self.__exit__(exc_type, exc_val, exc_tb)
+        if self.expired and exc_type is asyncio.CancelledError:
+            # 取消是本截止时间发出的：撤销这次取消，改为抛出超时
+            uncancel = getattr(self._task, 'uncancel', None)
+            if uncancel is not None:
+                uncancel()
+            raise DeadlineExceeded("Deadline exceeded") from exc_val
+        return None
+
+    def _expire(self) -> None:
+        self.expired = True
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
@@ -0,0 +1,160 @@
+"""Request-path decisions shared by ``AsyncSMSActivateAPI`` and ``SMSActivateAPI``.
+
+``Dispatch`` picks the mirror of each attempt, admits it through the circuit breaker, records the
+outcome in the breaker, the mirror statistics and the metrics sink, and decides whether to fail over
+to another mirror, back off and retry, or give up. The clients only send the HTTP request and sleep.
+"""
+import time
+from typing import List, Optional
+
+from .breaker import Attempt, CircuitBreaker, CircuitOpen
+from .deadline import DeadlineExceeded, expired, overruns
+from .metrics import MetricsSink, error_code
+from .mirrors import FAILOVER_POLICY, MirrorSelector
+from .retry import RetryPolicy, transient_response
+
+
+class Dispatch:
+    """State of one logical request (all its attempts). The client loop:
+
+        dispatch = Dispatch(action, url, host, mirrors, breaker, retry_policy, metrics)
+        while True:
+            url = dispatch.start()  # CircuitOpen when the circuit of every mirror is open
+            try:
+                dispatch.sending()  # after rate limiting
+                status, body = get(url)
+            except network_errors as e:
+                delay = dispatch.failed(e, unsent(e))
+                if delay is None:
+                    raise
+            except BaseException as e:
+                dispatch.cancelled(e)
+                raise
+            else:
+                delay = dispatch.answered(status, body)
+                if delay is None:
+                    return status, body
+            if delay:
+                sleep(delay)
+    """
+
+    __slots__ = ('action', 'url', 'host', 'mirrors', 'breaker', 'policy', 'metrics', 'retry', 'tried', 'attempt',
+                 'started', 'sent')
+
+    def __init__(self, action: str, url: str, host: str, mirrors: Optional[MirrorSelector] = None,
+                 breaker: Optional[CircuitBreaker] = None, policy: Optional[RetryPolicy] = None,
+                 metrics: Optional[MetricsSink] = None):
+        self.action = action
+        # 未设置镜像时固定使用 url；否则为当前尝试的镜像
+        self.url = url
+        self.host = host
+        self.mirrors = mirrors
+        self.breaker = breaker
+        self.policy = policy
+        self.metrics = metrics
+        self.retry = None if policy is None else policy.start()
+        # 本轮已尝试的镜像；重试时从最快的镜像重新开始
+        self.tried: List[str] = []
+        self.attempt: Optional[Attempt] = None
+        self.started = 0.0
+        self.sent = False
+
+    @property
+    def last(self) -> bool:
+        return self.mirrors is None or len(self.tried) >= len(self.mirrors)
+
+    def start(self) -> str:
+        """URL of the next attempt; raises ``CircuitOpen`` when no remaining mirror admits it."""
+        mirrors = self.mirrors
+        # 熔断检查在限流之前，熔断期间不占用请求预算
+        while True:
+            if mirrors is not None:
+                url = mirrors.choose(self.tried)
+                # 只有还有未尝试的镜像（last 为 False）时才会走到这里
+                assert url is not None
+                self.url = url
+                self.host = mirrors.host(self.url)
+                self.tried.append(self.url)
+            if self.breaker is None:
+                return self.url
+            try:
+                self.attempt = self.breaker.acquire(self.host, self.action)
+                return self.url
+            except CircuitOpen:
+                if self.last:
+                    raise
+
+    def sending(self) -> None:
+        """The request is about to go out (after rate limiting); starts the latency clock."""
+        self.sent = True
+        if self.metrics is not None:
+            self.metrics.request_started(self.action)
+        self.started = time.perf_counter()
+
+    def answered(self, status: int, body: bytes) -> Optional[float]:
+        """Record a response; the delay before the next attempt, or None to return this one."""
+        latency = time.perf_counter() - self.started
+        self.sent = False
+        if self.metrics is not None:
+            self.metrics.request_finished(self.action, latency, status, error_code(status, body), len(body))
+        if self.attempt is not None:
+            self.attempt.record(latency, status, body)
+            self.attempt = None
+        if self.mirrors is not None:
+            self.mirrors.record(self.url, latency, transient_response(status, body))
+        if self.last and self.retry is None:
+            return None
+        # 是否可以换镜像重发与重试的规则相同
+        if not (self.policy or FAILOVER_POLICY).should_retry_response(self.action, status, body):
+            return None
+        return self.__next()
+
+    def failed(self, exc: BaseException, unsent: bool) -> Optional[float]:
+        """Record a network error; the delay before the next attempt, or None to re-raise it.
+
+        Raises ``DeadlineExceeded`` instead when the timeout was cut short by ``deadline()``.
+        """
+        latency = time.perf_counter() - self.started
+        if self.sent and self.metrics is not None:
+            self.metrics.request_finished(self.action, latency, None, type(exc).__name__, 0)
+        self.sent = False
+        if isinstance(exc, DeadlineExceeded) or expired():
+            # deadline() 截短时限导致的超时不算服务端故障
+            self.__release()
+            if isinstance(exc, DeadlineExceeded):
+                return None
+            raise DeadlineExceeded("Deadline exceeded") from exc
+        if self.attempt is not None:
+            self.attempt.failure(latency)
+            self.attempt = None
+        if self.mirrors is not None:
+            self.mirrors.record(self.url, latency, True)
+        if self.last and self.retry is None:
+            return None
+        if not (self.policy or FAILOVER_POLICY).should_retry_exception(self.action, unsent):
+            return None
+        return self.__next()
+
+    def cancelled(self, exc: BaseException) -> None:
+        """Record an exception that ends the request, e.g. cancellation."""
+        if self.sent and self.metrics is not None:
+            self.metrics.request_finished(self.action, time.perf_counter() - self.started, None,
+                                          type(exc).__name__, 0)
+        self.sent = False
+        self.__release()
+
+    def __release(self) -> None:
+        # 不计入统计，只归还半开状态的探测名额
+        if self.attempt is not None:
+            self.attempt.release()
+            self.attempt = None
+
+    def __next(self) -> Optional[float]:
+        if not self.last:
+            return 0.0
+        # last 且未设置重试策略的情况已在调用方返回
+        delay = None if self.retry is None else self.retry.next_delay()
+        if delay is None or overruns(delay):
+            return None
+        self.tried = []
+        return delay
@@ -0,0 +1,568 @@
+"""Endpoint methods generated from ``endpoints.ENDPOINTS``, do not edit.
+
+Regenerate with ``python -m async_smsactivate.endpoints``.
+"""
+from typing import Any, Coroutine, Dict, Optional
+
+
+class SyncEndpoints:
+    """Endpoint methods of the requests client (``SMSActivateAPI``)."""
+
+    def _request(self, action: str, params: Dict[str, Any]) -> Any:
+        raise NotImplementedError
+
+    def getBalance(self) -> Any:
+        params: Dict[str, Any] = {'action': 'getBalance'}
+        return self._request('getBalance', params)
+
+    def getBalanceAndCashBack(self) -> Any:
+        params: Dict[str, Any] = {'action': 'getBalanceAndCashBack'}
+        return self._request('getBalanceAndCashBack', params)
+
+    def getNumbersStatus(self, country: Optional[str] = None, operator: Optional[str] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getNumbersStatus'}
+        if country is not None:
+            params['country'] = country
+        if operator:
+            params['operator'] = operator
+        return self._request('getNumbersStatus', params)
+
+    def getNumber(self, service: Optional[str] = None, forward: Optional[str] = None, freePrice: Optional[str] = None,
+                  maxPrice: Optional[str] = None, phoneException: Optional[str] = None, operator: Optional[str] = None,
+                  ref: Optional[str] = None, country: Optional[str] = None, verification: Optional[str] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getNumber'}
+        if service:
+            params['service'] = service
+        if forward:
+            params['forward'] = forward
+        if freePrice:
+            params['freePrice'] = freePrice
+        if maxPrice:
+            params['maxPrice'] = maxPrice
+        if phoneException:
+            params['phoneException'] = phoneException
+        if operator:
+            params['operator'] = operator
+        if ref:
+            params['ref'] = ref
+        if country is not None:
+            params['country'] = country
+        if verification:
+            params['verification'] = verification
+        return self._request('getNumber', params)
+
+    def getNumberV2(self, service: Optional[str] = None, forward: Optional[str] = None, freePrice: Optional[str] = None,
+                    maxPrice: Optional[str] = None, phoneException: Optional[str] = None,
+                    operator: Optional[str] = None, ref: Optional[str] = None, country: Optional[str] = None,
+                    verification: Optional[str] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getNumberV2'}
+        if service:
+            params['service'] = service
+        if forward:
+            params['forward'] = forward
+        if freePrice:
+            params['freePrice'] = freePrice
+        if maxPrice:
+            params['maxPrice'] = maxPrice
+        if phoneException:
+            params['phoneException'] = phoneException
+        if operator:
+            params['operator'] = operator
+        if ref:
+            params['ref'] = ref
+        if country is not None:
+            params['country'] = country
+        if verification:
+            params['verification'] = verification
+        return self._request('getNumberV2', params)
+
+    def getMultiServiceNumber(self, service: Optional[str] = None, forward: Optional[str] = None,
+                              operator: Optional[str] = None, ref: Optional[str] = None,
+                              country: Optional[str] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getMultiServiceNumber'}
+        if service:
+            params['multiService'] = service
+        if forward:
+            params['forward'] = forward
+        if operator:
+            params['operator'] = operator
+        if ref:
+            params['ref'] = ref
+        if country is not None:
+            params['country'] = country
+        return self._request('getMultiServiceNumber', params)
+
+    def setStatus(self, id: Optional[int] = None, forward: Optional[str] = None, status: Optional[str] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'setStatus'}
+        if id:
+            params['id'] = id
+        if forward:
+            params['forward'] = forward
+        if status:
+            params['status'] = status
+        return self._request('setStatus', params)
+
+    def getStatus(self, id: Optional[int] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getStatus'}
+        if id:
+            params['id'] = id
+        return self._request('getStatus', params)
+
+    def getFullSms(self, id: Optional[int] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getFullSms'}
+        if id:
+            params['id'] = id
+        return self._request('getFullSms', params)
+
+    def getPrices(self, service: Optional[str] = None, country: Optional[str] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getPrices'}
+        if service:
+            params['service'] = service
+        if country is not None:
+            params['country'] = country
+        return self._request('getPrices', params)
+
+    def getCountries(self) -> Any:
+        params: Dict[str, Any] = {'action': 'getCountries'}
+        return self._request('getCountries', params)
+
+    def getAdditionalService(self, id: Optional[int] = None, service: Optional[str] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getAdditionalService'}
+        if id:
+            params['id'] = id
+        if service:
+            params['service'] = service
+        return self._request('getAdditionalService', params)
+
+    def getQiwiRequisites(self) -> Any:
+        params: Dict[str, Any] = {'action': 'getQiwiRequisites'}
+        return self._request('getQiwiRequisites', params)
+
+    def getRentServicesAndCountries(self, time: Optional[str] = None, operator: Optional[str] = None,
+                                    country: Optional[str] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getRentServicesAndCountries'}
+        if time:
+            params['time'] = time
+        if operator:
+            params['operator'] = operator
+        if country is not None:
+            params['country'] = country
+        return self._request('getRentServicesAndCountries', params)
+
+    def getRentNumber(self, service: Optional[str] = None, time: Optional[str] = None, operator: Optional[str] = None,
+                      country: Optional[str] = None, url: Optional[str] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getRentNumber'}
+        if service:
+            params['service'] = service
+        if time:
+            params['time'] = time
+        if operator:
+            params['operator'] = operator
+        if country is not None:
+            params['country'] = country
+        if url:
+            params['url'] = url
+        return self._request('getRentNumber', params)
+
+    def getRentStatus(self, id: Optional[int] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getRentStatus'}
+        if id:
+            params['id'] = id
+        return self._request('getRentStatus', params)
+
+    def setRentStatus(self, id: Optional[int] = None, status: Optional[str] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'setRentStatus'}
+        if id:
+            params['id'] = id
+        if status:
+            params['status'] = status
+        return self._request('setRentStatus', params)
+
+    def getRentList(self) -> Any:
+        params: Dict[str, Any] = {'action': 'getRentList'}
+        return self._request('getRentList', params)
+
+    def continueRentNumber(self, id: Optional[int] = None, time: Optional[str] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'continueRentNumber'}
+        if id:
+            params['id'] = id
+        if time:
+            params['rent_time'] = time
+        return self._request('continueRentNumber', params)
+
+    def getContinueRentPriceNumber(self, id: Optional[int] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getContinueRentPriceNumber'}
+        if id:
+            params['id'] = id
+        return self._request('getContinueRentPriceNumber', params)
+
+    def getTopCountriesByService(self, service: Optional[str] = None, freePrice: Optional[str] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getTopCountriesByService'}
+        if service:
+            params['service'] = service
+        if freePrice:
+            params['freePrice'] = freePrice
+        return self._request('getTopCountriesByService', params)
+
+    def getIncomingCallStatus(self, id: Optional[int] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getIncomingCallStatus'}
+        if id:
+            params['activationId'] = id
+        return self._request('getIncomingCallStatus', params)
+
+    def getOperators(self, country: Optional[str] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getOperators'}
+        if country is not None:
+            params['country'] = country
+        return self._request('getOperators', params)
+
+    def getActiveActivations(self) -> Any:
+        params: Dict[str, Any] = {'action': 'getActiveActivations'}
+        return self._request('getActiveActivations', params)
+
+    def createTaskForCall(self, activationId: int) -> Any:
+        params: Dict[str, Any] = {'action': 'createTaskForCall'}
+        params['activationId'] = activationId
+        return self._request('createTaskForCall', params)
+
+    def getOutgoingCalls(self, activationId: Optional[int] = None, date: Optional[str] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getOutgoingCalls'}
+        if activationId is not None:
+            params['activationId'] = activationId
+        if date is not None:
+            params['date'] = date
+        return self._request('getOutgoingCalls', params)
+
+
+class AsyncEndpoints:
+    """Endpoint methods of the aiohttp client (``AsyncSMSActivateAPI``)."""
+
+    async def _request(self, action: str, params: Dict[str, Any]) -> Any:
+        raise NotImplementedError
+
+    async def getBalance(self) -> Any:
+        params: Dict[str, Any] = {'action': 'getBalance'}
+        return await self._request('getBalance', params)
+
+    async def getBalanceAndCashBack(self) -> Any:
+        params: Dict[str, Any] = {'action': 'getBalanceAndCashBack'}
+        return await self._request('getBalanceAndCashBack', params)
+
+    async def getNumbersStatus(self, country: Optional[str] = None, operator: Optional[str] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getNumbersStatus'}
+        if country is not None:
+            params['country'] = country
+        if operator:
+            params['operator'] = operator
+        return await self._request('getNumbersStatus', params)
+
+    async def getNumber(self, service: Optional[str] = None, forward: Optional[str] = None,
+                        freePrice: Optional[str] = None, maxPrice: Optional[str] = None,
+                        phoneException: Optional[str] = None, operator: Optional[str] = None, ref: Optional[str] = None,
+                        country: Optional[str] = None, verification: Optional[str] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getNumber'}
+        if service:
+            params['service'] = service
+        if forward:
+            params['forward'] = forward
+        if freePrice:
+            params['freePrice'] = freePrice
+        if maxPrice:
+            params['maxPrice'] = maxPrice
+        if phoneException:
+            params['phoneException'] = phoneException
+        if operator:
+            params['operator'] = operator
+        if ref:
+            params['ref'] = ref
+        if country is not None:
+            params['country'] = country
+        if verification:
+            params['verification'] = verification
+        return await self._request('getNumber', params)
+
+    async def getNumberV2(self, service: Optional[str] = None, forward: Optional[str] = None,
+                          freePrice: Optional[str] = None, maxPrice: Optional[str] = None,
+                          phoneException: Optional[str] = None, operator: Optional[str] = None,
+                          ref: Optional[str] = None, country: Optional[str] = None,
+                          verification: Optional[str] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getNumberV2'}
+        if service:
+            params['service'] = service
+        if forward:
+            params['forward'] = forward
+        if freePrice:
+            params['freePrice'] = freePrice
+        if maxPrice:
+            params['maxPrice'] = maxPrice
+        if phoneException:
+            params['phoneException'] = phoneException
+        if operator:
+            params['operator'] = operator
+        if ref:
+            params['ref'] = ref
+        if country is not None:
+            params['country'] = country
+        if verification:
+            params['verification'] = verification
+        return await self._request('getNumberV2', params)
+
+    async def getMultiServiceNumber(self, service: Optional[str] = None, forward: Optional[str] = None,
+                                    operator: Optional[str] = None, ref: Optional[str] = None,
+                                    country: Optional[str] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getMultiServiceNumber'}
+        if service:
+            params['multiService'] = service
+        if forward:
+            params['forward'] = forward
+        if operator:
+            params['operator'] = operator
+        if ref:
+            params['ref'] = ref
+        if country is not None:
+            params['country'] = country
+        return await self._request('getMultiServiceNumber', params)
+
+    async def setStatus(self, id: Optional[int] = None, forward: Optional[str] = None,
+                        status: Optional[str] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'setStatus'}
+        if id:
+            params['id'] = id
+        if forward:
+            params['forward'] = forward
+        if status:
+            params['status'] = status
+        return await self._request('setStatus', params)
+
+    async def getStatus(self, id: Optional[int] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getStatus'}
+        if id:
+            params['id'] = id
+        return await self._request('getStatus', params)
+
+    async def getFullSms(self, id: Optional[int] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getFullSms'}
+        if id:
+            params['id'] = id
+        return await self._request('getFullSms', params)
+
+    async def getPrices(self, service: Optional[str] = None, country: Optional[str] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getPrices'}
+        if service:
+            params['service'] = service
+        if country is not None:
+            params['country'] = country
+        return await self._request('getPrices', params)
+
+    async def getCountries(self) -> Any:
+        params: Dict[str, Any] = {'action': 'getCountries'}
+        return await self._request('getCountries', params)
+
+    async def getAdditionalService(self, id: Optional[int] = None, service: Optional[str] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getAdditionalService'}
+        if id:
+            params['id'] = id
+        if service:
+            params['service'] = service
+        return await self._request('getAdditionalService', params)
+
+    async def getQiwiRequisites(self) -> Any:
+        params: Dict[str, Any] = {'action': 'getQiwiRequisites'}
+        return await self._request('getQiwiRequisites', params)
+
+    async def getRentServicesAndCountries(self, time: Optional[str] = None, operator: Optional[str] = None,
+                                          country: Optional[str] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getRentServicesAndCountries'}
+        if time:
+            params['time'] = time
+        if operator:
+            params['operator'] = operator
+        if country is not None:
+            params['country'] = country
+        return await self._request('getRentServicesAndCountries', params)
+
+    async def getRentNumber(self, service: Optional[str] = None, time: Optional[str] = None,
+                            operator: Optional[str] = None, country: Optional[str] = None,
+                            url: Optional[str] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getRentNumber'}
+        if service:
+            params['service'] = service
+        if time:
+            params['time'] = time
+        if operator:
+            params['operator'] = operator
+        if country is not None:
+            params['country'] = country
+        if url:
+            params['url'] = url
+        return await self._request('getRentNumber', params)
+
+    async def getRentStatus(self, id: Optional[int] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getRentStatus'}
+        if id:
+            params['id'] = id
+        return await self._request('getRentStatus', params)
+
+    async def setRentStatus(self, id: Optional[int] = None, status: Optional[str] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'setRentStatus'}
+        if id:
+            params['id'] = id
+        if status:
+            params['status'] = status
+        return await self._request('setRentStatus', params)
+
+    async def getRentList(self) -> Any:
+        params: Dict[str, Any] = {'action': 'getRentList'}
+        return await self._request('getRentList', params)
+
+    async def continueRentNumber(self, id: Optional[int] = None, time: Optional[str] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'continueRentNumber'}
+        if id:
+            params['id'] = id
+        if time:
+            params['rent_time'] = time
+        return await self._request('continueRentNumber', params)
+
+    async def getContinueRentPriceNumber(self, id: Optional[int] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getContinueRentPriceNumber'}
+        if id:
+            params['id'] = id
+        return await self._request('getContinueRentPriceNumber', params)
+
+    async def getTopCountriesByService(self, service: Optional[str] = None, freePrice: Optional[str] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getTopCountriesByService'}
+        if service:
+            params['service'] = service
+        if freePrice:
+            params['freePrice'] = freePrice
+        return await self._request('getTopCountriesByService', params)
+
+    async def getIncomingCallStatus(self, id: Optional[int] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getIncomingCallStatus'}
+        if id:
+            params['activationId'] = id
+        return await self._request('getIncomingCallStatus', params)
+
+    async def getOperators(self, country: Optional[str] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getOperators'}
+        if country is not None:
+            params['country'] = country
+        return await self._request('getOperators', params)
+
+    async def getActiveActivations(self) -> Any:
+        params: Dict[str, Any] = {'action': 'getActiveActivations'}
+        return await self._request('getActiveActivations', params)
+
+    async def createTaskForCall(self, activationId: int) -> Any:
+        params: Dict[str, Any] = {'action': 'createTaskForCall'}
+        params['activationId'] = activationId
+        return await self._request('createTaskForCall', params)
+
+    async def getOutgoingCalls(self, activationId: Optional[int] = None, date: Optional[str] = None) -> Any:
+        params: Dict[str, Any] = {'action': 'getOutgoingCalls'}
+        if activationId is not None:
+            params['activationId'] = activationId
+        if date is not None:
+            params['date'] = date
+        return await self._request('getOutgoingCalls', params)
+
+
+class BlockingEndpoints:
+    """Endpoint methods of the blocking facade (``BlockingSMSActivateAPI``)."""
+
+    api: Any
+
+    def run(self, awaitable: Coroutine[Any, Any, Any]) -> Any:
+        raise NotImplementedError
+
+    def getBalance(self) -> Any:
+        return self.run(self.api.getBalance())
+
+    def getBalanceAndCashBack(self) -> Any:
+        return self.run(self.api.getBalanceAndCashBack())
+
+    def getNumbersStatus(self, country: Optional[str] = None, operator: Optional[str] = None) -> Any:
+        return self.run(self.api.getNumbersStatus(country=country, operator=operator))
+
+    def getNumber(self, service: Optional[str] = None, forward: Optional[str] = None, freePrice: Optional[str] = None,
+                  maxPrice: Optional[str] = None, phoneException: Optional[str] = None, operator: Optional[str] = None,
+                  ref: Optional[str] = None, country: Optional[str] = None, verification: Optional[str] = None) -> Any:
+        return self.run(self.api.getNumber(service=service, forward=forward, freePrice=freePrice, maxPrice=maxPrice,
+                                           phoneException=phoneException, operator=operator, ref=ref, country=country,
+                                           verification=verification))
+
+    def getNumberV2(self, service: Optional[str] = None, forward: Optional[str] = None, freePrice: Optional[str] = None,
+                    maxPrice: Optional[str] = None, phoneException: Optional[str] = None,
+                    operator: Optional[str] = None, ref: Optional[str] = None, country: Optional[str] = None,
+                    verification: Optional[str] = None) -> Any:
+        return self.run(self.api.getNumberV2(service=service, forward=forward, freePrice=freePrice, maxPrice=maxPrice,
+                                             phoneException=phoneException, operator=operator, ref=ref, country=country,
+                                             verification=verification))
+
+    def getMultiServiceNumber(self, service: Optional[str] = None, forward: Optional[str] = None,
+                              operator: Optional[str] = None, ref: Optional[str] = None,
+                              country: Optional[str] = None) -> Any:
+        return self.run(self.api.getMultiServiceNumber(service=service, forward=forward, operator=operator, ref=ref,
+                                                       country=country))
+
+    def setStatus(self, id: Optional[int] = None, forward: Optional[str] = None, status: Optional[str] = None) -> Any:
+        return self.run(self.api.setStatus(id=id, forward=forward, status=status))
+
+    def getStatus(self, id: Optional[int] = None) -> Any:
+        return self.run(self.api.getStatus(id=id))
+
+    def getFullSms(self, id: Optional[int] = None) -> Any:
+        return self.run(self.api.getFullSms(id=id))
+
+    def getPrices(self, service: Optional[str] = None, country: Optional[str] = None) -> Any:
+        return self.run(self.api.getPrices(service=service, country=country))
+
+    def getCountries(self) -> Any:
+        return self.run(self.api.getCountries())
+
+    def getAdditionalService(self, id: Optional[int] = None, service: Optional[str] = None) -> Any:
+        return self.run(self.api.getAdditionalService(id=id, service=service))
+
+    def getQiwiRequisites(self) -> Any:
+        return self.run(self.api.getQiwiRequisites())
+
+    def getRentServicesAndCountries(self, time: Optional[str] = None, operator: Optional[str] = None,
+                                    country: Optional[str] = None) -> Any:
+        return self.run(self.api.getRentServicesAndCountries(time=time, operator=operator, country=country))
+
+    def getRentNumber(self, service: Optional[str] = None, time: Optional[str] = None, operator: Optional[str] = None,
+                      country: Optional[str] = None, url: Optional[str] = None) -> Any:
+        return self.run(self.api.getRentNumber(service=service, time=time, operator=operator, country=country, url=url))
+
+    def getRentStatus(self, id: Optional[int] = None) -> Any:
+        return self.run(self.api.getRentStatus(id=id))
+
+    def setRentStatus(self, id: Optional[int] = None, status: Optional[str] = None) -> Any:
+        return self.run(self.api.setRentStatus(id=id, status=status))
+
+    def getRentList(self) -> Any:
+        return self.run(self.api.getRentList())
+
+    def continueRentNumber(self, id: Optional[int] = None, time: Optional[str] = None) -> Any:
+        return self.run(self.api.continueRentNumber(id=id, time=time))
+
+    def getContinueRentPriceNumber(self, id: Optional[int] = None) -> Any:
+        return self.run(self.api.getContinueRentPriceNumber(id=id))
+
+    def getTopCountriesByService(self, service: Optional[str] = None, freePrice: Optional[str] = None) -> Any:
+        return self.run(self.api.getTopCountriesByService(service=service, freePrice=freePrice))
+
+    def getIncomingCallStatus(self, id: Optional[int] = None) -> Any:
+        return self.run(self.api.getIncomingCallStatus(id=id))
+
+    def getOperators(self, country: Optional[str] = None) -> Any:
+        return self.run(self.api.getOperators(country=country))
+
+    def getActiveActivations(self) -> Any:
+        return self.run(self.api.getActiveActivations())
+
+    def createTaskForCall(self, activationId: int) -> Any:
+        return self.run(self.api.createTaskForCall(activationId=activationId))
+
+    def getOutgoingCalls(self, activationId: Optional[int] = None, date: Optional[str] = None) -> Any:
+        return self.run(self.api.getOutgoingCalls(activationId=activationId, date=date))
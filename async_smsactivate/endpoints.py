@@ -0,0 +1,182 @@
+"""Declarative description of the ``handler_api.php`` actions.
+
+``ENDPOINTS`` lists every action with its arguments; ``render()`` turns it into the source of
+``endpoint_methods.py``: the mixins ``SyncEndpoints``, ``AsyncEndpoints`` and ``BlockingEndpoints``
+that ``SMSActivateAPI`` (requests), ``AsyncSMSActivateAPI`` (aiohttp) and ``BlockingSMSActivateAPI``
+(the async engine driven from a background thread) inherit. The methods are plain source, so type
+checkers and IDEs see them; a method defined in the client class overrides the generated one.
+After editing ``ENDPOINTS`` regenerate the module, ``--check`` fails when it is out of date:
+
+    python -m async_smsactivate.endpoints [--check]
+"""
+import os
+import sys
+from typing import List, NamedTuple, Optional, Tuple
+
+# 参数何时放进请求：TRUTHY 为真值时（if x:），NOT_NONE 不为 None 时（0 号国家也要发送），ALWAYS 必填
+TRUTHY = 'truthy'
+NOT_NONE = 'not_none'
+ALWAYS = 'always'
+
+
+class Param(NamedTuple):
+    name: str
+    # 请求中的参数名，默认与方法参数同名
+    wire: Optional[str] = None
+    send: str = TRUTHY
+    annotation: str = 'Optional[str]'
+
+
+class Endpoint(NamedTuple):
+    action: str
+    params: Tuple[Param, ...] = ()
+
+
+def _id(wire: str = 'id') -> Param:
+    return Param('id', wire, TRUTHY, 'Optional[int]')
+
+
+_COUNTRY = Param('country', send=NOT_NONE)
+_NUMBER_PARAMS = (Param('service'), Param('forward'), Param('freePrice'), Param('maxPrice'), Param('phoneException'),
+                  Param('operator'), Param('ref'), _COUNTRY, Param('verification'))
+
+ENDPOINTS: Tuple[Endpoint, ...] = (
+    # --------------------------- 基础方法 ---------------------------
+    Endpoint('getBalance'),
+    Endpoint('getBalanceAndCashBack'),
+    # --------------------------- 号码状态 ---------------------------
+    Endpoint('getNumbersStatus', (_COUNTRY, Param('operator'))),
+    # --------------------------- 获取号码 ---------------------------
+    Endpoint('getNumber', _NUMBER_PARAMS),
+    Endpoint('getNumberV2', _NUMBER_PARAMS),
+    Endpoint('getMultiServiceNumber', (Param('service', 'multiService'), Param('forward'), Param('operator'),
+                                       Param('ref'), _COUNTRY)),
+    # --------------------------- 状态操作 ---------------------------
+    Endpoint('setStatus', (_id(), Param('forward'), Param('status'))),
+    Endpoint('getStatus', (_id(),)),
+    Endpoint('getFullSms', (_id(),)),
+    # --------------------------- 价格与国家 ---------------------------
+    Endpoint('getPrices', (Param('service'), _COUNTRY)),
+    Endpoint('getCountries'),
+    # --------------------------- 附加服务 ---------------------------
+    Endpoint('getAdditionalService', (_id(), Param('service'))),
+    Endpoint('getQiwiRequisites'),
+    # --------------------------- 租赁服务 ---------------------------
+    Endpoint('getRentServicesAndCountries', (Param('time'), Param('operator'), _COUNTRY)),
+    Endpoint('getRentNumber', (Param('service'), Param('time'), Param('operator'), _COUNTRY, Param('url'))),
+    Endpoint('getRentStatus', (_id(),)),
+    Endpoint('setRentStatus', (_id(), Param('status'))),
+    Endpoint('getRentList'),
+    Endpoint('continueRentNumber', (_id(), Param('time', 'rent_time'))),
+    Endpoint('getContinueRentPriceNumber', (_id(),)),
+    # --------------------------- 高级功能 ---------------------------
+    Endpoint('getTopCountriesByService', (Param('service'), Param('freePrice'))),
+    Endpoint('getIncomingCallStatus', (_id('activationId'),)),
+    Endpoint('getOperators', (_COUNTRY,)),
+    Endpoint('getActiveActivations'),
+    Endpoint('createTaskForCall', (Param('activationId', send=ALWAYS, annotation='int'),)),
+    Endpoint('getOutgoingCalls', (Param('activationId', send=NOT_NONE, annotation='Optional[int]'),
+                                  Param('date', send=NOT_NONE))),
+)
+
+ACTIONS = frozenset(endpoint.action for endpoint in ENDPOINTS)
+
+# 生成方法的三种形式：
+#   sync     -> return self._request(action, params)
+#   async    -> return await self._request(action, params)
+#   blocking -> return self.run(self.api.<action>(<参数原样转发>))
+STYLES = ('sync', 'async', 'blocking')
+
+MODULE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'endpoint_methods.py')
+
+# 每种形式的混入类，以及子类必须实现的方法
+_MIXINS = (
+    ('sync', 'SyncEndpoints', 'requests client (``SMSActivateAPI``)', [
+        '    def _request(self, action: str, params: Dict[str, Any]) -> Any:',
+        '        raise NotImplementedError',
+    ]),
+    ('async', 'AsyncEndpoints', 'aiohttp client (``AsyncSMSActivateAPI``)', [
+        '    async def _request(self, action: str, params: Dict[str, Any]) -> Any:',
+        '        raise NotImplementedError',
+    ]),
+    ('blocking', 'BlockingEndpoints', 'blocking facade (``BlockingSMSActivateAPI``)', [
+        '    api: Any',
+        '',
+        '    def run(self, awaitable: Coroutine[Any, Any, Any]) -> Any:',
+        '        raise NotImplementedError',
+    ]),
+)
+
+
+def _wrap(head: str, arguments: List[str], tail: str, width: int = 116) -> List[str]:
+    # 按 120 列折行（生成的方法缩进 4 列），续行与左括号对齐
+    lines = [head]
+    for i, argument in enumerate(arguments):
+        text = argument + (tail if i == len(arguments) - 1 else ',')
+        if lines[-1] != head and len(lines[-1]) + 1 + len(text) > width:
+            lines.append(' ' * len(head) + text)
+        else:
+            lines[-1] += ('' if lines[-1] == head else ' ') + text
+    return lines
+
+
+def _source(endpoint: Endpoint, style: str) -> List[str]:
+    arguments = ['self']
+    for param in endpoint.params:
+        default = '' if param.send == ALWAYS else ' = None'
+        arguments.append('%s: %s%s' % (param.name, param.annotation, default))
+    lines = _wrap('%sdef %s(' % ('async ' if style == 'async' else '', endpoint.action), arguments, ') -> Any:')
+    if style == 'blocking':
+        forwarded = ['%s=%s' % (param.name, param.name) for param in endpoint.params]
+        return lines + _wrap('    return self.run(self.api.%s(' % endpoint.action, forwarded or [''], '))')
+    lines.append('    params: Dict[str, Any] = {%r: %r}' % ('action', endpoint.action))
+    for param in endpoint.params:
+        assign = 'params[%r] = %s' % (param.wire or param.name, param.name)
+        if param.send == ALWAYS:
+            lines.append('    ' + assign)
+        else:
+            lines.append('    if %s:' % (param.name if param.send == TRUTHY else param.name + ' is not None'))
+            lines.append('        ' + assign)
+    lines.append('    return %sself._request(%r, params)' % ('await ' if style == 'async' else '', endpoint.action))
+    return lines
+
+
+def render() -> str:
+    """Source of ``endpoint_methods.py``."""
+    lines = [
+        '"""Endpoint methods generated from ``endpoints.ENDPOINTS``, do not edit.',
+        '',
+        'Regenerate with ``python -m async_smsactivate.endpoints``.',
+        '"""',
+        'from typing import Any, Coroutine, Dict, Optional',
+    ]
+    for style, name, client, required in _MIXINS:
+        lines += ['', '', 'class %s:' % name, '    """Endpoint methods of the %s."""' % client, '']
+        lines += required
+        for endpoint in ENDPOINTS:
+            lines.append('')
+            lines += ['    ' + line for line in _source(endpoint, style)]
+    return '\n'.join(lines) + '\n'
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    source = render()
+    try:
+        with open(MODULE, encoding='utf-8') as f:
+            current = f.read()
+    except FileNotFoundError:
+        current = None
+    if '--check' in argv:
+        if current != source:
+            print('%s is out of date, run python -m async_smsactivate.endpoints' % MODULE, file=sys.stderr)
+            return 1
+        return 0
+    if current != source:
+        with open(MODULE, 'w', encoding='utf-8') as f:
+            f.write(source)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,307 @@
+import atexit
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, IO, List, Mapping, Optional, Union
+
+from .jsonlib import Loads, get_loads
+from .models import ActivationStatus, Record
+from .parsers import parse_status
+
+# setStatus 结束激活的状态：6 完成、8 取消
+CLOSING_STATUSES = frozenset({'6', '8'})
+# observe() 关心的 action，客户端只对这些调用回调日志
+JOURNALED_ACTIONS = frozenset({'getNumber', 'getNumberV2', 'getMultiServiceNumber', 'setStatus', 'getStatus'})
+# getStatus 返回这些结果时激活已结束
+CLOSED_ERRORS = frozenset({'STATUS_CANCEL', 'NO_ACTIVATION', 'WRONG_ACTIVATION_ID'})
+
+
+class JournalEntry(Record):
+    __slots__ = ('id', 'phone', 'service', 'country', 'purchased_at', 'status', 'codes')
+
+    def __init__(self, id: str, phone: Any = None, service: Optional[str] = None, country: Any = None,
+                 purchased_at: Optional[float] = None, status: Optional[str] = None,
+                 codes: Optional[List[str]] = None):
+        self.id = id
+        self.phone = phone
+        self.service = service
+        self.country = country
+        self.purchased_at = purchased_at
+        self.status = status
+        self.codes = codes if codes is not None else []
+
+
+class ActivationJournal:
+    """Append-only JSON-lines log of purchases, status changes and codes.
+
+    Every event is one line (``{"op": "buy" | "status" | "code" | "end", "id": ..., ...}``). ``entries``
+    is updated at once; the lines are appended, flushed (and fsynced with ``fsync=True``) in batches
+    by a daemon writer thread, so the event loop never waits for the disk. ``flush()`` waits for the
+    pending lines, ``close()`` writes them, stops the thread and closes the file (an unclosed journal
+    is closed at interpreter exit); a torn last line is skipped on replay. Opening
+    the journal replays it into ``entries`` - the activations that were still open. When the log holds
+    ``compact_ratio`` times more lines than open activations (and at least ``compact_min_lines``), the
+    writer thread rewrites it with one line per open activation. A failed write is kept in ``last_error``.
+
+        journal = ActivationJournal("activations.jsonl")
+        api = AsyncSMSActivateAPI(api_key, journal=journal)
+        for entry in journal.entries.values():   # after a restart
+            watcher.watch(entry.id)
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], fsync: bool = False, compact_ratio: float = 4.0,
+                 compact_min_lines: int = 10000, json_backend: Union[str, Loads, None] = "auto",
+                 clock=time.time):
+        self.path = os.fspath(path)
+        self.fsync = fsync
+        self.compact_ratio = compact_ratio
+        self.compact_min_lines = compact_min_lines
+        self.clock = clock
+        self.loads = get_loads(json_backend)
+        self.entries: Dict[str, JournalEntry] = {}
+        # 最近一次写入失败的异常（写入在后台线程中进行）
+        self.last_error: Optional[BaseException] = None
+        self._lines = 0
+        self._lock = threading.Lock()
+        # 写入线程处理完所有待写内容时通知 flush()
+        self._idle = threading.Condition(self._lock)
+        # 有新内容待写或需要停止时通知写入线程
+        self._wakeup = threading.Condition(self._lock)
+        # 等待写入线程追加的行
+        self._pending: List[str] = []
+        self._compact_requested = False
+        # 写入线程正在锁外写文件
+        self._busy = False
+        self._stopping = False
+        self._writer: Optional[threading.Thread] = None
+        self._file: Optional[IO[str]] = None
+        self.replay()
+        with self._lock:
+            self._start()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, id: Any) -> bool:
+        return str(id) in self.entries
+
+    def purchased_at(self) -> Dict[str, float]:
+        """``{id: purchase time}`` of the open activations, e.g. for ``setStatusBatch(purchased_at=...)``."""
+        return {id: entry.purchased_at for id, entry in self.entries.items() if entry.purchased_at is not None}
+
+    # --------------------------- 写入 ---------------------------
+    def purchased(self, id: Any, phone: Any = None, service: Optional[str] = None, country: Any = None) -> None:
+        self._write({"op": "buy", "id": str(id), "phone": phone, "service": service, "country": country,
+                     "t": self.clock()})
+
+    def status(self, id: Any, status: Any) -> None:
+        status = str(status)
+        self._write({"op": "end" if status in CLOSING_STATUSES else "status", "id": str(id), "status": status,
+                     "t": self.clock()})
+
+    def code(self, id: Any, code: str) -> None:
+        entry = self.entries.get(str(id))
+        if entry is not None and entry.codes and entry.codes[-1] == code:
+            return
+        self._write({"op": "code", "id": str(id), "code": code, "t": self.clock()})
+
+    def closed(self, id: Any, status: Optional[str] = None) -> None:
+        if str(id) in self.entries:
+            self._write({"op": "end", "id": str(id), "status": status, "t": self.clock()})
+
+    def observe(self, action: str, params: Mapping[str, Any], result: Any) -> None:
+        """Record what a client call changed; called by ``AsyncSMSActivateAPI`` after each tracked action."""
+        if isinstance(result, dict) and 'error' in result:
+            if action == 'getStatus' and result['error'] in CLOSED_ERRORS:
+                self.closed(params.get('id'), result['error'])
+            return
+        if action == 'getNumber' and isinstance(result, Mapping) and 'activation_id' in result:
+            self.purchased(result['activation_id'], result.get('phone'), params.get('service'), params.get('country'))
+        elif action == 'getNumberV2' and isinstance(result, Mapping) and 'activationId' in result:
+            self.purchased(result['activationId'], result.get('phoneNumber'), params.get('service'),
+                           result.get('countryCode', params.get('country')))
+        elif action == 'getMultiServiceNumber' and isinstance(result, list):
+            for item in result:
+                if isinstance(item, Mapping) and 'activation' in item:
+                    self.purchased(item['activation'], item.get('phone'), item.get('service'), params.get('country'))
+        elif action == 'setStatus' and isinstance(result, str) and result.startswith('ACCESS_'):
+            self.status(params.get('id'), params.get('status'))
+        elif action == 'getStatus':
+            if isinstance(result, str):
+                result = parse_status(result)
+            if not isinstance(result, ActivationStatus):
+                return
+            status = result
+            if status.received and status.code is not None:
+                self.code(params.get('id'), status.code)
+            elif status.status == 'STATUS_CANCEL':
+                self.closed(params.get('id'), status.status)
+
+    # --------------------------- 回放与压缩 ---------------------------
+    def replay(self) -> Dict[str, JournalEntry]:
+        """Rebuild ``entries`` from the file; returns the open activations."""
+        self.flush()
+        with self._lock:
+            self.entries = {}
+            self._lines = 0
+            try:
+                with open(self.path, 'rb') as f:
+                    data = f.read()
+            except FileNotFoundError:
+                data = b''
+            end = data.rfind(b'\n') + 1
+            if end < len(data):
+                # 截掉崩溃时写了一半的最后一行，之后的追加从新行开始
+                os.truncate(self.path, end)
+                data = data[:end]
+            for line in data.splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    record = self.loads(line)
+                except ValueError:
+                    continue
+                self._lines += 1
+                self._apply(record)
+            return self.entries
+
+    def compact(self) -> None:
+        """Rewrite the file with one ``buy`` line per open activation."""
+        with self._lock:
+            self._compact_requested = True
+            self._wake()
+        self.flush()
+
+    def flush(self) -> None:
+        """Block until every event recorded so far is written."""
+        with self._idle:
+            while self._writer is not None and (self._pending or self._compact_requested or self._busy):
+                self._idle.wait()
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            writer = self._writer
+            self._stopping = True
+            self._wakeup.notify()
+        if writer is not None:
+            writer.join()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        atexit.unregister(self.close)
+
+    def __enter__(self) -> "ActivationJournal":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _snapshot(self, entry: JournalEntry) -> Dict[str, Any]:
+        record = {"op": "buy", "id": entry.id, "phone": entry.phone, "service": entry.service,
+                  "country": entry.country, "t": entry.purchased_at}
+        if entry.status is not None:
+            record["status"] = entry.status
+        if entry.codes:
+            record["codes"] = list(entry.codes)
+        return record
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        line = self._dumps(record)
+        with self._lock:
+            self._pending.append(line)
+            self._lines += 1
+            self._apply(record)
+            self._wake()
+
+    def _start(self) -> None:
+        # 调用时持有 _lock；同一时间只有一个常驻写入线程
+        self._stopping = False
+        self._writer = threading.Thread(target=self._drain, name='ActivationJournal writer', daemon=True)
+        self._writer.start()
+        # 守护线程随解释器退出而终止，退出前写完剩余的行
+        atexit.register(self.close)
+
+    def _wake(self) -> None:
+        # 调用时持有 _lock；close() 之后再写入时重新启动写入线程
+        if self._writer is None:
+            self._start()
+        else:
+            self._wakeup.notify()
+
+    def _drain(self) -> None:
+        while True:
+            snapshot = None
+            with self._lock:
+                while not self._pending and not self._compact_requested:
+                    self._busy = False
+                    self._idle.notify_all()
+                    if self._stopping:
+                        self._writer = None
+                        return
+                    self._wakeup.wait()
+                self._busy = True
+                lines, self._pending = self._pending, []
+                if self._compact_requested or (self._lines >= self.compact_min_lines
+                                               and self._lines > self.compact_ratio * len(self.entries)):
+                    # entries 已包含尚未写入的行，压缩后的文件直接取代它们
+                    snapshot = [self._snapshot(entry) for entry in self.entries.values()]
+                    self._compact_requested = False
+                    self._lines = len(snapshot)
+            try:
+                if snapshot is None:
+                    self._append(lines)
+                else:
+                    try:
+                        self._rewrite(snapshot)
+                    except Exception:
+                        # 压缩失败时旧文件保持不变，照常追加这批行；行数已重新计数，之后再尝试压缩
+                        if lines:
+                            self._append(lines)
+                        raise
+            except Exception as e:
+                self.last_error = e
+
+    def _append(self, lines: List[str]) -> None:
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write(''.join(lines))
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def _rewrite(self, snapshot: List[Dict[str, Any]]) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(''.join(self._dumps(record) for record in snapshot))
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        # 原子替换，压缩中途崩溃时旧文件仍然完整
+        os.replace(tmp, self.path)
+
+    @staticmethod
+    def _dumps(record: Dict[str, Any]) -> str:
+        return json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+    def _apply(self, record: Mapping[str, Any]) -> None:
+        op = record.get('op')
+        id: Any = record.get('id')
+        if op == 'buy':
+            self.entries[id] = JournalEntry(id, record.get('phone'), record.get('service'), record.get('country'),
+                                            record.get('t'), record.get('status'), list(record.get('codes') or ()))
+            return
+        entry = self.entries.get(id)
+        if op == 'end':
+            self.entries.pop(id, None)
+        elif entry is None:
+            return
+        elif op == 'status':
+            entry.status = record.get('status')
+        elif op == 'code':
+            entry.codes.append(record['code'])
@@ -0,0 +1,51 @@
+import json
+from typing import Any, Callable, Optional, Union
+
+Loads = Callable[[Union[str, bytes]], Any]
+
+
+def _orjson() -> Loads:
+    import orjson
+    return orjson.loads
+
+
+def _msgspec() -> Loads:
+    import msgspec
+    return msgspec.json.decode
+
+
+def _ujson() -> Loads:
+    import ujson
+    return ujson.loads
+
+
+def _stdlib() -> Loads:
+    return json.loads
+
+
+BACKENDS = {
+    "orjson": _orjson,
+    "msgspec": _msgspec,
+    "ujson": _ujson,
+    "json": _stdlib,
+}
+
+# json_backend="auto" 时的尝试顺序，全部未安装时回退到标准库
+AUTO_ORDER = ("orjson", "msgspec", "ujson", "json")
+
+
+def get_loads(backend: Optional[Union[str, Loads]] = "auto") -> Loads:
+    """Resolve a backend name (or a custom ``loads`` callable) to a function accepting str or bytes."""
+    if backend is None:
+        backend = "auto"
+    if callable(backend):
+        return backend
+    if backend == "auto":
+        for name in AUTO_ORDER:
+            try:
+                return BACKENDS[name]()
+            except ImportError:
+                continue
+    if backend not in BACKENDS:
+        raise ValueError("Unknown json backend %r, expected one of %s" % (backend, ", ".join(BACKENDS)))
+    return BACKENDS[backend]()
@@ -0,0 +1,163 @@
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from .retry import classify
+
+# 延迟直方图的桶上限（秒）
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def error_code(status: Optional[int], body: bytes) -> Optional[str]:
+    """Error label for a response: an ``ERRORS`` key, ``HTTP_<status>``, ``EMPTY_BODY`` or None."""
+    if status is not None and not 200 <= status < 300:
+        return 'HTTP_%d' % status
+    if classify(body) is None:
+        return None
+    return body.strip().decode('utf-8', 'replace') or 'EMPTY_BODY'
+
+
+class MetricsSink:
+    """Receives one ``request_started`` / ``request_finished`` pair per HTTP attempt.
+
+    ``error`` is an ``ERRORS`` key, ``HTTP_<status>``, ``EMPTY_BODY``, an exception class name for
+    network failures, or None for a normal answer.
+    """
+
+    def request_started(self, action: str) -> None:
+        pass
+
+    def request_finished(self, action: str, latency: float, status: Optional[int], error: Optional[str],
+                         received: int) -> None:
+        pass
+
+
+class InMemoryMetrics(MetricsSink):
+    """Thread-safe counters and latency histograms kept in process, e.g. for a /stats endpoint."""
+
+    def __init__(self, buckets: Iterable[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.requests: Dict[str, int] = defaultdict(int)
+        self.errors: Dict[Tuple[str, str], int] = defaultdict(int)
+        self.in_flight: Dict[str, int] = defaultdict(int)
+        self.bytes_received: Dict[str, int] = defaultdict(int)
+        self.latency_sum: Dict[str, float] = defaultdict(float)
+        self.latency_buckets: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    def request_started(self, action: str) -> None:
+        with self._lock:
+            self.in_flight[action] += 1
+
+    def request_finished(self, action: str, latency: float, status: Optional[int], error: Optional[str],
+                         received: int) -> None:
+        with self._lock:
+            self.in_flight[action] -= 1
+            self.requests[action] += 1
+            self.bytes_received[action] += received
+            self.latency_sum[action] += latency
+            counts = self.latency_buckets.get(action)
+            if counts is None:
+                counts = self.latency_buckets[action] = [0] * (len(self.buckets) + 1)
+            counts[bisect_left(self.buckets, latency)] += 1
+            if error is not None:
+                self.errors[(action, error)] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'requests': dict(self.requests),
+                'errors': dict(self.errors),
+                'in_flight': dict(self.in_flight),
+                'bytes_received': dict(self.bytes_received),
+                'latency_sum': dict(self.latency_sum),
+                'latency_buckets': {action: list(counts) for action, counts in self.latency_buckets.items()},
+            }
+
+
+class CallbackSink(MetricsSink):
+    def __init__(self, on_finished: Callable[..., None], on_started: Optional[Callable[[str], None]] = None):
+        self.on_finished = on_finished
+        self.on_started = on_started
+
+    def request_started(self, action: str) -> None:
+        if self.on_started is not None:
+            self.on_started(action)
+
+    def request_finished(self, action: str, latency: float, status: Optional[int], error: Optional[str],
+                         received: int) -> None:
+        self.on_finished(action, latency, status, error, received)
+
+
+class PrometheusSink(MetricsSink):
+    """Export to ``prometheus_client`` (optional dependency)."""
+
+    def __init__(self, registry: Any = None, namespace: str = 'smsactivate',
+                 buckets: Iterable[float] = LATENCY_BUCKETS):
+        from prometheus_client import REGISTRY, Counter, Gauge, Histogram
+
+        registry = registry if registry is not None else REGISTRY
+        self.requests = Counter('requests', 'Requests sent, by action', ['action'],
+                                namespace=namespace, registry=registry)
+        self.errors = Counter('errors', 'Error responses, by action and error code', ['action', 'error'],
+                              namespace=namespace, registry=registry)
+        self.latency = Histogram('request_latency_seconds', 'Request latency, by action', ['action'],
+                                 namespace=namespace, registry=registry, buckets=tuple(buckets))
+        self.in_flight = Gauge('requests_in_flight', 'Requests in flight, by action', ['action'],
+                               namespace=namespace, registry=registry)
+        self.received = Counter('received_bytes', 'Response bytes received, by action', ['action'],
+                                namespace=namespace, registry=registry)
+
+    def request_started(self, action: str) -> None:
+        self.in_flight.labels(action).inc()
+
+    def request_finished(self, action: str, latency: float, status: Optional[int], error: Optional[str],
+                         received: int) -> None:
+        self.in_flight.labels(action).dec()
+        self.requests.labels(action).inc()
+        self.latency.labels(action).observe(latency)
+        self.received.labels(action).inc(received)
+        if error is not None:
+            self.errors.labels(action, error).inc()
+
+
+class OpenTelemetrySink(MetricsSink):
+    """Export to the OpenTelemetry metrics API (optional dependency)."""
+
+    def __init__(self, meter: Any = None, prefix: str = 'smsactivate'):
+        if meter is None:
+            from opentelemetry import metrics
+            meter = metrics.get_meter('async_smsactivate')
+        self.requests = meter.create_counter(prefix + '.requests', description='Requests sent')
+        self.errors = meter.create_counter(prefix + '.errors', description='Error responses')
+        self.latency = meter.create_histogram(prefix + '.request.duration', unit='s', description='Request latency')
+        self.in_flight = meter.create_up_down_counter(prefix + '.requests.in_flight', description='Requests in flight')
+        self.received = meter.create_counter(prefix + '.received', unit='By', description='Response bytes received')
+
+    def request_started(self, action: str) -> None:
+        self.in_flight.add(1, {'action': action})
+
+    def request_finished(self, action: str, latency: float, status: Optional[int], error: Optional[str],
+                         received: int) -> None:
+        attributes = {'action': action}
+        self.in_flight.add(-1, attributes)
+        self.requests.add(1, attributes)
+        self.latency.record(latency, attributes)
+        self.received.add(received, attributes)
+        if error is not None:
+            self.errors.add(1, {'action': action, 'error': error})
+
+
+class MultiSink(MetricsSink):
+    def __init__(self, *sinks: MetricsSink):
+        self.sinks = sinks
+
+    def request_started(self, action: str) -> None:
+        for sink in self.sinks:
+            sink.request_started(action)
+
+    def request_finished(self, action: str, latency: float, status: Optional[int], error: Optional[str],
+                         received: int) -> None:
+        for sink in self.sinks:
+            sink.request_finished(action, latency, status, error, received)
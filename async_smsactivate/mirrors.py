@@ -0,0 +1,112 @@
+import random
+import threading
+import time
+from typing import Any, Callable, Collection, Dict, Iterable, List, Optional, Union
+from urllib.parse import urlsplit
+
+from .retry import RetryPolicy
+
+# 未设置 retry_policy 时，用默认策略判断失败后能否换镜像重发（扣费接口只在确定未执行时换）
+FAILOVER_POLICY = RetryPolicy()
+
+
+class Mirror:
+    """Latency and error-rate EWMAs of one base URL."""
+
+    __slots__ = ('url', 'host', 'latency', 'error_rate', 'down_until', 'requests', 'failures')
+
+    def __init__(self, url: str):
+        self.url = url
+        self.host = urlsplit(url).netloc
+        # None 表示还没有成功的请求，这样的镜像优先尝试
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.down_until = 0.0
+        self.requests = 0
+        self.failures = 0
+
+    def score(self) -> float:
+        # 期望的成功耗时：latency / 成功率；没有成功过的镜像，未失败过时优先尝试，失败过时排在最后
+        if self.latency is None:
+            return float('inf') if self.failures else 0.0
+        return self.latency / max(1.0 - self.error_rate, 0.05)
+
+
+class MirrorSelector:
+    """Route requests to the fastest healthy of several ``handler_api.php`` mirrors.
+
+    Every request updates an exponentially weighted moving average (weight ``alpha``) of the mirror's
+    latency and error rate. Requests go to the mirror with the lowest ``latency / (1 - error_rate)``;
+    with probability ``explore`` another healthy mirror is picked so its numbers stay current. A
+    mirror whose error rate reaches ``error_threshold`` is skipped for ``cooldown`` seconds. Share one
+    instance between clients to share the measurements.
+
+        mirrors = MirrorSelector([API_URL, "https://mirror.example/stubs/handler_api.php"])
+        api = AsyncSMSActivateAPI(api_key, api_urls=mirrors)
+    """
+
+    def __init__(self, urls: Iterable[str], alpha: float = 0.2, error_threshold: float = 0.5,
+                 cooldown: float = 30.0, explore: float = 0.05, clock: Callable[[], float] = time.monotonic,
+                 rand: Callable[[], float] = random.random):
+        self.mirrors: Dict[str, Mirror] = {url: Mirror(url) for url in urls}
+        if not self.mirrors:
+            raise ValueError("at least one url is required")
+        self.alpha = alpha
+        self.error_threshold = error_threshold
+        self.cooldown = cooldown
+        self.explore = explore
+        self.clock = clock
+        self.rand = rand
+        self._lock = threading.Lock()
+
+    @classmethod
+    def coerce(cls, value: Union["MirrorSelector", Iterable[str]]) -> "MirrorSelector":
+        return value if isinstance(value, MirrorSelector) else cls(value)
+
+    def __len__(self) -> int:
+        return len(self.mirrors)
+
+    @property
+    def urls(self) -> List[str]:
+        return list(self.mirrors)
+
+    def host(self, url: str) -> str:
+        return self.mirrors[url].host
+
+    def choose(self, exclude: Collection[str] = ()) -> Optional[str]:
+        """The URL for the next attempt, or None when every mirror is in ``exclude``."""
+        now = self.clock()
+        with self._lock:
+            candidates = [mirror for url, mirror in self.mirrors.items() if url not in exclude]
+            if not candidates:
+                return None
+            healthy = [mirror for mirror in candidates if mirror.down_until <= now]
+            if not healthy:
+                # 全部不可用时选最早恢复的，而不是直接失败
+                return min(candidates, key=lambda mirror: mirror.down_until).url
+            if len(healthy) > 1 and self.explore and self.rand() < self.explore:
+                return healthy[int(self.rand() * len(healthy)) % len(healthy)].url
+            return min(healthy, key=Mirror.score).url
+
+    def record(self, url: str, latency: float, failed: bool) -> None:
+        alpha = self.alpha
+        with self._lock:
+            mirror = self.mirrors[url]
+            mirror.requests += 1
+            mirror.error_rate += alpha * ((1.0 if failed else 0.0) - mirror.error_rate)
+            if failed:
+                mirror.failures += 1
+                if mirror.error_rate >= self.error_threshold:
+                    mirror.down_until = self.clock() + self.cooldown
+            else:
+                # 失败请求的耗时（连接被拒绝、超时）不代表镜像的速度，只统计成功的请求
+                mirror.latency = latency if mirror.latency is None else mirror.latency + alpha * (latency - mirror.latency)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per URL: latency EWMA, error-rate EWMA, whether it is in cooldown, request and failure counts."""
+        now = self.clock()
+        with self._lock:
+            return {url: {'latency': mirror.latency, 'error_rate': mirror.error_rate,
+                          'healthy': mirror.down_until <= now, 'requests': mirror.requests,
+                          'failures': mirror.failures}
+                    for url, mirror in self.mirrors.items()}
@@ -0,0 +1,440 @@
+"""Local stand-in for ``handler_api.php`` used by the benchmarks and for load-testing integrations.
+
+    with MockSMSActivateServer(latency=0.02, error_rate=0.01) as server:
+        api = SMSActivateAPI("test", api_url=server.url)
+
+or from a shell: ``python -m async_smsactivate.mock_server --port 8080 --latency 0.02``.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
+from urllib.parse import parse_qsl
+
+_REASONS = {200: b'OK', 400: b'Bad Request', 404: b'Not Found', 405: b'Method Not Allowed',
+            500: b'Internal Server Error', 502: b'Bad Gateway', 503: b'Service Unavailable'}
+
+
+class MockSMSActivateServer:
+    """Asyncio HTTP/1.1 keep-alive server implementing the sms-activate handler actions.
+
+    ``latency`` (+ uniform ``jitter``) delays every answer, ``error_rate`` answers with one of
+    ``errors`` instead of the real result, ``http_error_rate`` answers HTTP 503. Activations receive
+    a code ``code_delay`` seconds after purchase. ``countries`` x ``services`` sizes the
+    ``getPrices`` payload (the defaults give a few MB, close to the real unfiltered response).
+    Purchases in the countries listed in ``sold_out`` answer ``NO_NUMBERS``.
+    """
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, api_key: Optional[str] = None,
+                 latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 errors: Iterable[str] = ('NO_CONNECTION',), http_error_rate: float = 0.0,
+                 code_delay: float = 0.0, countries: int = 200, services: int = 700, balance: float = 1000000.0,
+                 seed: Optional[int] = None):
+        self.host = host
+        self.port = port
+        self.api_key = api_key
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.errors = tuple(errors)
+        self.http_error_rate = http_error_rate
+        self.code_delay = code_delay
+        self.countries = countries
+        self.services = services
+        self.balance = balance
+        self.requests = 0
+        # 没有号码可售的国家（字符串形式的国家编号）
+        self.sold_out: Set[str] = set()
+        self.random = random.Random(seed)
+        self.activations: Dict[int, Dict[str, Any]] = {}
+        self.rents: Dict[int, Dict[str, Any]] = {}
+        self._ids = itertools.count(100000000)
+        self._prices: Optional[bytes] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._writers: Set[asyncio.StreamWriter] = set()
+        # 连接处理协程，停止时取消并等待结束
+        self._tasks: Set[asyncio.Task] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._handlers: Dict[str, Callable[[Dict[str, str]], Any]] = {
+            name[7:]: getattr(self, name) for name in dir(self) if name.startswith('action_')
+        }
+
+    @property
+    def url(self) -> str:
+        return 'http://%s:%d/stubs/handler_api.php' % (self.host, self.port)
+
+    # --------------------------- 生命周期 ---------------------------
+    async def start_async(self) -> str:
+        self._server = await asyncio.start_server(self._serve, self.host, self.port, backlog=4096)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self.url
+
+    async def stop_async(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            tasks = list(self._tasks)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for writer in list(self._writers):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def start(self) -> str:
+        """Serve from a background thread with its own event loop."""
+        ready = threading.Event()
+
+        def run() -> None:
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(self.start_async())
+            ready.set()
+            self._loop.run_forever()
+            self._loop.run_until_complete(self.stop_async())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name='mock-sms-activate', daemon=True)
+        self._thread.start()
+        ready.wait()
+        return self.url
+
+    def stop(self) -> None:
+        if self._loop is not None and self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop = self._thread = None
+
+    def __enter__(self) -> "MockSMSActivateServer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    async def __aenter__(self) -> "MockSMSActivateServer":
+        await self.start_async()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop_async()
+
+    # --------------------------- HTTP ---------------------------
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        if task is not None:
+            self._tasks.add(task)
+        self._writers.add(writer)
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    return
+                request_line, _, headers = head.decode('latin-1').partition('\r\n')
+                method, _, rest = request_line.partition(' ')
+                target = rest.rpartition(' ')[0]
+                keep_alive = 'connection: close' not in headers.lower()
+                if method != 'GET':
+                    status, body = 405, b''
+                else:
+                    status, body = await self.handle(dict(parse_qsl(target.partition('?')[2])))
+                writer.write(b'HTTP/1.1 %d %s\r\nContent-Type: text/plain; charset=utf-8\r\n'
+                             b'Content-Length: %d\r\n%s\r\n' % (
+                                 status, _REASONS.get(status, b''), len(body),
+                                 b'' if keep_alive else b'Connection: close\r\n') + body)
+                await writer.drain()
+                if not keep_alive:
+                    return
+        except asyncio.CancelledError:
+            # stop_async() 取消：连接随之关闭，正常结束处理协程
+            pass
+        finally:
+            self._tasks.discard(task)
+            self._writers.discard(writer)
+            writer.close()
+
+    async def handle(self, params: Dict[str, str]) -> Tuple[int, bytes]:
+        self.requests += 1
+        delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+        if self.http_error_rate and self.random.random() < self.http_error_rate:
+            return 503, b'<html>503 Service Unavailable</html>'
+        if self.error_rate and self.random.random() < self.error_rate:
+            return 200, self.random.choice(self.errors).encode()
+        if self.api_key is not None and params.get('api_key') != self.api_key:
+            return 200, b'BAD_KEY' if params.get('api_key') else b'NO_KEY'
+        handler = self._handlers.get(params.get('action', ''))
+        if handler is None:
+            return 200, b'BAD_ACTION'
+        result = handler(params)
+        if isinstance(result, bytes):
+            return 200, result
+        if isinstance(result, str):
+            return 200, result.encode()
+        return 200, json.dumps(result).encode()
+
+    # --------------------------- 数据 ---------------------------
+    def _service(self, index: int) -> str:
+        return 'vk' if index == 0 else 's%d' % index
+
+    def prices_payload(self) -> bytes:
+        if self._prices is None:
+            rnd = random.Random(1)
+            self._prices = json.dumps({
+                str(country): {self._service(service): {"cost": round(rnd.uniform(1, 100), 2),
+                                                        "count": rnd.randint(0, 5000)}
+                               for service in range(self.services)}
+                for country in range(self.countries)
+            }).encode()
+        return self._prices
+
+    def _activation(self, id: Any) -> Optional[Dict[str, Any]]:
+        try:
+            return self.activations.get(int(id))
+        except (TypeError, ValueError):
+            return None
+
+    def _code(self, activation: Dict[str, Any]) -> Optional[str]:
+        if activation['status'] in ('8', '6'):
+            return None
+        if time.monotonic() - activation['created'] < self.code_delay:
+            return None
+        return activation['code']
+
+    def _buy(self, params: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        cost = 10.0
+        if params.get('maxPrice') and float(params['maxPrice']) < cost:
+            return None
+        if self.balance < cost or str(params.get('country', '0')) in self.sold_out:
+            return None
+        self.balance -= cost
+        id = next(self._ids)
+        activation = self.activations[id] = {
+            'id': id, 'phone': 79000000000 + id % 1000000000, 'service': params.get('service', 'vk'),
+            'country': params.get('country', '0'), 'cost': cost, 'status': '0',
+            'code': str(self.random.randint(100000, 999999)), 'created': time.monotonic(),
+        }
+        return activation
+
+    # --------------------------- actions ---------------------------
+    def action_getBalance(self, params):
+        return 'ACCESS_BALANCE:%.2f' % self.balance
+
+    def action_getBalanceAndCashBack(self, params):
+        return 'ACCESS_BALANCE:%.2f' % self.balance
+
+    def action_getNumber(self, params):
+        if self.balance < 10:
+            return 'NO_BALANCE'
+        activation = self._buy(params)
+        if activation is None:
+            return 'NO_NUMBERS'
+        return 'ACCESS_NUMBER:%d:%d' % (activation['id'], activation['phone'])
+
+    def action_getNumberV2(self, params):
+        if self.balance < 10:
+            return 'NO_BALANCE'
+        activation = self._buy(params)
+        if activation is None:
+            return 'NO_NUMBERS'
+        return {"activationId": activation['id'], "phoneNumber": str(activation['phone']),
+                "activationCost": activation['cost'], "countryCode": activation['country'],
+                "canGetAnotherSms": True, "activationTime": time.strftime('%Y-%m-%d %H:%M:%S'),
+                "activationOperator": params.get('operator', 'any')}
+
+    def action_getMultiServiceNumber(self, params):
+        activation = self._buy(params)
+        if activation is None:
+            return 'NO_NUMBERS'
+        return [{"phone": activation['phone'], "activation": activation['id'], "service": service}
+                for service in params.get('multiService', 'vk').split(',')]
+
+    def action_getStatus(self, params):
+        activation = self._activation(params.get('id'))
+        if activation is None:
+            return 'NO_ACTIVATION'
+        if activation['status'] == '8':
+            return 'STATUS_CANCEL'
+        code = self._code(activation)
+        return 'STATUS_OK:%s' % code if code else 'STATUS_WAIT_CODE'
+
+    def action_setStatus(self, params):
+        activation = self._activation(params.get('id'))
+        if activation is None:
+            return 'NO_ACTIVATION'
+        status = params.get('status')
+        if status == '8':
+            activation['status'] = '8'
+            self.balance += activation['cost']
+            return 'ACCESS_CANCEL'
+        if status == '6':
+            activation['status'] = '6'
+            return 'ACCESS_ACTIVATION'
+        if status == '3':
+            return 'ACCESS_RETRY_GET'
+        if status == '1':
+            return 'ACCESS_READY'
+        return 'BAD_STATUS'
+
+    def action_getFullSms(self, params):
+        activation = self._activation(params.get('id'))
+        if activation is None:
+            return 'NO_ACTIVATION'
+        code = self._code(activation)
+        return 'FULL_SMS:Your code: %s' % code if code else 'STATUS_WAIT_CODE'
+
+    def action_getActiveActivations(self, params):
+        active = [{"activationId": str(a['id']), "serviceCode": a['service'], "phoneNumber": str(a['phone']),
+                   "activationCost": a['cost'], "activationStatus": a['status'],
+                   "smsCode": [self._code(a)] if self._code(a) else None,
+                   "smsText": json.dumps(["Your code: %s" % self._code(a)]) if self._code(a) else None,
+                   "countryCode": a['country']}
+                  for a in self.activations.values() if a['status'] not in ('6', '8')]
+        if not active:
+            return {"status": "error", "error": "NO_ACTIVATIONS"}
+        return {"status": "success", "activeActivations": active}
+
+    def action_getPrices(self, params):
+        if 'service' not in params and 'country' not in params:
+            return self.prices_payload()
+        prices = json.loads(self.prices_payload())
+        if 'country' in params:
+            prices = {params['country']: prices.get(params['country'], {})}
+        if 'service' in params:
+            prices = {country: {params['service']: services[params['service']]}
+                      for country, services in prices.items() if params['service'] in services}
+        return prices
+
+    def action_getNumbersStatus(self, params):
+        return {"%s_0" % self._service(index): str(self.random.randint(0, 5000)) for index in range(self.services)}
+
+    def action_getCountries(self, params):
+        return {str(country): {"id": country, "rus": "Страна %d" % country, "eng": "Country %d" % country,
+                               "chn": "国家 %d" % country, "visible": 1, "retry": 1, "rent": 1, "multiService": 1}
+                for country in range(self.countries)}
+
+    def action_getOperators(self, params):
+        countries = [params['country']] if 'country' in params else [str(c) for c in range(self.countries)]
+        return {"status": "success",
+                "countryOperators": {country: ["any", "mts", "beeline", "megafon", "tele2"] for country in countries}}
+
+    def action_getTopCountriesByService(self, params):
+        return {str(index): {"country": index, "count": self.random.randint(0, 5000),
+                             "price": round(self.random.uniform(1, 100), 2), "retail_price": 100}
+                for index in range(min(self.countries, 50))}
+
+    def action_getRentServicesAndCountries(self, params):
+        return {"countries": {str(c): c for c in range(self.countries)},
+                "operators": {"0": "any", "1": "mts"},
+                "services": {self._service(index): {"cost": 50.0, "quant": 100} for index in range(self.services)}}
+
+    def action_getRentNumber(self, params):
+        if self.balance < 50:
+            return 'NO_BALANCE'
+        self.balance -= 50
+        id = next(self._ids)
+        end = time.time() + 3600 * int(params.get('time', 4))
+        self.rents[id] = {'id': id, 'phone': str(79000000000 + id % 1000000000), 'end': end, 'status': 'active'}
+        return {"status": "success", "phone": {"id": id, "endDate": time.strftime('%Y-%m-%dT%H:%M:%S',
+                                                                                    time.gmtime(end)),
+                                               "number": self.rents[id]['phone']}}
+
+    def _rent(self, params):
+        try:
+            return self.rents.get(int(params.get('id')))
+        except (TypeError, ValueError):
+            return None
+
+    def action_getRentStatus(self, params):
+        rent = self._rent(params)
+        if rent is None:
+            return 'NO_ID_RENT' if 'id' not in params else 'INVALID_PHONE'
+        return {"status": "success", "quantity": "1",
+                "values": {"0": {"phoneFrom": "vk", "text": "Your code: 12345", "service": "vk",
+                                 "date": time.strftime('%Y-%m-%d %H:%M:%S')}}}
+
+    def action_setRentStatus(self, params):
+        rent = self._rent(params)
+        if rent is None:
+            return 'INVALID_PHONE'
+        rent['status'] = 'finish' if params.get('status') == '1' else 'cancel'
+        return {"status": "success"}
+
+    def action_getRentList(self, params):
+        return {"status": "success",
+                "values": {str(index): {"id": str(rent['id']), "phone": rent['phone']}
+                           for index, rent in enumerate(r for r in self.rents.values() if r['status'] == 'active')}}
+
+    def action_continueRentNumber(self, params):
+        rent = self._rent(params)
+        if rent is None:
+            return 'INVALID_PHONE'
+        rent['end'] += 3600 * int(params.get('rent_time', 4))
+        self.balance -= 50
+        return {"status": "success", "phone": {"id": rent['id'], "number": rent['phone'],
+                                               "endDate": time.strftime('%Y-%m-%dT%H:%M:%S',
+                                                                        time.gmtime(rent['end']))}}
+
+    def action_getContinueRentPriceNumber(self, params):
+        if self._rent(params) is None:
+            return 'INVALID_PHONE'
+        return {"status": "success", "price": 50.0}
+
+    def action_getAdditionalService(self, params):
+        activation = self._activation(params.get('id'))
+        if activation is None:
+            return 'WRONG_ACTIVATION_ID'
+        child = self._buy({'service': params.get('service', 'vk'), 'country': activation['country']})
+        if child is None:
+            return 'NO_BALANCE'
+        return 'ADDITIONAL:%d:%d' % (child['id'], activation['phone'])
+
+    def action_getQiwiRequisites(self, params):
+        return {"status": "SUCCESS", "wallet": "79000000000", "comment": "mock", "error": None}
+
+    def action_getIncomingCallStatus(self, params):
+        return {"status": 1, "phone": False}
+
+    def action_createTaskForCall(self, params):
+        return {"status": "success", "msg": "task created"}
+
+    def action_getOutgoingCalls(self, params):
+        return {"status": "success", "data": []}
+
+
+def main(argv: Optional[Iterable[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=0)
+    parser.add_argument('--api-key')
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--http-error-rate', type=float, default=0.0)
+    parser.add_argument('--code-delay', type=float, default=0.0)
+    parser.add_argument('--countries', type=int, default=200)
+    parser.add_argument('--services', type=int, default=700)
+    args = parser.parse_args(list(argv) if argv is not None else None)
+    server = MockSMSActivateServer(host=args.host, port=args.port, api_key=args.api_key, latency=args.latency,
+                                   jitter=args.jitter, error_rate=args.error_rate,
+                                   http_error_rate=args.http_error_rate, code_delay=args.code_delay,
+                                   countries=args.countries, services=args.services)
+
+    async def serve() -> None:
+        print(await server.start_async(), flush=True)
+        await asyncio.Event().wait()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
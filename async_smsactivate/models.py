@@ -0,0 +1,220 @@
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+class Record(Mapping):
+    """Slotted result object with a read-only dict view over its fields.
+
+    Subclasses declare ``__slots__`` with the same names as the wire keys, so ``record["phone"]``,
+    ``record.get("phone")``, ``dict(record)`` and ``record == {...}`` keep working for code written
+    against the plain dict results. Nested values may be Records or tuples, so use ``to_dict()``
+    (or ``to_plain()`` for containers of Records) before ``json.dumps``.
+    """
+    __slots__: Tuple[str, ...] = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__slots__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain JSON-safe copy: nested Records become dicts and tuples become lists."""
+        return {name: to_plain(getattr(self, name)) for name in self.__slots__}
+
+    def __repr__(self) -> str:
+        fields = ", ".join("%s=%r" % (name, getattr(self, name)) for name in self.__slots__)
+        return "%s(%s)" % (type(self).__name__, fields)
+
+
+def to_plain(value: Any) -> Any:
+    """``value`` with every Record (and tuple) inside it converted back to plain dicts (and lists)."""
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {key: to_plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_plain(item) for item in value]
+    return value
+
+
+class Activation(Record):
+    __slots__ = ('activation_id', 'phone')
+
+    def __init__(self, activation_id: int, phone: int):
+        self.activation_id = activation_id
+        self.phone = phone
+
+
+class ActivationStatus(Record):
+    __slots__ = ('status', 'code', 'message')
+
+    def __init__(self, status: str, code: Optional[str] = None, message: Optional[str] = None):
+        self.status = status
+        self.code = code
+        self.message = message
+
+    @property
+    def received(self) -> bool:
+        return self.status == 'STATUS_OK'
+
+
+class ActivationV2(Record):
+    __slots__ = ('activationId', 'phoneNumber', 'activationCost', 'countryCode', 'canGetAnotherSms',
+                 'activationTime', 'activationOperator')
+
+    def __init__(self, activationId: Any, phoneNumber: Any, activationCost: Any = None, countryCode: Any = None,
+                 canGetAnotherSms: Any = None, activationTime: Any = None, activationOperator: Any = None):
+        self.activationId = activationId
+        self.phoneNumber = phoneNumber
+        self.activationCost = activationCost
+        self.countryCode = countryCode
+        self.canGetAnotherSms = canGetAnotherSms
+        self.activationTime = activationTime
+        self.activationOperator = activationOperator
+
+    @classmethod
+    def from_wire(cls, data: Dict[str, Any]) -> "ActivationV2":
+        return cls(data.get('activationId'), data.get('phoneNumber'), data.get('activationCost'),
+                   data.get('countryCode'), data.get('canGetAnotherSms'), data.get('activationTime'),
+                   data.get('activationOperator'))
+
+
+class RentPhone(Record):
+    __slots__ = ('id', 'endDate', 'number')
+
+    def __init__(self, id: Any, endDate: Any, number: Any):
+        self.id = id
+        self.endDate = endDate
+        self.number = number
+
+    @classmethod
+    def from_wire(cls, data: Dict[str, Any]) -> "RentPhone":
+        return cls(data.get('id'), data.get('endDate'), data.get('number'))
+
+
+class RentNumber(Record):
+    __slots__ = ('status', 'phone')
+
+    def __init__(self, status: str, phone: RentPhone):
+        self.status = status
+        self.phone = phone
+
+
+class RentRecord(Record):
+    __slots__ = ('id', 'phone')
+
+    def __init__(self, id: Any, phone: Any):
+        self.id = id
+        self.phone = phone
+
+
+class RentList(Record):
+    __slots__ = ('status', 'values')
+
+    def __init__(self, status: str, values: Dict[str, RentRecord]):
+        self.status = status
+        # 与接口字段同名，覆盖了 Mapping.values()；dict 视图只用到 keys() 和 __getitem__
+        self.values = values  # type: ignore[method-assign,assignment]
+
+
+class PriceEntry(Record):
+    __slots__ = ('cost', 'count')
+
+    def __init__(self, cost: Any, count: Any):
+        self.cost = cost
+        self.count = count
+
+
+class PhysicalPriceEntry(Record):
+    __slots__ = ('cost', 'count', 'physicalCount')
+
+    def __init__(self, cost: Any, count: Any, physicalCount: Any):
+        self.cost = cost
+        self.count = count
+        self.physicalCount = physicalCount
+
+
+class OperatorList(Record):
+    __slots__ = ('status', 'countryOperators')
+
+    def __init__(self, status: str, countryOperators: Dict[str, Tuple[str, ...]]):
+        self.status = status
+        self.countryOperators = countryOperators
+
+
+# --------------------------- 解析函数 ---------------------------
+# 签名与 parsers.PARSERS 一致：(response, loads)
+
+def parse_activation(response: str, loads) -> Activation:
+    # ACCESS_NUMBER:$id:$number
+    activation_id, phone = response[14:].split(":", 1)
+    return Activation(int(activation_id), int(phone))
+
+
+def parse_activation_v2(response, loads) -> Any:
+    data = loads(response)
+    if 'activationId' not in data:
+        return data
+    return ActivationV2.from_wire(data)
+
+
+def parse_rent_number(response, loads) -> Any:
+    data = loads(response)
+    phone = data.get('phone')
+    if not isinstance(phone, dict):
+        return data
+    return RentNumber(data.get('status'), RentPhone.from_wire(phone))
+
+
+def parse_rent_list(response, loads) -> Any:
+    data = loads(response)
+    values = data.get('values')
+    if not isinstance(values, dict):
+        return data
+    return RentList(data.get('status'),
+                    {key: RentRecord(item.get('id'), item.get('phone')) for key, item in values.items()})
+
+
+_PRICE_KEYS = frozenset(PriceEntry.__slots__)
+_PHYSICAL_PRICE_KEYS = frozenset(PhysicalPriceEntry.__slots__)
+
+
+def _price_entry(item: Any) -> Any:
+    # 只转换字段完全一致的条目，保证 dict 视图与原始 JSON 相同
+    if isinstance(item, dict):
+        keys = item.keys()
+        if keys == _PRICE_KEYS:
+            return PriceEntry(item['cost'], item['count'])
+        if keys == _PHYSICAL_PRICE_KEYS:
+            return PhysicalPriceEntry(item['cost'], item['count'], item['physicalCount'])
+    return item
+
+
+def parse_prices(response, loads) -> Any:
+    # {country: {service: {"cost": .., "count": ..}}}，最内层的 dict 占了绝大部分内存
+    data = loads(response)
+    for services in data.values():
+        if isinstance(services, dict):
+            for service, item in services.items():
+                services[service] = _price_entry(item)
+    return data
+
+
+def parse_operators(response, loads) -> Any:
+    data = loads(response)
+    operators = data.get('countryOperators')
+    if not isinstance(operators, dict):
+        return data
+    # 运营商名称在各国家之间大量重复：驻留后每个名称只保存一份，列表换成更紧凑的元组
+    return OperatorList(data.get('status'),
+                        {country: tuple(sys.intern(name) if isinstance(name, str) else name for name in names)
+                         if isinstance(names, list) else names
+                         for country, names in operators.items()})
+
@@ -0,0 +1,148 @@
+import json
+from typing import Any, Callable, Dict, Optional, Union
+
+from . import models
+from .jsonlib import Loads
+
+CODES = {
+    'STATUS_WAIT_CODE': 'Waiting for sms',
+    'STATUS_WAIT_RETRY': 'Past Inappropriate Code - Waiting for Code Refinement',
+    'STATUS_WAIT_RESEND ': 'Waiting for re-sending SMS',
+    'STATUS_CANCEL': 'Activation canceled',
+    'STATUS_OK': 'Code received',
+    'FULL_SMS': 'Full text received'
+}
+
+RENT_CODES = {
+    'STATUS_WAIT_CODE': 'Waiting for the first SMS',
+    'STATUS_FINISH': 'Rent paid and completed',
+    'STATUS_CANCEL': 'Rent canceled with a refund',
+}
+
+ERRORS = {
+    'NO_NUMBERS': 'There are no free numbers for receiving SMS from the current service',
+    'NO_BALANCE': 'Not enough funds',
+    'BAD_ACTION': 'Invalid action (action parameter)',
+    'BAD_SERVICE': 'Incorrect service name (service parameter)',
+    'BAD_KEY': 'Invalid API access key',
+    'ERROR_SQL': 'One of the parameters has an invalid value.',
+    'SQL_ERROR': 'One of the parameters has an invalid value.',
+    'NO_ACTIVATION': 'The specified activation id does not exist',
+    'BAD_STATUS': 'Attempt to establish a non-existent status',
+    'STATUS_CANCEL': 'Current activation canceled and no longer available',
+    'BANNED': 'Account is blocked',
+    'NO_CONNECTION': 'No connection to servers sms-activate',
+    'ACCOUNT_INACTIVE': 'No numbers available',
+    'NO_ID_RENT': 'Rent id not specified',
+    'INVALID_PHONE': 'The number was not rented by you (wrong rental id)',
+    'STATUS_FINISH': 'Rent paid and completed',
+    'INCORECT_STATUS': 'Missing or incorrect status',
+    'CANT_CANCEL': 'Unable to cancel the lease (more than 20 minutes have passed)',
+    'ALREADY_FINISH': 'The lease has already been completed',
+    'ALREADY_CANCEL': 'The lease has already been canceled',
+    'WRONG_OPERATOR': 'Lease Transfer Operator is not MTT',
+    'NO_YULA_MAIL': 'To buy a number from the mail group holding, you must have at least 500 rubles on your account',
+    'WHATSAPP_NOT_AVAILABLE': 'No WhatsApp numbers available',
+
+    'NOT_INCOMING': 'Activation is not call-verified activation',
+    'INVALID_ACTIVATION_ID': 'Invalid activation id',
+
+    'WRONG_ADDITIONAL_SERVICE': 'Invalid additional service (only services for forwarding are allowed)',
+    'WRONG_ACTIVATION_ID': 'Invalid parental activation ID',
+    'WRONG_SECURITY': 'An error occurred when trying to transfer an activation ID without forwarding, or a completed / inactive activation',
+    'REPEAT_ADDITIONAL_SERVICE': 'The error occurs when you try to order the purchased service again',
+
+    'NO_KEY': 'API key missing',
+    'OPERATORS_NOT_FOUND': ' Operators not found'
+}
+
+
+def parse_balance(response: str, loads: Loads) -> Dict[str, Any]:
+    # ACCESS_BALANCE:100.00
+    return {"balance": response[15:]}
+
+
+def parse_number(response: str, loads: Loads) -> Dict[str, Any]:
+    # ACCESS_NUMBER:$id:$number
+    activation_id, phone = response[14:].split(":", 1)
+    return {"activation_id": int(activation_id), "phone": int(phone)}
+
+
+def parse_additional_service(response: str, loads: Loads) -> Dict[str, Any]:
+    # ADDITIONAL:$id:$number
+    id, phone = response[11:].split(":", 1)
+    return {"id": int(id), "phone": int(phone)}
+
+
+def parse_status(response: str, loads: Optional[Loads] = None) -> models.ActivationStatus:
+    # STATUS_WAIT_CODE / STATUS_WAIT_RETRY:$lastcode / STATUS_OK:$code / FULL_SMS:$text
+    status, _, code = response.partition(":")
+    return models.ActivationStatus(status, code or None, CODES.get(status))
+
+
+def parse_json(response: Union[str, bytes], loads: Loads) -> Any:
+    return loads(response)
+
+
+def parse_call_task(response: Union[str, bytes], loads: Loads) -> Dict[str, Any]:
+    result = loads(response)
+    if 'msg' in result:
+        result['message'] = result.pop('msg')
+    return result
+
+
+# action -> 解析函数；未登记的 action 原样返回响应文本
+PARSERS: Dict[str, Callable[[Any, Loads], Any]] = {
+    "getBalance": parse_balance,
+    "getBalanceAndCashBack": parse_balance,
+    "getNumber": parse_number,
+    "getAdditionalService": parse_additional_service,
+    "createTaskForCall": parse_call_task,
+}
+for _action in ("getNumbersStatus", "getNumberV2", "getMultiServiceNumber", "getPrices", "getCountries",
+                "getQiwiRequisites", "getRentServicesAndCountries", "getRentNumber", "getRentStatus",
+                "setRentStatus", "getRentList", "continueRentNumber", "getContinueRentPriceNumber",
+                "getTopCountriesByService", "getIncomingCallStatus", "getOperators", "getActiveActivations",
+                "getOutgoingCalls"):
+    PARSERS[_action] = parse_json
+del _action
+
+# typed_results=True 时使用：热点接口解析为 __slots__ 结果对象（见 models.py），其余与 PARSERS 相同
+TYPED_PARSERS: Dict[str, Callable[[Any, Loads], Any]] = dict(
+    PARSERS,
+    getNumber=models.parse_activation,
+    getNumberV2=models.parse_activation_v2,
+    getRentNumber=models.parse_rent_number,
+    getRentList=models.parse_rent_list,
+    getPrices=models.parse_prices,
+    getOperators=models.parse_operators,
+    getStatus=parse_status,
+)
+
+# 返回 JSON 的 action：响应为 bytes 时直接交给 JSON 后端解析，省去一次 str 解码和拷贝
+JSON_ACTIONS = frozenset(action for action, parser in PARSERS.items() if parser in (parse_json, parse_call_task))
+
+
+def http_error(status: int) -> Optional[Dict[str, Any]]:
+    """``{"error": "HTTP_<status>", ...}`` for a non-2xx response (same label as ``metrics.error_code``), else None."""
+    if 200 <= status < 300:
+        return None
+    return {"error": "HTTP_%d" % status, "message": "Server responded with HTTP %d" % status}
+
+
+def parse_response(action: str, response: Union[str, bytes], loads: Loads = json.loads,
+                   parsers: Dict[str, Callable[[Any, Loads], Any]] = PARSERS) -> Any:
+    if isinstance(response, bytes):
+        # 错误码都是纯文本，不会以 { 或 [ 开头
+        if action in JSON_ACTIONS and response[:1] in (b'{', b'['):
+            return parsers[action](response, loads)
+        response = response.decode()
+    message = ERRORS.get(response)
+    if message is not None:
+        return {"error": response, "message": message}
+    if not response:
+        return {"error": response, "message": "Server error, try again"}
+    parser = parsers.get(action)
+    if parser is None:
+        return response
+    return parser(response, loads)
@@ -0,0 +1,21 @@
+import random
+from typing import Callable, Iterator
+
+
+def backoff_schedule(fast_interval: float = 1.0, fast_period: float = 15.0, factor: float = 1.5,
+                     max_interval: float = 10.0, jitter: float = 0.2,
+                     rand: Callable[[], float] = random.random) -> Iterator[float]:
+    """Yield delays between status polls.
+
+    Polls every ``fast_interval`` seconds for the first ``fast_period`` seconds after purchase, when
+    most codes arrive, then backs off exponentially by ``factor`` up to ``max_interval``. Each delay is
+    spread by +/- ``jitter`` so that activations bought together do not poll in lockstep.
+    """
+    elapsed = 0.0
+    delay = fast_interval
+    while True:
+        if elapsed >= fast_period:
+            delay = min(delay * factor, max_interval)
+        spread = delay * (1 + jitter * (2 * rand() - 1))
+        elapsed += spread
+        yield spread
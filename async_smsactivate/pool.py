@@ -0,0 +1,379 @@
+import threading
+import time
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .bulk import PurchaseResult, buy_numbers
+from .endpoints import ACTIONS
+from .mirrors import MirrorSelector
+from .models import Record
+from .parsers import ERRORS
+
+# 与激活 / 租赁 id 绑定的 action：请求发给购买该 id 的账户
+BOUND_ACTIONS = frozenset({
+    'getStatus', 'setStatus', 'getFullSms', 'getAdditionalService', 'getIncomingCallStatus', 'createTaskForCall',
+    'getOutgoingCalls', 'getRentStatus', 'setRentStatus', 'continueRentNumber', 'getContinueRentPriceNumber',
+})
+# 返回新激活 / 租赁 id 的 action：结果中的 id 绑定到购买它的账户
+PURCHASE_ACTIONS = frozenset({'getNumber', 'getNumberV2', 'getMultiServiceNumber', 'getRentNumber',
+                              'getAdditionalService'})
+# 账户无法继续购买：移出轮换，已绑定的 id 仍发给该账户
+DISABLING_ERRORS = frozenset({'NO_BALANCE', 'BANNED', 'BAD_KEY', 'NO_KEY'})
+# 该账户下没有这个 id：换下一个账户查询
+NOT_FOUND_ERRORS = frozenset({'NO_ACTIVATION', 'WRONG_ACTIVATION_ID', 'INVALID_ACTIVATION_ID', 'INVALID_PHONE'})
+# 结束激活 / 租赁的状态，成功后解除绑定：(action, status 的位置参数下标, 状态值)
+_RELEASING = {'setStatus': (2, frozenset({'6', '8'})), 'setRentStatus': (1, frozenset({'1', '2'}))}
+
+STRATEGIES = ('least_in_flight', 'balance')
+
+
+class KeyState(Record):
+    __slots__ = ('api_key', 'in_flight', 'requests', 'balance', 'balance_at', 'disabled')
+
+    def __init__(self, api_key: str):
+        self.api_key = api_key
+        self.in_flight = 0
+        self.requests = 0
+        # 缓存的 getBalance 结果及其时间（time.monotonic）
+        self.balance: Optional[float] = None
+        self.balance_at: Optional[float] = None
+        # 移出轮换的原因（错误码），None 表示可用
+        self.disabled: Optional[str] = None
+
+
+def _bound_id(action: str, args: Tuple[Any, ...], kwargs: Mapping[str, Any]) -> Any:
+    if args:
+        return args[0]
+    return kwargs.get('activationId' if action in ('createTaskForCall', 'getOutgoingCalls') else 'id')
+
+
+def _error_code(result: Any) -> Optional[str]:
+    if isinstance(result, dict):
+        if 'error' in result:
+            return result['error']
+        if result.get('status') == 'error':
+            return result.get('message')
+    return None
+
+
+def _releases(action: str, args: Tuple[Any, ...], kwargs: Mapping[str, Any]) -> bool:
+    releasing = _RELEASING.get(action)
+    if releasing is None:
+        return False
+    index, statuses = releasing
+    return str(args[index] if len(args) > index else kwargs.get('status')) in statuses
+
+
+def _purchased_ids(action: str, result: Any) -> List[Any]:
+    if action not in PURCHASE_ACTIONS:
+        return []
+    if not isinstance(result, Mapping):
+        if action == 'getMultiServiceNumber' and isinstance(result, list):
+            return [item.get('activation') for item in result if isinstance(item, Mapping)]
+        return []
+    for name in ('activation_id', 'activationId', 'id'):
+        if name in result:
+            return [result[name]]
+    phone = result.get('phone')
+    if action == 'getRentNumber' and isinstance(phone, Mapping):
+        return [phone.get('id')]
+    return []
+
+
+class _KeyRouter:
+    def __init__(self, api_keys: Iterable[str], strategy: str, balance_ttl: float,
+                 clock: Callable[[], float]):
+        if strategy not in STRATEGIES:
+            raise ValueError("Unknown routing strategy %r, expected one of %s" % (strategy, ', '.join(STRATEGIES)))
+        self.states: Dict[str, KeyState] = {key: KeyState(key) for key in api_keys}
+        if not self.states:
+            raise ValueError("At least one api key is required")
+        self.strategy = strategy
+        self.balance_ttl = balance_ttl
+        self.clock = clock
+        self._pins: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        if name in ACTIONS:
+            return partial(self._call, name)
+        raise AttributeError("%r object has no attribute %r" % (type(self).__name__, name))
+
+    def key_for(self, id: Any) -> Optional[str]:
+        """The api key an activation / rent id is pinned to."""
+        return self._pins.get(str(id))
+
+    def pin(self, id: Any, api_key: str) -> None:
+        if api_key not in self.states:
+            raise KeyError(api_key)
+        self._pins[str(id)] = api_key
+
+    def unpin(self, id: Any) -> None:
+        self._pins.pop(str(id), None)
+
+    def disable(self, api_key: str, reason: str = 'DISABLED') -> None:
+        self.states[api_key].disabled = reason
+
+    def enable(self, api_key: str) -> None:
+        self.states[api_key].disabled = None
+
+    @property
+    def active_keys(self) -> List[str]:
+        return [key for key, state in self.states.items() if state.disabled is None]
+
+    def _pick(self) -> Optional[KeyState]:
+        with self._lock:
+            candidates = [state for state in self.states.values() if state.disabled is None]
+            if not candidates:
+                return None
+            if self.strategy == 'balance':
+                state = max(candidates, key=lambda state: (state.balance or 0.0, -state.in_flight))
+            else:
+                # 进行中的请求数相同时选择累计请求最少的账户，顺序调用也会轮流使用各个账户
+                state = min(candidates, key=lambda state: (state.in_flight, state.requests))
+            state.in_flight += 1
+            state.requests += 1
+            return state
+
+    def _acquire(self, state: KeyState) -> None:
+        with self._lock:
+            state.in_flight += 1
+            state.requests += 1
+
+    def _release(self, state: KeyState) -> None:
+        with self._lock:
+            state.in_flight -= 1
+
+    def _stale(self) -> List[KeyState]:
+        now = self.clock()
+        return [state for state in self.states.values()
+                if state.disabled in (None, 'NO_BALANCE')
+                and (state.balance_at is None or now - state.balance_at >= self.balance_ttl)]
+
+    def _store_balance(self, state: KeyState, result: Any) -> None:
+        try:
+            state.balance = float(result['balance'])
+        except (KeyError, TypeError, ValueError):
+            self._observe(state, 'getBalance', (), {}, result)
+            return
+        state.balance_at = self.clock()
+        if state.disabled == 'NO_BALANCE' and state.balance > 0:
+            state.disabled = None
+
+    def _exhausted(self) -> Dict[str, Any]:
+        reasons = [state.disabled for state in self.states.values() if state.disabled is not None]
+        code = reasons[0] if reasons and 'NO_BALANCE' not in reasons else 'NO_BALANCE'
+        return {"error": code, "message": ERRORS.get(code, "No api key available")}
+
+    def _bound_order(self, id: Any) -> List[KeyState]:
+        pinned = self._pins.get(str(id))
+        if pinned is not None:
+            return [self.states[pinned]]
+        # 未知 id：先查询可用账户，再查询已移出轮换的账户
+        states = list(self.states.values())
+        return [state for state in states if state.disabled is None] + \
+               [state for state in states if state.disabled is not None]
+
+    def _observe(self, state: KeyState, action: str, args: Tuple[Any, ...], kwargs: Mapping[str, Any],
+                 result: Any) -> None:
+        code = _error_code(result)
+        if code is not None:
+            if code in DISABLING_ERRORS:
+                state.disabled = code
+            return
+        for id in _purchased_ids(action, result):
+            if id is not None:
+                self._pins[str(id)] = state.api_key
+        if _releases(action, args, kwargs):
+            self.unpin(_bound_id(action, args, kwargs))
+
+    def _call(self, action: str, *args: Any, **kwargs: Any) -> Any:
+        raise NotImplementedError
+
+
+def _share_mirrors(client_kwargs: Dict[str, Any]) -> None:
+    # 所有账户共用一个 MirrorSelector，镜像的延迟和错误率合并统计
+    if client_kwargs.get('api_urls') is not None:
+        client_kwargs['api_urls'] = MirrorSelector.coerce(client_kwargs['api_urls'])
+
+
+class SMSActivatePool(_KeyRouter):
+    """Spread ``SMSActivateAPI`` calls over several api keys sharing one ``requests`` connection pool.
+
+    Calls are routed to the key with the fewest requests in flight (``strategy="least_in_flight"``)
+    or the largest cached ``getBalance`` (``strategy="balance"``, refreshed every ``balance_ttl``
+    seconds). A key answering ``NO_BALANCE``, ``BANNED`` or ``BAD_KEY`` leaves the rotation; a
+    ``NO_BALANCE`` key comes back once a balance refresh sees money on it. Ids returned by purchases
+    are pinned to the buying key, so ``getStatus(id)`` / ``setStatus(id, ...)`` always use the right
+    account; an unknown id is looked up on each key in turn.
+
+        with SMSActivatePool(["key1", "key2", "key3"], pool_maxsize=50) as pool:
+            activation = pool.getNumber(service="vk", country="0")
+            status = pool.getStatus(activation["activation_id"])
+    """
+
+    def __init__(self, api_keys: Iterable[str], strategy: str = 'least_in_flight', balance_ttl: float = 60.0,
+                 rate_limiters: Optional[Mapping[str, Any]] = None, clock: Callable[[], float] = time.monotonic,
+                 **client_kwargs: Any):
+        from .sync_api import SMSActivateAPI
+
+        super().__init__(api_keys, strategy, balance_ttl, clock)
+        _share_mirrors(client_kwargs)
+        rate_limiters = rate_limiters or {}
+        self.clients: Dict[str, Any] = {}
+        session = client_kwargs.pop('session', None)
+        for key in self.states:
+            kwargs = dict(client_kwargs)
+            if key in rate_limiters:
+                kwargs['rate_limiter'] = rate_limiters[key]
+            client = SMSActivateAPI(key, session=session, **kwargs)
+            # 第一个客户端创建（或使用传入的）会话，其余客户端复用同一个连接池
+            if session is None:
+                session = client.session
+            self.clients[key] = client
+
+    def client(self, api_key: str) -> Any:
+        return self.clients[api_key]
+
+    def refresh_balances(self) -> None:
+        for state in self._stale():
+            self._store_balance(state, self._invoke(state, 'getBalance', (), {}, acquired=False))
+
+    def _invoke(self, state: KeyState, action: str, args: Tuple[Any, ...], kwargs: Mapping[str, Any],
+                acquired: bool = True) -> Any:
+        if not acquired:
+            self._acquire(state)
+        try:
+            result = getattr(self.clients[state.api_key], action)(*args, **kwargs)
+        finally:
+            self._release(state)
+        self._observe(state, action, args, kwargs, result)
+        return result
+
+    def _call(self, action: str, *args: Any, **kwargs: Any) -> Any:
+        if action in BOUND_ACTIONS:
+            id = _bound_id(action, args, kwargs)
+            if id is not None:
+                result = None
+                for state in self._bound_order(id):
+                    result = self._invoke(state, action, args, kwargs, acquired=False)
+                    if _error_code(result) not in NOT_FOUND_ERRORS:
+                        if not _releases(action, args, kwargs):
+                            self._pins.setdefault(str(id), state.api_key)
+                        break
+                return result
+        if self.strategy == 'balance':
+            self.refresh_balances()
+        picked = self._pick()
+        if picked is None:
+            return self._exhausted()
+        while True:
+            result = self._invoke(picked, action, args, kwargs)
+            # 账户被移出轮换时请求未执行，换下一个账户重发
+            if _error_code(result) not in DISABLING_ERRORS:
+                return result
+            picked = self._pick()
+            if picked is None:
+                return result
+
+    def close(self) -> None:
+        for client in self.clients.values():
+            client.close()
+
+    def __enter__(self) -> "SMSActivatePool":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class AsyncSMSActivatePool(_KeyRouter):
+    """Asynchronous ``SMSActivatePool``: ``AsyncSMSActivateAPI`` clients sharing one aiohttp session.
+
+        async with AsyncSMSActivatePool(["key1", "key2"], strategy="balance", limit=200) as pool:
+            async for result in pool.getNumbers("vk", 20, countries=[0, 6]):
+                ...
+    """
+
+    def __init__(self, api_keys: Iterable[str], strategy: str = 'least_in_flight', balance_ttl: float = 60.0,
+                 rate_limiters: Optional[Mapping[str, Any]] = None, clock: Callable[[], float] = time.monotonic,
+                 **client_kwargs: Any):
+        super().__init__(api_keys, strategy, balance_ttl, clock)
+        _share_mirrors(client_kwargs)
+        self.rate_limiters = rate_limiters or {}
+        self.client_kwargs = client_kwargs
+        self.clients: Dict[str, Any] = {}
+
+    def client(self, api_key: str) -> Any:
+        # 客户端在事件循环中按需创建，第一个客户端的会话由所有账户共享
+        client = self.clients.get(api_key)
+        if client is None:
+            from .async_api import AsyncSMSActivateAPI
+
+            kwargs = dict(self.client_kwargs)
+            if api_key in self.rate_limiters:
+                kwargs['rate_limiter'] = self.rate_limiters[api_key]
+            # 传入 transport= 时所有账户直接共用该传输
+            if self.clients and kwargs.get('session') is None and kwargs.get('transport') is None:
+                kwargs['session'] = next(iter(self.clients.values())).session
+            client = self.clients[api_key] = AsyncSMSActivateAPI(api_key, **kwargs)
+        return client
+
+    async def refresh_balances(self) -> None:
+        for state in self._stale():
+            self._store_balance(state, await self._invoke(state, 'getBalance', (), {}, acquired=False))
+
+    async def _invoke(self, state: KeyState, action: str, args: Tuple[Any, ...], kwargs: Mapping[str, Any],
+                      acquired: bool = True) -> Any:
+        if not acquired:
+            self._acquire(state)
+        try:
+            result = await getattr(self.client(state.api_key), action)(*args, **kwargs)
+        finally:
+            self._release(state)
+        self._observe(state, action, args, kwargs, result)
+        return result
+
+    async def _call(self, action: str, *args: Any, **kwargs: Any) -> Any:
+        if action in BOUND_ACTIONS:
+            id = _bound_id(action, args, kwargs)
+            if id is not None:
+                result = None
+                for state in self._bound_order(id):
+                    result = await self._invoke(state, action, args, kwargs, acquired=False)
+                    if _error_code(result) not in NOT_FOUND_ERRORS:
+                        if not _releases(action, args, kwargs):
+                            self._pins.setdefault(str(id), state.api_key)
+                        break
+                return result
+        if self.strategy == 'balance':
+            await self.refresh_balances()
+        picked = self._pick()
+        if picked is None:
+            return self._exhausted()
+        while True:
+            result = await self._invoke(picked, action, args, kwargs)
+            # 账户被移出轮换时请求未执行，换下一个账户重发
+            if _error_code(result) not in DISABLING_ERRORS:
+                return result
+            picked = self._pick()
+            if picked is None:
+                return result
+
+    def getNumbers(self, service: str, count: int, countries: Optional[Iterable[Any]] = None,
+                   operators: Optional[Iterable[Optional[str]]] = None, maxPrice: Optional[str] = None,
+                   concurrency: int = 10, v2: bool = False, **kwargs: Any) -> AsyncIterator[PurchaseResult]:
+        """``AsyncSMSActivateAPI.getNumbers`` spread over the pool; every purchase is pinned to its key."""
+        return buy_numbers(self, service, count, countries=countries, operators=operators, maxPrice=maxPrice,
+                           concurrency=concurrency, v2=v2, **kwargs)
+
+    async def close(self) -> None:
+        # 共享会话属于第一个客户端，最后关闭
+        for client in reversed(list(self.clients.values())):
+            await client.close()
+
+    async def __aenter__(self) -> "AsyncSMSActivatePool":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
@@ -0,0 +1,146 @@
+from bisect import bisect_left, insort
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+from .models import Record
+
+# getPrices 不区分运营商，这类报价记在空运营商名下
+ANY_OPERATOR = ''
+
+_Key = Tuple[float, str, str]
+
+
+class Offer(Record):
+    __slots__ = ('service', 'country', 'operator', 'cost', 'count')
+
+    def __init__(self, service: str, country: str, operator: str, cost: float, count: int):
+        self.service = service
+        self.country = country
+        self.operator = operator
+        self.cost = cost
+        self.count = count
+
+
+class PriceBook:
+    """In-memory index of offers built from ``getPrices`` and ``getNumbersStatus``.
+
+    Offers are kept per service in a list sorted by ``(cost, country, operator)``, so cheapest-first
+    queries stop at the first offer above ``max_price``. Refreshes are applied incrementally: a changed
+    count is a dict update, a changed cost moves one entry in the sorted list, an offer missing from
+    the refreshed payload is dropped.
+
+        book = PriceBook()
+        book.update_prices(await api.getPrices(service="vk"), service="vk")
+        offers = book.cheapest("vk", n=3, min_count=10, max_price=15)
+    """
+
+    def __init__(self):
+        self._sorted: Dict[str, List[_Key]] = {}
+        self._offers: Dict[Tuple[str, str, str], Tuple[float, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._offers)
+
+    def services(self) -> List[str]:
+        return list(self._sorted)
+
+    def get(self, service: str, country: Any, operator: str = ANY_OPERATOR) -> Optional[Offer]:
+        country = str(country)
+        offer = self._offers.get((service, country, operator))
+        if offer is None:
+            return None
+        return Offer(service, country, operator, offer[0], offer[1])
+
+    def set(self, service: str, country: Any, cost: Any, count: Any, operator: str = ANY_OPERATOR) -> None:
+        country = str(country)
+        cost = float(cost)
+        count = int(count)
+        key = (service, country, operator)
+        old = self._offers.get(key)
+        self._offers[key] = (cost, count)
+        if old is not None:
+            if old[0] == cost:
+                return
+            self._unindex(service, (old[0], country, operator))
+        insort(self._sorted.setdefault(service, []), (cost, country, operator))
+
+    def remove(self, service: str, country: Any, operator: str = ANY_OPERATOR) -> None:
+        country = str(country)
+        old = self._offers.pop((service, country, operator), None)
+        if old is not None:
+            self._unindex(service, (old[0], country, operator))
+
+    def update_prices(self, prices: Mapping[str, Any], service: Optional[str] = None,
+                      country: Optional[Any] = None) -> None:
+        """Apply a ``getPrices`` payload: ``{country: {service: {"cost": .., "count": ..}}}``.
+
+        ``service`` / ``country`` are the filters the payload was requested with; offers inside that
+        scope which the payload no longer lists (all operators of the pair) are removed.
+        """
+        if 'error' in prices:
+            return
+        listed = set()
+        for name, services in prices.items():
+            for service_name, entry in services.items():
+                listed.add((service_name, str(name)))
+                self.set(service_name, name, entry['cost'], entry['count'])
+        country = None if country is None else str(country)
+        stale = [key for key in self._offers
+                 if (key[0], key[1]) not in listed and (service is None or key[0] == service)
+                 and (country is None or key[1] == country)]
+        for key in stale:
+            self.remove(*key)
+
+    def update_numbers_status(self, status: Mapping[str, Any], country: Any,
+                              operator: str = ANY_OPERATOR) -> None:
+        """Apply a ``getNumbersStatus`` payload (``{"vk_0": "12", ...}``) for one country/operator.
+
+        Only counts are updated; an operator without its own price inherits the country price.
+        """
+        if 'error' in status:
+            return
+        country = str(country)
+        for name, count in status.items():
+            service, _, forward = name.rpartition('_')
+            if forward != '0':
+                continue
+            offer = self._offers.get((service, country, operator))
+            if offer is None:
+                offer = self._offers.get((service, country, ANY_OPERATOR))
+                if offer is None:
+                    continue
+            self.set(service, country, offer[0], count, operator)
+
+    def cheapest(self, service: str, n: int = 1, min_count: int = 1,
+                 max_price: Union[float, str, None] = None) -> List[Offer]:
+        """Up to ``n`` cheapest offers for ``service`` with at least ``min_count`` numbers in stock.
+
+        Each country appears once, with its cheapest qualifying offer (the country-wide one on a tie).
+        """
+        if max_price is not None:
+            max_price = float(max_price)
+        result = []
+        seen = set()
+        offers = self._offers
+        for cost, country, operator in self._sorted.get(service, ()):
+            if max_price is not None and cost > max_price:
+                break
+            if country in seen:
+                continue
+            count = offers[(service, country, operator)][1]
+            if count >= min_count:
+                seen.add(country)
+                result.append(Offer(service, country, operator, cost, count))
+                if len(result) >= n:
+                    break
+        return result
+
+    async def refresh(self, api: Any, service: Optional[str] = None, country: Optional[Any] = None) -> None:
+        self.update_prices(await api.getPrices(service=service, country=country), service=service, country=country)
+
+    def _unindex(self, service: str, key: _Key) -> None:
+        keys = self._sorted[service]
+        index = bisect_left(keys, key)
+        if index < len(keys) and keys[index] == key:
+            del keys[index]
+        if not keys:
+            del self._sorted[service]
@@ -0,0 +1,158 @@
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, List, Optional, Tuple, Union
+
+Rate = Union[float, Tuple[float, float]]
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at ``rate`` tokens per second, holding at most ``burst`` tokens.
+
+    ``reserve()`` always takes a token and returns how long the caller must wait before using it, so
+    waiters are served in arrival order without polling.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(rate, 1.0))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class RateLimiter:
+    """Request budget shared by every client that holds the same instance.
+
+    ``rate`` limits all actions together, ``action_rates`` adds a tighter budget for single actions
+    (a number of requests per second, or a ``(rate, burst)`` tuple), and ``max_in_flight`` caps the
+    concurrent requests across threads and event loops.
+
+        limiter = RateLimiter(rate=30, action_rates={'getNumber': 2, 'getStatus': (20, 40)}, max_in_flight=50)
+        api = AsyncSMSActivateAPI(api_key, rate_limiter=limiter)
+        sync_api = SMSActivateAPI(api_key, rate_limiter=limiter)
+    """
+
+    def __init__(self, rate: Optional[Rate] = None, action_rates: Optional[Dict[str, Rate]] = None,
+                 max_in_flight: Optional[int] = None):
+        self.bucket = self._bucket(rate) if rate is not None else None
+        self.action_buckets = {action: self._bucket(value) for action, value in (action_rates or {}).items()}
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+        self._cond = threading.Condition()
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    @staticmethod
+    def _bucket(value: Rate) -> TokenBucket:
+        if isinstance(value, tuple):
+            return TokenBucket(*value)
+        return TokenBucket(value)
+
+    def reserve(self, action: str) -> float:
+        delay = self.bucket.reserve() if self.bucket is not None else 0.0
+        bucket = self.action_buckets.get(action)
+        if bucket is not None:
+            delay = max(delay, bucket.reserve())
+        return delay
+
+    # --------------------------- 同步 ---------------------------
+    def acquire(self, action: str) -> None:
+        delay = self.reserve(action)
+        if delay:
+            time.sleep(delay)
+        if self.max_in_flight is not None:
+            with self._cond:
+                while self.in_flight >= self.max_in_flight:
+                    self._cond.wait()
+                self.in_flight += 1
+
+    @contextmanager
+    def limit(self, action: str):
+        self.acquire(action)
+        try:
+            yield
+        finally:
+            self.release()
+
+    # --------------------------- 异步 ---------------------------
+    async def acquire_async(self, action: str) -> None:
+        delay = self.reserve(action)
+        if delay:
+            await asyncio.sleep(delay)
+        if self.max_in_flight is None:
+            return
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._cond:
+                if self.in_flight < self.max_in_flight:
+                    self.in_flight += 1
+                    return
+                waiter = (loop, loop.create_future())
+                self._async_waiters.append(waiter)
+            try:
+                await waiter[1]
+            except asyncio.CancelledError:
+                with self._cond:
+                    if waiter in self._async_waiters:
+                        self._async_waiters.remove(waiter)
+                        woken = False
+                    else:
+                        woken = True
+                if woken:
+                    # 已被唤醒却被取消，把名额转交给下一个等待者
+                    self._wake_next()
+                raise
+
+    @asynccontextmanager
+    async def limit_async(self, action: str):
+        await self.acquire_async(action)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def release(self) -> None:
+        if self.max_in_flight is None:
+            return
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify()
+        self._wake_next()
+
+    def _wake_next(self) -> None:
+        with self._cond:
+            if not self._async_waiters:
+                return
+            loop, future = self._async_waiters.pop(0)
+        loop.call_soon_threadsafe(_resolve, future)
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+_shared: Dict[str, RateLimiter] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_limiter(name: str = "default", **kwargs) -> RateLimiter:
+    """Process-wide limiter registered under ``name``; ``kwargs`` only apply when it is first created."""
+    with _shared_lock:
+        limiter = _shared.get(name)
+        if limiter is None:
+            limiter = _shared[name] = RateLimiter(**kwargs)
+        return limiter
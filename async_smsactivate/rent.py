@@ -0,0 +1,319 @@
+import asyncio
+import calendar
+import heapq
+import time
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Dict, List, Mapping, NamedTuple, Optional, Set, Tuple, Union
+
+from .bulk import failure, gather_limited
+from .models import Record
+
+# getRentStatus / continueRentNumber 返回这些错误时租赁已结束，不再跟踪
+ENDED_ERRORS = frozenset({'STATUS_FINISH', 'STATUS_CANCEL', 'INVALID_PHONE', 'ALREADY_FINISH', 'ALREADY_CANCEL'})
+
+PriceCheck = Callable[["Rent", float], bool]
+
+
+class Rent(Record):
+    __slots__ = ('id', 'phone', 'end', 'renewals')
+
+    def __init__(self, id: str, phone: Any = None, end: Optional[float] = None, renewals: int = 0):
+        self.id = id
+        self.phone = phone
+        # 到期时间（Unix 时间戳），未知时为 None，不参与自动续租
+        self.end = end
+        self.renewals = renewals
+
+
+class RentMessage(NamedTuple):
+    rent_id: str
+    phone_from: Optional[str]
+    text: Optional[str]
+    service: Optional[str]
+    date: Optional[str]
+
+
+def parse_end_date(value: Any) -> Optional[float]:
+    """``endDate`` (``2024-05-05T18:00:00``, UTC) or a timestamp as a Unix timestamp."""
+    if value is None or value == '':
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).replace(' ', 'T')[:19]
+    try:
+        return float(calendar.timegm(time.strptime(text, '%Y-%m-%dT%H:%M:%S')))
+    except ValueError:
+        return None
+
+
+def _error_code(result: Any) -> Optional[str]:
+    if not isinstance(result, dict):
+        return None
+    if 'error' in result:
+        return result['error']
+    if result.get('status') == 'error':
+        return result.get('message') or 'ERROR'
+    return None
+
+
+class RentManager:
+    """Keep a set of rented numbers alive and collect their messages with shared polling.
+
+    Expiry times are kept in a heap, so each tick only looks at rents that are due for renewal.
+    A rent is renewed ``renew_before`` seconds ahead of its expiry when ``max_price`` accepts the
+    price from ``getContinueRentPriceNumber``: either a number (renew at or below it) or a
+    ``(rent, price) -> bool`` callable. With ``max_price=None`` nothing is renewed. Every tick polls
+    ``getRentStatus`` for all rents with at most ``concurrency`` requests in flight and passes new
+    messages to the iterators returned by ``messages()``; ``getRentList`` is only called by ``sync()``.
+
+        async with api.rent_manager(max_price=30, renew_hours=4) as rents:
+            await rents.rent("vk", time=4, country=0)
+            async for message in rents.messages():
+                print(message.rent_id, message.text)
+    """
+
+    def __init__(self, api: Any, max_price: Union[float, PriceCheck, None] = None, renew_before: float = 1800.0,
+                 renew_hours: int = 4, interval: float = 30.0, concurrency: int = 10,
+                 clock: Callable[[], float] = time.time):
+        self.api = api
+        self.max_price = max_price
+        self.renew_before = renew_before
+        self.renew_hours = renew_hours
+        self.interval = interval
+        self.concurrency = concurrency
+        self.clock = clock
+        # 最近一次失败的原因：异常或错误响应，成功后清空
+        self.last_error: Any = None
+        self.rents: Dict[str, Rent] = {}
+        # (到期时间, 租赁 id)；续租或移除后旧条目留在堆中，弹出时与 rents 比对后丢弃
+        self._heap: List[Tuple[float, str]] = []
+        # 价格不合适、不再续租的租赁
+        self._declined: Set[str] = set()
+        self._seen: Dict[str, Set[Tuple[Any, ...]]] = {}
+        self._queues: List[asyncio.Queue] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self.rents)
+
+    def __contains__(self, rent_id: Any) -> bool:
+        return str(rent_id) in self.rents
+
+    def add(self, rent_id: Union[int, str], phone: Any = None, end: Any = None) -> Rent:
+        """Track a rent; ``end`` is an ``endDate`` string or a Unix timestamp."""
+        key = str(rent_id)
+        rent = self.rents.get(key)
+        if rent is None:
+            rent = self.rents[key] = Rent(key)
+        if phone is not None:
+            rent.phone = phone
+        end = parse_end_date(end)
+        if end is not None and end != rent.end:
+            rent.end = end
+            heapq.heappush(self._heap, (end, key))
+        return rent
+
+    def remove(self, rent_id: Union[int, str]) -> Optional[Rent]:
+        key = str(rent_id)
+        self._declined.discard(key)
+        self._seen.pop(key, None)
+        return self.rents.pop(key, None)
+
+    def next_renewal(self) -> Optional[float]:
+        """Time at which the next renewal is due, or None."""
+        heap = self._heap
+        while heap:
+            end, key = heap[0]
+            rent = self.rents.get(key)
+            if rent is not None and rent.end == end and key not in self._declined:
+                return end - self.renew_before
+            heapq.heappop(heap)
+        return None
+
+    async def rent(self, service: str, time: Optional[str] = None, operator: Optional[str] = None,
+                   country: Optional[str] = None, url: Optional[str] = None) -> Any:
+        """``getRentNumber`` and track the new rent; returns the API result."""
+        result = await self.api.getRentNumber(service=service, time=time, operator=operator, country=country, url=url)
+        phone = result.get('phone') if isinstance(result, Mapping) else None
+        if _error_code(result) is None and isinstance(phone, Mapping):
+            self.add(phone['id'], phone.get('number'), phone.get('endDate'))
+        return result
+
+    async def sync(self) -> bool:
+        """Adopt the account's rents from ``getRentList`` and drop the ones that are no longer listed."""
+        result = await self.api.getRentList()
+        code = _error_code(result)
+        if code is not None and code != 'NO_RENTS':
+            self.last_error = result
+            return False
+        values = result.get('values') if code is None else None
+        listed = set()
+        for item in (values or {}).values():
+            key = str(item.get('id'))
+            listed.add(key)
+            self.add(key, item.get('phone'))
+        for key in [key for key in self.rents if key not in listed]:
+            self.remove(key)
+        return True
+
+    async def renew_due(self) -> Dict[str, Any]:
+        """Renew every rent that is due; returns ``{rent_id: continueRentNumber result or price error}``.
+
+        A rent whose renewal fails (error response or exception) stays scheduled and is retried next tick.
+        """
+        now = self.clock()
+        results: Dict[str, Any] = {}
+        retry = []
+        heap = self._heap
+        try:
+            while heap and heap[0][0] - self.renew_before <= now:
+                end, key = heapq.heappop(heap)
+                rent = self.rents.get(key)
+                if rent is None or rent.end != end or key in self._declined:
+                    continue
+                if end <= now:
+                    # 已经过期，不再续租
+                    self.remove(key)
+                    continue
+                try:
+                    result = await self._renew(rent)
+                except asyncio.CancelledError:
+                    retry.append((end, key))
+                    raise
+                except Exception as e:
+                    # 网络异常与错误响应一样，留在堆中下个周期重试
+                    result = failure(e)
+                results[key] = result
+                code = _error_code(result)
+                if code is None:
+                    continue
+                if code in ENDED_ERRORS:
+                    self.remove(key)
+                elif key not in self._declined:
+                    # 临时失败：下个周期重试
+                    retry.append((end, key))
+        finally:
+            for item in retry:
+                heapq.heappush(heap, item)
+        return results
+
+    async def poll(self) -> List[RentMessage]:
+        """``getRentStatus`` for every tracked rent; returns and dispatches the new messages."""
+        now = self.clock()
+        for key in [key for key, rent in self.rents.items() if rent.end is not None and rent.end <= now]:
+            self.remove(key)
+        statuses = await gather_limited([(key, partial(self.api.getRentStatus, key)) for key in self.rents],
+                                        self.concurrency)
+        new = []
+        for key, result in statuses.items():
+            code = _error_code(result)
+            if code is not None:
+                if code in ENDED_ERRORS:
+                    self.remove(key)
+                elif code != 'STATUS_WAIT_CODE':
+                    self.last_error = result
+                continue
+            if key not in self.rents:
+                continue
+            seen = self._seen.setdefault(key, set())
+            values = result.get('values') or {}
+            for index in sorted(values, key=lambda index: int(index) if str(index).isdigit() else 0):
+                item = values[index]
+                fingerprint = (item.get('date'), item.get('phoneFrom'), item.get('text'))
+                if fingerprint in seen:
+                    continue
+                seen.add(fingerprint)
+                message = RentMessage(key, item.get('phoneFrom'), item.get('text'), item.get('service'),
+                                      item.get('date'))
+                new.append(message)
+                for queue in self._queues:
+                    queue.put_nowait(message)
+        return new
+
+    async def tick(self) -> None:
+        await self.renew_due()
+        await self.poll()
+
+    async def messages(self) -> AsyncIterator[RentMessage]:
+        """Yield new messages of all tracked rents as the polling loop finds them."""
+        queue: asyncio.Queue = asyncio.Queue()
+        self._queues.append(queue)
+        self._ensure_running()
+        try:
+            while True:
+                message = await queue.get()
+                if message is None:
+                    return
+                yield message
+        finally:
+            if queue in self._queues:
+                self._queues.remove(queue)
+
+    async def start(self, sync: bool = True) -> None:
+        if sync:
+            await self.sync()
+        self._ensure_running()
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for queue in self._queues:
+            queue.put_nowait(None)
+
+    async def __aenter__(self) -> "RentManager":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop()
+
+    def _ensure_running(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                self.last_error = None
+                await self.tick()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.last_error = failure(e)
+            # 有续租即将到期时提前醒来
+            delay = self.interval
+            due = self.next_renewal()
+            now = self.clock()
+            if due is not None and due > now:
+                delay = min(delay, due - now)
+            await asyncio.sleep(delay)
+
+    def _accepts(self, rent: Rent, price: float) -> bool:
+        if self.max_price is None:
+            return False
+        if callable(self.max_price):
+            return bool(self.max_price(rent, price))
+        return price <= self.max_price
+
+    async def _renew(self, rent: Rent) -> Any:
+        quote = await self.api.getContinueRentPriceNumber(rent.id)
+        if _error_code(quote) is not None:
+            return quote
+        try:
+            price = float(quote.get('price'))
+        except (TypeError, ValueError):
+            return {"error": "BAD_PRICE", "message": "Unexpected continue price: %r" % (quote,)}
+        if not self._accepts(rent, price):
+            self._declined.add(rent.id)
+            return {"error": "PRICE_DECLINED", "message": "Continue price %s not accepted" % price}
+        result = await self.api.continueRentNumber(rent.id, time=str(self.renew_hours))
+        if _error_code(result) is None:
+            phone = result.get('phone') or {}
+            rent.renewals += 1
+            self.add(rent.id, phone.get('number'), phone.get('endDate'))
+        return result
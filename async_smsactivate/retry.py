@@ -0,0 +1,110 @@
+import random
+import time
+from typing import Any, Callable, Collection, FrozenSet, Iterable, Optional
+
+from .parsers import ERRORS
+
+# 服务端临时故障，稍后重试通常可以成功
+TRANSIENT_ERRORS = frozenset({'NO_CONNECTION', 'ERROR_SQL', 'SQL_ERROR'})
+# 其余错误码（BAD_KEY、BANNED、NO_BALANCE 等）重试也不会改变结果
+TERMINAL_ERRORS = frozenset(ERRORS) - TRANSIENT_ERRORS
+
+# 会产生扣费或改变状态的接口：只有在确定请求未被执行时才重试，避免重复购买
+NON_IDEMPOTENT_ACTIONS = frozenset({
+    'getNumber', 'getNumberV2', 'getMultiServiceNumber', 'getAdditionalService', 'getRentNumber',
+    'continueRentNumber', 'createTaskForCall',
+})
+
+TRANSIENT = 'transient'
+TERMINAL = 'terminal'
+
+
+def classify(body: bytes, transient: Collection[str] = TRANSIENT_ERRORS) -> Optional[str]:
+    """Classify a response body: TRANSIENT, TERMINAL for other known error codes, None for a normal answer."""
+    if not body.strip():
+        return TRANSIENT
+    if len(body) > 64 or body[:1] in (b'{', b'['):
+        return None
+    code = body.strip().decode('utf-8', 'replace')
+    if code in transient:
+        return TRANSIENT
+    if code in ERRORS:
+        return TERMINAL
+    return None
+
+
+def transient_response(status: int, body: bytes, transient: Collection[str] = TRANSIENT_ERRORS) -> bool:
+    """HTTP 5xx/429, an empty body or a transient error code: the server failed to answer this time."""
+    return status >= 500 or status == 429 or classify(body, transient) == TRANSIENT
+
+
+def transient_error(code: Any) -> bool:
+    """True for the ``error`` of a parsed result worth asking again: transient code, empty body, HTTP 5xx/429."""
+    if code in TRANSIENT_ERRORS or code in ('', 'CIRCUIT_OPEN'):
+        return True
+    if isinstance(code, str) and code.startswith('HTTP_') and code[5:].isdigit():
+        status = int(code[5:])
+        return status >= 500 or status == 429
+    return False
+
+
+class RetryPolicy:
+    """When and how long to wait before repeating a request.
+
+    Transient results (HTTP 5xx/429, empty body, ``NO_CONNECTION``, ``ERROR_SQL``) and network errors
+    are retried with full-jitter exponential backoff until ``max_attempts`` or the total ``deadline``
+    is reached. Actions in ``non_idempotent`` are only retried when the request provably did not take
+    effect: the connection could not be opened, or the server answered with a transient error code.
+    A read timeout or HTTP 5xx after a purchase request is returned/raised as is.
+    """
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.5, max_delay: float = 8.0,
+                 deadline: Optional[float] = 30.0, transient_errors: Iterable[str] = TRANSIENT_ERRORS,
+                 non_idempotent: Iterable[str] = NON_IDEMPOTENT_ACTIONS,
+                 rand: Callable[[], float] = random.random):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.transient_errors: FrozenSet[str] = frozenset(transient_errors)
+        self.non_idempotent: FrozenSet[str] = frozenset(non_idempotent)
+        self.rand = rand
+
+    def start(self) -> "RetryState":
+        return RetryState(self)
+
+    def is_transient_response(self, status: int, body: bytes) -> bool:
+        return transient_response(status, body, self.transient_errors)
+
+    def should_retry_response(self, action: str, status: int, body: bytes) -> bool:
+        if not self.is_transient_response(status, body):
+            return False
+        if action in self.non_idempotent:
+            # 明确的错误码说明服务端没有执行该操作；5xx 和空响应则无法确定
+            return status < 500 and status != 429 and bool(body.strip())
+        return True
+
+    def should_retry_exception(self, action: str, unsent: bool) -> bool:
+        return unsent or action not in self.non_idempotent
+
+    def backoff(self, attempt: int) -> float:
+        return self.rand() * min(self.max_delay, self.base_delay * (2 ** attempt))
+
+
+class RetryState:
+    """Attempt counter and deadline for a single logical request."""
+
+    def __init__(self, policy: RetryPolicy):
+        self.policy = policy
+        self.attempt = 0
+        self.started = time.monotonic()
+
+    def next_delay(self) -> Optional[float]:
+        """Delay before the next attempt, or None when the budget is exhausted."""
+        self.attempt += 1
+        if self.attempt >= self.policy.max_attempts:
+            return None
+        delay = self.policy.backoff(self.attempt - 1)
+        if self.policy.deadline is not None and time.monotonic() - self.started + delay > self.policy.deadline:
+            return None
+        return delay
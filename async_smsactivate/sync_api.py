@@ -0,0 +1,186 @@
+import time
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+from .api import API_URL
+from .breaker import CircuitOpen
+from .bulk import failure, status_updates
+from .deadline import bounded_timeout, check_remaining
+from .dispatch import Dispatch
+from .endpoint_methods import SyncEndpoints
+from .jsonlib import get_loads
+from .mirrors import MirrorSelector
+from .parsers import CODES, ERRORS, PARSERS, RENT_CODES, TYPED_PARSERS, http_error, parse_response
+
+# 默认时限与异步客户端一致：连接 10 秒、读取 30 秒
+DEFAULT_TIMEOUT = (10.0, 30.0)
+
+
+def _unsent(exc):
+    # 连接未建立（超时、拒绝、DNS 失败）时请求一定没有发出
+    if isinstance(exc, requests.exceptions.ConnectTimeout):
+        return True
+    reason = getattr(exc.args[0], 'reason', None) if exc.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+class SMSActivateAPI(SyncEndpoints):
+
+    def __init__(self, api_key, pool_connections=10, pool_maxsize=10, pool_block=False, timeout=DEFAULT_TIMEOUT,
+                 session=None, api_url=API_URL, json_backend="auto", typed_results=False,
+                 rate_limiter=None, retry_policy=None, metrics=None, circuit_breaker=None, api_urls=None):
+        # api_urls：多个镜像地址（或共享的 mirrors.MirrorSelector），按延迟和错误率选择并自动切换
+        self.mirrors = None if api_urls is None else MirrorSelector.coerce(api_urls)
+        if self.mirrors is not None:
+            api_url = self.mirrors.urls[0]
+        self.__api_url = api_url
+        self.__host = urlsplit(api_url).netloc
+        self.api_key = api_key
+        self.debug_mode = False
+        # JSON 后端："auto"（优先 orjson / msgspec / ujson，未安装则使用标准库）、后端名称或自定义 loads 函数
+        self.json_loads = get_loads(json_backend)
+        # 为 True 时 getNumber / getRentNumber / getPrices 等返回 models.py 中的 __slots__ 结果对象
+        self.parsers = TYPED_PARSERS if typed_results else PARSERS
+        # 限流器：多个客户端传入同一个 RateLimiter 即共享请求预算（见 ratelimit.shared_limiter）
+        self.rate_limiter = rate_limiter
+        # 重试策略：None 表示不重试，见 retry.RetryPolicy
+        self.retry_policy = retry_policy
+        # 熔断器：按 (主机, 接口) 统计失败率，熔断期间直接返回 CIRCUIT_OPEN，None 表示不熔断（见 breaker.CircuitBreaker）
+        self.circuit_breaker = circuit_breaker
+        # 指标：每次 HTTP 请求回调一次 metrics.MetricsSink，None 表示不采集
+        self.metrics = metrics
+        # 连接池参数：pool_connections 为缓存的主机连接池数量，pool_maxsize 为单个主机的最大 keep-alive 连接数
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        # 与 requests 一致：单个数值，或 (connect, read) 元组，None 表示不限制；在 deadline() 块中不会超过剩余时间
+        self.timeout = timeout
+        self.__session = session
+        self.__owns_session = session is None
+
+        self.__CODES = CODES
+        self.__RENT_CODES = RENT_CODES
+        self.__ERRORS = ERRORS
+
+    def version(self):
+        return "1.5"
+
+    def check_error(self, response):
+        if self.__ERRORS.get(response) == None:
+            return False
+        return True
+
+    def get_error(self, error):
+        return self.__ERRORS.get(error)
+
+    def __debugLog(self, data):
+        if self.debug_mode:
+            print('[Debug]', data)
+
+    def response(self, action, response):
+        self.__debugLog(response)
+        return parse_response(action, response, self.json_loads, self.parsers)
+
+    def activationStatus(self, status):
+        return {"status": status, "message": self.__CODES.get(status)}
+
+    def rentStatus(self, status):
+        return self.__RENT_CODES.get(status)
+
+    @property
+    def session(self):
+        if self.__session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize,
+                                  pool_block=self.pool_block)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            self.__session = session
+        return self.__session
+
+    def __get(self, payload):
+        action = payload['action']
+        # 镜像选择、熔断统计和重试 / 切换规则见 dispatch.Dispatch，这里只负责发送请求和等待
+        dispatch = Dispatch(action, self.__api_url, self.__host, self.mirrors, self.circuit_breaker,
+                            self.retry_policy, self.metrics)
+        while True:
+            url = dispatch.start()
+            try:
+                if self.rate_limiter is None:
+                    r = self.__fetch(dispatch, url, payload)
+                else:
+                    with self.rate_limiter.limit(action):
+                        r = self.__fetch(dispatch, url, payload)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                delay = dispatch.failed(e, _unsent(e))
+                if delay is None:
+                    raise
+            except BaseException as e:
+                dispatch.cancelled(e)
+                raise
+            else:
+                delay = dispatch.answered(r.status_code, r.content)
+                if delay is None:
+                    return r
+            if delay:
+                time.sleep(delay)
+
+    def __fetch(self, dispatch, url, payload):
+        timeout = bounded_timeout(self.timeout, check_remaining())
+        # 在限流之后计时，延迟中不包含排队等待的时间
+        dispatch.sending()
+        return self.session.get(url, params=payload, timeout=timeout)
+
+    def close(self):
+        if self.__session is not None and self.__owns_session:
+            self.__session.close()
+        self.__session = None
+        self.__owns_session = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # getBalance、getNumber、getStatus 等继承自 endpoint_methods（由 endpoints.ENDPOINTS 生成），统一经过 _request
+    def _request(self, action, params):
+        params['api_key'] = self.api_key
+        try:
+            r = self.__get(params)
+        except CircuitOpen as e:
+            return e.as_error()
+        # 非 2xx 的响应体（网关错误页等）不是接口的回复，不交给解析器
+        error = http_error(r.status_code)
+        if error is not None:
+            self.__debugLog(r.content)
+            return error
+        return self.response(action, r.content)
+
+    def setStatusBatch(self, ids, status=None, forward=None, concurrency=None, purchased_at=None):
+        # ids 可以是 id 列表（统一设置为 status），也可以是 {id: status}；取消（8）优先发送，见 bulk.status_updates
+        updates = status_updates(ids, status, purchased_at)
+        return self.__run_batch([(id, partial(self.setStatus, id=id, forward=forward, status=value))
+                                 for id, value in updates], concurrency)
+
+    def getStatusBatch(self, ids, concurrency=None):
+        return self.__run_batch([(id, partial(self.getStatus, id=id)) for id in ids], concurrency)
+
+    def __run_batch(self, calls, concurrency=None):
+        # 线程数默认等于连接池大小，所有线程复用同一个 Session
+        results = {id: None for id, _ in calls}
+        if not calls:
+            return results
+        with ThreadPoolExecutor(max_workers=concurrency or self.pool_maxsize) as executor:
+            futures = [(id, executor.submit(call)) for id, call in calls]
+            for id, future in futures:
+                try:
+                    results[id] = future.result()
+                except Exception as e:
+                    results[id] = failure(e)
+        return results
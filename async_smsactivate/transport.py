@@ -0,0 +1,123 @@
+"""HTTP transports for ``AsyncSMSActivateAPI``.
+
+A transport sends one GET to ``handler_api.php`` and returns ``(status, body)``. ``AiohttpTransport``
+is the default: HTTP/1.1 with one connection per in-flight request. ``HttpxTransport`` uses httpx
+with HTTP/2 (optional dependency, ``pip install async-smsactivate[http2]``) and multiplexes many
+concurrent requests over a few connections, which keeps the socket count low when thousands of
+polls per second go to the same host.
+"""
+import asyncio
+from typing import Any, Mapping, Optional, Tuple, Type
+
+import aiohttp
+
+from .deadline import Timeouts
+
+
+class Transport:
+    """Base class; subclasses implement ``get`` and ``close``."""
+
+    # 可以重试的网络异常（与 retry.RetryPolicy 配合）
+    errors: Tuple[Type[BaseException], ...] = (asyncio.TimeoutError,)
+
+    async def get(self, url: str, params: Mapping[str, Any], timeouts: Timeouts) -> Tuple[int, bytes]:
+        raise NotImplementedError
+
+    def unsent(self, exc: BaseException) -> bool:
+        """True if ``exc`` guarantees the request never reached the server (safe to retry purchases)."""
+        return False
+
+    async def close(self) -> None:
+        pass
+
+
+class AiohttpTransport(Transport):
+    """``aiohttp.ClientSession`` over a ``TCPConnector``; the session is created on first use."""
+
+    errors = (aiohttp.ClientError, asyncio.TimeoutError)
+
+    def __init__(self, limit: int = 100, limit_per_host: int = 0, use_dns_cache: bool = True,
+                 ttl_dns_cache: Optional[int] = 10, keepalive_timeout: float = 15.0,
+                 session: Optional[aiohttp.ClientSession] = None):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.use_dns_cache = use_dns_cache
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+        # 传入的共享会话不会被 close() 关闭
+        self.__session = session
+        self.__owns_session = session is None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self.__session is None or self.__session.closed:
+            connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host,
+                                             use_dns_cache=self.use_dns_cache, ttl_dns_cache=self.ttl_dns_cache,
+                                             keepalive_timeout=self.keepalive_timeout)
+            self.__session = aiohttp.ClientSession(connector=connector)
+            self.__owns_session = True
+        return self.__session
+
+    async def get(self, url: str, params: Mapping[str, Any], timeouts: Timeouts) -> Tuple[int, bytes]:
+        connect, read, total = timeouts
+        timeout = aiohttp.ClientTimeout(total=total, sock_connect=connect, sock_read=read)
+        # 取消时 async with 会释放（或关闭）连接，连接池中的名额不会泄漏
+        async with self.session.get(url, params=params, timeout=timeout) as resp:
+            return resp.status, await resp.read()
+
+    def unsent(self, exc: BaseException) -> bool:
+        return isinstance(exc, aiohttp.ClientConnectorError)
+
+    async def close(self) -> None:
+        if self.__session is not None and self.__owns_session:
+            await self.__session.close()
+        self.__session = None
+        self.__owns_session = True
+
+
+class HttpxTransport(Transport):
+    """``httpx.AsyncClient``, HTTP/2 by default: concurrent requests share streams of a few connections.
+
+        api = AsyncSMSActivateAPI("你的 API Key", transport=HttpxTransport(max_connections=4))
+    """
+
+    def __init__(self, http2: bool = True, max_connections: Optional[int] = 10,
+                 keepalive_expiry: Optional[float] = 15.0, client: Any = None, **client_kwargs: Any):
+        import httpx
+
+        self.httpx = httpx
+        self.errors = (httpx.TransportError, asyncio.TimeoutError)
+        self.http2 = http2
+        self.max_connections = max_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.client_kwargs = client_kwargs
+        # 与 aiohttp 会话一致：第一次请求时创建，传入的共享客户端不会被 close() 关闭
+        self.__client = client
+        self.__owns_client = client is None
+
+    @property
+    def client(self) -> Any:
+        if self.__client is None or self.__client.is_closed:
+            limits = self.httpx.Limits(max_connections=self.max_connections,
+                                       max_keepalive_connections=self.max_connections,
+                                       keepalive_expiry=self.keepalive_expiry)
+            self.__client = self.httpx.AsyncClient(http2=self.http2, limits=limits, **self.client_kwargs)
+            self.__owns_client = True
+        return self.__client
+
+    async def get(self, url: str, params: Mapping[str, Any], timeouts: Timeouts) -> Tuple[int, bytes]:
+        connect, read, total = timeouts
+        # httpx 没有整体时限，pool 为等待连接 / 流的时间
+        timeout = self.httpx.Timeout(connect=connect, read=read, write=read, pool=total)
+        request = self.client.get(url, params=params, timeout=timeout)
+        resp = await (request if total is None else asyncio.wait_for(request, total))
+        return resp.status_code, resp.content
+
+    def unsent(self, exc: BaseException) -> bool:
+        return isinstance(exc, (self.httpx.ConnectError, self.httpx.ConnectTimeout, self.httpx.PoolTimeout))
+
+    async def close(self) -> None:
+        if self.__client is not None and self.__owns_client:
+            await self.__client.aclose()
+        self.__client = None
+        self.__owns_client = True
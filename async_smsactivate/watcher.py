@@ -0,0 +1,229 @@
+import asyncio
+from functools import partial
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional, Set, Tuple, Union
+
+from .bulk import gather_limited
+from .models import ActivationStatus
+from .parsers import CODES, ERRORS, parse_status
+
+ENDED = {"error": "NO_ACTIVATION", "message": ERRORS['NO_ACTIVATION']}
+
+
+class ActivationWatcher:
+    """Track many activations with one ``getActiveActivations`` sweep per tick.
+
+    Each sweep is diffed against the codes seen on the previous sweep; new codes resolve the futures
+    returned by ``watch()`` and feed the iterators returned by ``codes()``. An activation that drops out
+    of the sweep is treated as finished: pending futures resolve to an ``NO_ACTIVATION`` error dict and
+    iterators stop. Only watched activations are kept in the snapshot.
+
+        async with ActivationWatcher(api, interval=3) as watcher:
+            status = await watcher.wait(activation_id, timeout=300)
+    """
+
+    def __init__(self, api: Any, interval: float = 5.0):
+        self.api = api
+        self.interval = interval
+        # 最近一次失败的原因：异常或错误响应，成功后清空
+        self.last_error: Any = None
+        self._seen: Dict[str, Tuple[str, ...]] = {}
+        self._futures: Dict[str, List[asyncio.Future]] = {}
+        self._queues: Dict[str, List[asyncio.Queue]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def watched(self) -> Set[str]:
+        return set(self._futures) | set(self._queues)
+
+    def watch(self, activation_id: Union[int, str]) -> asyncio.Future:
+        """Future resolved with the first new code (``ActivationStatus``) or the end-of-activation error dict."""
+        future = asyncio.get_running_loop().create_future()
+        self._futures.setdefault(str(activation_id), []).append(future)
+        self._ensure_running()
+        return future
+
+    async def wait(self, activation_id: Union[int, str],
+                   timeout: Optional[float] = None) -> Union[ActivationStatus, Dict[str, Any]]:
+        future = self.watch(activation_id)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        finally:
+            if not future.done():
+                future.cancel()
+                self._discard(self._futures, str(activation_id), future)
+
+    async def codes(self, activation_id: Union[int, str]) -> AsyncIterator[ActivationStatus]:
+        """Yield every new code of the activation until it leaves ``getActiveActivations``."""
+        key = str(activation_id)
+        queue: asyncio.Queue = asyncio.Queue()
+        self._queues.setdefault(key, []).append(queue)
+        self._ensure_running()
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                yield item
+        finally:
+            self._discard(self._queues, key, queue)
+
+    def unwatch(self, activation_id: Union[int, str]) -> None:
+        key = str(activation_id)
+        for future in self._futures.pop(key, ()):
+            future.cancel()
+        for queue in self._queues.pop(key, ()):
+            queue.put_nowait(None)
+        self._seen.pop(key, None)
+
+    async def sweep(self) -> bool:
+        """Run one ``getActiveActivations`` sweep and dispatch the differences.
+
+        Returns False when the sweep failed with a transient error and the snapshot was kept.
+        """
+        watched = self.watched
+        if not watched:
+            self._seen.clear()
+            return True
+        result = await self.api.getActiveActivations()
+        if not isinstance(result, dict):
+            self.last_error = result
+            return False
+        activations = result.get('activeActivations')
+        if activations is None:
+            if result.get('error') != 'NO_ACTIVATIONS':
+                # 临时错误（NO_CONNECTION 等）：保留快照，下个周期重试
+                self.last_error = result
+                return False
+            activations = []
+        active = {}
+        for item in activations:
+            key = str(item.get('activationId'))
+            if key in watched:
+                active[key] = tuple(item.get('smsCode') or ())
+        for key in watched:
+            codes = active.get(key)
+            if codes is None:
+                self._finish(key)
+                continue
+            new_codes = codes[len(self._seen.get(key, ())):]
+            self._seen[key] = codes
+            for code in new_codes:
+                self._dispatch(key, ActivationStatus('STATUS_OK', code, CODES['STATUS_OK']))
+        # 已无人关注的激活不再保留快照，内存只与关注数量相关
+        watched = self.watched
+        for key in [key for key in self._seen if key not in watched]:
+            del self._seen[key]
+        return True
+
+    async def start(self) -> None:
+        self._ensure_running()
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def __aenter__(self) -> "ActivationWatcher":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop()
+
+    def _ensure_running(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if await self.sweep():
+                    self.last_error = None
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.last_error = e
+            await asyncio.sleep(self.interval)
+
+    def _dispatch(self, key: str, status: ActivationStatus) -> None:
+        for future in self._futures.pop(key, ()):
+            if not future.done():
+                future.set_result(status)
+        for queue in self._queues.get(key, ()):
+            queue.put_nowait(status)
+
+    def _finish(self, key: str) -> None:
+        self._seen.pop(key, None)
+        for future in self._futures.pop(key, ()):
+            if not future.done():
+                future.set_result(dict(ENDED))
+        for queue in self._queues.pop(key, ()):
+            queue.put_nowait(None)
+
+    @staticmethod
+    def _discard(registry: Dict[str, list], key: str, item: Any) -> None:
+        items = registry.get(key)
+        if items and item in items:
+            items.remove(item)
+            if not items:
+                del registry[key]
+
+
+class CodeEvent(NamedTuple):
+    activation_id: str
+    code: str
+    full_text: Optional[str]
+
+
+async def _full_text(api: Any, activation_id: str) -> Optional[str]:
+    result = await api.getFullSms(activation_id)
+    if not isinstance(result, str):
+        return None
+    status = parse_status(result)
+    return status.code if status.status == 'FULL_SMS' else None
+
+
+async def stream_codes(api: Any, interval: float = 5.0, full_text: bool = True,
+                       concurrency: int = 10) -> AsyncIterator[CodeEvent]:
+    """Yield a ``CodeEvent`` for every new code on any open activation of the account.
+
+    Each tick is one ``getActiveActivations`` sweep; when the sweep fails transiently the activations
+    from the previous sweep are checked with ``getStatus`` instead. The full text comes from
+    ``getFullSms``. The next sweep only starts after the consumer has taken the pending events, and
+    the state kept is one ``(code count, last code)`` pair per open activation.
+    """
+    seen: Dict[str, Tuple[int, Optional[str]]] = {}
+    while True:
+        result = await api.getActiveActivations()
+        activations = result.get('activeActivations') if isinstance(result, dict) else None
+        if activations is None and isinstance(result, dict) and result.get('error') == 'NO_ACTIVATIONS':
+            activations = []
+        if activations is not None:
+            current = {}
+            for item in activations:
+                key = str(item.get('activationId'))
+                codes = item.get('smsCode') or ()
+                count, last = seen.get(key, (0, None))
+                for code in codes[count:]:
+                    last = code
+                    yield CodeEvent(key, code, await _full_text(api, key) if full_text else None)
+                current[key] = (max(count, len(codes)), last)
+            seen = current
+        elif seen:
+            # getActiveActivations 临时失败：逐个查询上一次已知的激活
+            statuses = await gather_limited([(key, partial(api.getStatus, key)) for key in seen],
+                                            concurrency)
+            for key, status in statuses.items():
+                if isinstance(status, str):
+                    status = parse_status(status)
+                elif not isinstance(status, ActivationStatus):
+                    continue
+                count, last = seen[key]
+                if status.received and status.code is not None and status.code != last:
+                    seen[key] = (count + 1, status.code)
+                    yield CodeEvent(key, status.code, await _full_text(api, key) if full_text else None)
+        await asyncio.sleep(interval)
@@ -0,0 +1,132 @@
+"""Load-test the sync and async clients against the local mock server.
+
+Reports requests/sec, p50/p99 latency and memory per client and concurrency level. The mock
+server runs in a separate process so it does not compete with the client for the GIL.
+
+Usage:
+    python benchmarks/bench_clients.py --client both --concurrency 1 10 100 1000 10000 --requests 20000
+    python benchmarks/bench_clients.py --client async --action getPrices --requests 50
+"""
+import argparse
+import asyncio
+import os
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+# 未安装本包时也可以直接运行：python benchmarks/bench_clients.py
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from async_smsactivate.api import AsyncSMSActivateAPI, SMSActivateAPI
+
+# 同步客户端用线程模拟并发，线程数超过该值时收益很小
+MAX_SYNC_THREADS = 256
+
+
+def start_server(latency):
+    process = subprocess.Popen([sys.executable, '-m', 'async_smsactivate.mock_server', '--latency', str(latency)],
+                               stdout=subprocess.PIPE, text=True, cwd=ROOT)
+    url = process.stdout.readline().strip()
+    return process, url
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+def call_kwargs(action):
+    return {'id': 100000000} if action in ('getStatus', 'getFullSms') else {}
+
+
+def run_sync(url, action, concurrency, requests):
+    latencies = []
+    threads = min(concurrency, MAX_SYNC_THREADS)
+    with SMSActivateAPI('bench', api_url=url, pool_maxsize=threads) as api:
+        method = getattr(api, action)
+        kwargs = call_kwargs(action)
+
+        def one(_):
+            started = time.perf_counter()
+            method(**kwargs)
+            latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(one, range(requests)))
+        return time.perf_counter() - started, latencies
+
+
+async def run_async(url, action, concurrency, requests):
+    latencies = []
+    async with AsyncSMSActivateAPI('bench', api_url=url, limit=min(concurrency, 1000),
+                                   limit_per_host=min(concurrency, 1000)) as api:
+        method = getattr(api, action)
+        kwargs = call_kwargs(action)
+        remaining = iter(range(requests))
+
+        async def worker():
+            for _ in remaining:
+                started = time.perf_counter()
+                await method(**kwargs)
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*[worker() for _ in range(min(concurrency, requests))])
+        return time.perf_counter() - started, latencies
+
+
+def report(client, action, concurrency, elapsed, latencies, peak):
+    line = '%-5s %-22s c=%-6d %9.0f req/s  p50 %8.2f ms  p99 %8.2f ms  max rss %7.1f MiB' % (
+        client, action, concurrency, len(latencies) / elapsed, percentile(latencies, 0.5) * 1000,
+        percentile(latencies, 0.99) * 1000, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024)
+    if peak is not None:
+        line += '  traced peak %7.1f MiB' % (peak / 2 ** 20)
+    print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='sms-activate client load test')
+    parser.add_argument('--client', choices=('sync', 'async', 'both'), default='both')
+    parser.add_argument('--action', default='getStatus')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 10, 100, 1000])
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--latency', type=float, default=0.005, help='mock server latency in seconds')
+    parser.add_argument('--url', help='use an already running server instead of starting one')
+    parser.add_argument('--trace-memory', action='store_true',
+                        help='report the tracemalloc peak (slows the clients down noticeably)')
+    args = parser.parse_args()
+
+    process = None
+    url = args.url
+    if url is None:
+        process, url = start_server(args.latency)
+    try:
+        for concurrency in args.concurrency:
+            for client in ('sync', 'async'):
+                if args.client not in (client, 'both'):
+                    continue
+                if args.trace_memory:
+                    tracemalloc.start()
+                if client == 'sync':
+                    elapsed, latencies = run_sync(url, args.action, concurrency, args.requests)
+                else:
+                    elapsed, latencies = asyncio.run(run_async(url, args.action, concurrency, args.requests))
+                peak = None
+                if args.trace_memory:
+                    peak = tracemalloc.get_traced_memory()[1]
+                    tracemalloc.stop()
+                report(client, args.action, concurrency, elapsed, latencies, peak)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == '__main__':
+    main()
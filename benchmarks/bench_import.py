@@ -0,0 +1,65 @@
+"""Measure package import time and check that each client only imports its own HTTP library.
+
+Every case runs in a fresh interpreter. Exits with status 1 when a case imports a module it must not
+(e.g. the sync client pulling in aiohttp), so it can run as a CI check.
+
+Usage:
+    python benchmarks/bench_import.py --runs 10
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# (导入语句, 不允许被导入的模块)
+CASES = [
+    ('import async_smsactivate', ('aiohttp', 'requests')),
+    ('from async_smsactivate import SMSActivateAPI', ('aiohttp',)),
+    ('from async_smsactivate import AsyncSMSActivateAPI', ('requests',)),
+    ('from async_smsactivate.api import SMSActivateAPI', ('aiohttp',)),
+    ('from async_smsactivate.api import AsyncSMSActivateAPI', ('requests',)),
+    ('from async_smsactivate import SMSActivatePool', ('aiohttp', 'requests')),
+]
+
+# 子进程在仓库根目录运行，未安装本包时也能导入
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCRIPT = '''
+import sys, time
+started = time.perf_counter()
+%s
+elapsed = time.perf_counter() - started
+print(elapsed, ",".join(name for name in %r if name in sys.modules))
+'''
+
+
+def run(statement, forbidden):
+    output = subprocess.run([sys.executable, '-c', SCRIPT % (statement, forbidden)], check=True,
+                            capture_output=True, text=True, cwd=ROOT).stdout.split()
+    return float(output[0]), output[1].split(',') if len(output) > 1 else []
+
+
+def main():
+    parser = argparse.ArgumentParser(description='async_smsactivate import-time check')
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    failed = False
+    for statement, forbidden in CASES:
+        timings = []
+        leaked = []
+        for _ in range(args.runs):
+            elapsed, leaked = run(statement, forbidden)
+            timings.append(elapsed)
+        line = '%-55s median %7.1f ms  min %7.1f ms' % (statement, statistics.median(timings) * 1000,
+                                                           min(timings) * 1000)
+        if leaked:
+            failed = True
+            line += '  FAIL: imported %s' % ', '.join(leaked)
+        print(line)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
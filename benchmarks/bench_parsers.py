@@ -0,0 +1,150 @@
+"""Per-response parsing overhead: the old if/elif chain vs. the PARSERS table.
+
+Usage: python benchmarks/bench_parsers.py
+"""
+import json
+import os
+import sys
+import timeit
+
+# 未安装本包时也可以直接运行：python benchmarks/bench_parsers.py
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from async_smsactivate.parsers import ERRORS, parse_response
+
+
+# 1.5 版本中 response() 的实现，作为对比基线
+def legacy_response(action, response):
+    if ERRORS.get(response) is not None:
+        return {"error": response, "message": ERRORS.get(response)}
+    elif not str(response):
+        return {"error": response, "message": "Server error, try again"}
+
+    if action == "getNumbersStatus":
+        result = json.loads(response)
+        return result
+
+    elif action == "getBalance":
+        response = str(response[15:])
+        result = {"balance": response}
+        return result
+
+    elif action == "getBalanceAndCashBack":
+        response = str(response[15:])
+        result = {"balance": response}
+        return result
+
+    elif action == "getNumber":
+        response = str(response[14:])
+        data = response.split(":")
+        activation_id = int(data[0])
+        phone = int(data[1])
+        result = {"activation_id": activation_id, "phone": phone}
+        return result
+
+    elif action == "getNumberV2":
+        result = json.loads(response)
+        return result
+
+    elif action == "getMultiServiceNumber":
+        result = json.loads(response)
+        return result
+
+    elif action == "getPrices":
+        result = json.loads(response)
+        return result
+
+    elif action == "getCountries":
+        result = json.loads(response)
+        return result
+
+    elif action == "getQiwiRequisites":
+        result = json.loads(response)
+        return result
+
+    elif action == "getAdditionalService":
+        response = str(response[11:])
+        data = response.split(":")
+        id = int(data[0])
+        phone = int(data[1])
+        result = {"id": id, "phone": phone}
+        return result
+
+    elif action == "getRentServicesAndCountries":
+        result = json.loads(response)
+        return result
+
+    elif action == "getRentNumber":
+        result = json.loads(response)
+        return result
+
+    elif action == "getRentStatus":
+        result = json.loads(response)
+        return result
+
+    elif action == "setRentStatus":
+        result = json.loads(response)
+        return result
+    elif action == "getRentList":
+        result = json.loads(response)
+        return result
+
+    elif action == "continueRentNumber":
+        result = json.loads(response)
+        return result
+
+    elif action == "getContinueRentPriceNumber":
+        result = json.loads(response)
+        return result
+
+    elif action == "getTopCountriesByService":
+        result = json.loads(response)
+        return result
+
+    elif action == "getIncomingCallStatus":
+        result = json.loads(response)
+        return result
+
+    elif action == "getOperators":
+        result = json.loads(response)
+        return result
+
+    elif action == "getActiveActivations":
+        result = json.loads(response)
+        return result
+
+    elif action == "createTaskForCall":
+        result = json.loads(response)
+        if 'msg' in result:
+            result['message'] = result.pop('msg')
+        return result
+    elif action == "getOutgoingCalls":
+        result = json.loads(response)
+        return result
+    else:
+        return response
+
+
+SAMPLES = [
+    ("getStatus", "STATUS_WAIT_CODE"),
+    ("getStatus", "STATUS_OK:123456"),
+    ("getNumber", "ACCESS_NUMBER:1234567890:79991234567"),
+    ("getBalance", "ACCESS_BALANCE:100.00"),
+    ("setStatus", "ACCESS_CANCEL"),
+    ("getActiveActivations", '{"status": "success", "activeActivations": []}'),
+]
+
+
+def main(number=200000):
+    for action, body in SAMPLES:
+        assert legacy_response(action, body) == parse_response(action, body)
+        old = min(timeit.repeat(lambda: legacy_response(action, body), number=number, repeat=3))
+        new = min(timeit.repeat(lambda: parse_response(action, body), number=number, repeat=3))
+        print('%-22s %-40s legacy %6.0f ns  table %6.0f ns' % (
+            action, body[:40], old / number * 1e9, new / number * 1e9))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""Compare per-call ``requests.get`` with the pooled ``SMSActivateAPI`` session.
+
+Usage: python benchmarks/bench_sync_pool.py [calls]
+"""
+import os
+import sys
+import time
+
+# 未安装本包时也可以直接运行：python benchmarks/bench_sync_pool.py
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import requests
+
+from async_smsactivate.api import SMSActivateAPI
+from async_smsactivate.mock_server import MockSMSActivateServer
+
+
+def main(calls=2000):
+    server = MockSMSActivateServer()
+    url = server.start()
+    payload = {'api_key': 'bench', 'action': 'getBalance'}
+
+    started = time.perf_counter()
+    for _ in range(calls):
+        requests.get(url, params=payload).text
+    unpooled = time.perf_counter() - started
+
+    with SMSActivateAPI('bench', api_url=url) as api:
+        started = time.perf_counter()
+        for _ in range(calls):
+            api.getBalance()
+        pooled = time.perf_counter() - started
+
+    server.stop()
+    print('requests.get   : %8.1f us/call' % (unpooled / calls * 1e6))
+    print('pooled session : %8.1f us/call' % (pooled / calls * 1e6))
+    print('saved per call : %8.1f us' % ((unpooled - pooled) / calls * 1e6))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,160 @@
+"""Compare the aiohttp (HTTP/1.1) and httpx (HTTP/2) transports of ``AsyncSMSActivateAPI``.
+
+Both transports poll the same local stand-in: the mock server's handlers behind hypercorn, which
+speaks HTTP/1.1 and cleartext HTTP/2 (prior knowledge) on one port. Reports requests/sec, p50/p99
+latency and the number of TCP connections the server accepted during each run. Needs
+``pip install "httpx[http2]" hypercorn``.
+
+Usage:
+    python benchmarks/bench_transports.py --concurrency 10 100 1000 --requests 20000 --latency 0.01
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+# 未安装本包时也可以直接运行：python benchmarks/bench_transports.py
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from async_smsactivate.api import AsyncSMSActivateAPI
+from async_smsactivate.mock_server import MockSMSActivateServer
+from async_smsactivate.transport import HttpxTransport
+
+
+# --------------------------- 服务端 ---------------------------
+def serve(latency):
+    from urllib.parse import parse_qsl
+
+    from hypercorn.asyncio import serve as hypercorn_serve
+    from hypercorn.config import Config
+
+    mock = MockSMSActivateServer(latency=latency)
+    # 本轮测试中出现过的客户端 (host, port)，即服务端接受的 TCP 连接
+    peers = set()
+
+    async def app(scope, receive, send):
+        if scope['type'] == 'lifespan':
+            while True:
+                message = await receive()
+                if message['type'] == 'lifespan.startup':
+                    await send({'type': 'lifespan.startup.complete'})
+                elif message['type'] == 'lifespan.shutdown':
+                    await send({'type': 'lifespan.shutdown.complete'})
+                    return
+        if scope['path'] == '/stats':
+            status, body = 200, json.dumps({'connections': len(peers)}).encode()
+            peers.clear()
+        else:
+            peers.add(tuple(scope['client']))
+            params = dict(parse_qsl(scope['query_string'].decode('latin-1')))
+            status, body = await mock.handle(params)
+        await send({'type': 'http.response.start', 'status': status,
+                    'headers': [(b'content-type', b'text/plain; charset=utf-8'),
+                                (b'content-length', str(len(body)).encode())]})
+        await send({'type': 'http.response.body', 'body': body})
+
+    # 端口 0 无法得知实际端口，这里先取一个空闲端口
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    config = Config()
+    config.bind = ['127.0.0.1:%d' % port]
+    config.backlog = 4096
+    config.keep_alive_timeout = 60
+    # 默认每个连接处理 1000 个请求后发送 GOAWAY
+    config.keep_alive_max_requests = 10 ** 9
+    config.h2_max_concurrent_streams = 1000
+    config.accesslog = None
+    config.errorlog = None
+    print('http://127.0.0.1:%d/stubs/handler_api.php' % port, flush=True)
+    asyncio.run(hypercorn_serve(app, config))
+
+
+def start_server(latency):
+    process = subprocess.Popen([sys.executable, __file__, '--serve', '--latency', str(latency)],
+                               stdout=subprocess.PIPE, text=True)
+    url = process.stdout.readline().strip()
+    # 等待 hypercorn 开始监听
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        try:
+            accepted(url)
+            break
+        except OSError:
+            time.sleep(0.05)
+    return process, url
+
+
+def accepted(url):
+    import urllib.request
+
+    with urllib.request.urlopen(url.replace('/stubs/handler_api.php', '/stats')) as resp:
+        return json.loads(resp.read())['connections']
+
+
+# --------------------------- 客户端 ---------------------------
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+async def run(url, transport, concurrency, requests):
+    latencies = []
+    kwargs = {'limit': concurrency} if transport is None else {'transport': transport}
+    async with AsyncSMSActivateAPI('bench', api_url=url, **kwargs) as api:
+        remaining = iter(range(requests))
+
+        async def worker():
+            for _ in remaining:
+                started = time.perf_counter()
+                await api.getStatus(id=100000000)
+                latencies.append(time.perf_counter() - started)
+
+        await api.getBalance()
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    if transport is not None:
+        await transport.close()
+    return elapsed, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description='async_smsactivate transport benchmark')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--requests', type=int, default=10000)
+    parser.add_argument('--latency', type=float, default=0.01, help='simulated server latency (seconds)')
+    parser.add_argument('--max-connections', type=int, default=4, help='HTTP/2 connections for httpx')
+    parser.add_argument('--serve', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.serve:
+        serve(args.latency)
+        return
+
+    process, url = start_server(args.latency)
+    try:
+        print('%-14s %6s %10s %9s %9s %8s' % ('transport', 'conc', 'req/s', 'p50 ms', 'p99 ms', 'sockets'))
+        for concurrency in args.concurrency:
+            cases = [
+                ('aiohttp h1', lambda: None),
+                ('httpx h2', lambda: HttpxTransport(http1=False, max_connections=args.max_connections)),
+            ]
+            for name, transport in cases:
+                accepted(url)
+                elapsed, latencies = asyncio.run(run(url, transport(), concurrency, args.requests))
+                print('%-14s %6d %10.0f %9.2f %9.2f %8d' % (
+                    name, concurrency, len(latencies) / elapsed, percentile(latencies, 0.5) * 1000,
+                    percentile(latencies, 0.99) * 1000, accepted(url)))
+    finally:
+        process.terminate()
+        process.wait()
+
+
+if __name__ == '__main__':
+    main()
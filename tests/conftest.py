@@ -0,0 +1,16 @@
+import pytest
+
+from async_smsactivate.mock_server import MockSMSActivateServer
+
+
+@pytest.fixture
+def server():
+    # 模拟服务在后台线程中运行，同步与异步客户端都可以连接
+    with MockSMSActivateServer(seed=1) as server:
+        yield server
+
+
+@pytest.fixture
+def dead_url():
+    # 端口 1 上没有服务，连接会被拒绝
+    return 'http://127.0.0.1:1/stubs/handler_api.php'
@@ -0,0 +1,66 @@
+import asyncio
+import concurrent.futures
+import threading
+import time
+
+import pytest
+
+from async_smsactivate.api import AsyncSMSActivateAPI
+from async_smsactivate.blocking import BlockingSMSActivateAPI
+from async_smsactivate.deadline import DeadlineExceeded, deadline
+
+
+def test_threads_share_one_async_client(server):
+    server.latency = 0.02
+    with BlockingSMSActivateAPI('test', api_url=server.url, limit=4) as api:
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(lambda _: api.getNumber(service='vk'), range(16)))
+        assert len({result['activation_id'] for result in results}) == 16
+        id = results[0]['activation_id']
+        assert api.setStatusBatch([id], status=8) == {id: 'ACCESS_CANCEL'}
+        assert [result.ok for result in api.getNumbers('vk', 3)] == [True, True, True]
+        assert api.wait_for_code(results[1]['activation_id'], timeout=5).received
+
+
+def test_timeout_cancels_the_call(server):
+    server.latency = 2.0
+    with BlockingSMSActivateAPI('test', api_url=server.url, timeout=0.2) as api:
+        started = time.monotonic()
+        with pytest.raises(concurrent.futures.TimeoutError):
+            api.getBalance()
+        assert time.monotonic() - started < 1.0
+
+
+def test_deadline_of_the_calling_thread_applies(server):
+    server.latency = 2.0
+    with BlockingSMSActivateAPI('test', api_url=server.url) as api:
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            with deadline(0.2):
+                api.getBalance()
+        assert time.monotonic() - started < 1.0
+
+
+def test_drives_a_client_on_an_application_loop(server):
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    client = AsyncSMSActivateAPI('test', api_url=server.url)
+    api = BlockingSMSActivateAPI(api=client, loop=loop)
+    assert api.getBalance() == {'balance': '1000000.00'}
+    api.close()
+    # 传入的客户端和事件循环由调用方负责关闭
+    assert loop.is_running()
+    asyncio.run_coroutine_threadsafe(client.close(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+def test_refuses_calls_from_its_own_loop(server):
+    with BlockingSMSActivateAPI('test', api_url=server.url) as api:
+        async def inside():
+            api.getBalance()
+
+        with pytest.raises(RuntimeError):
+            api.run(inside())
@@ -0,0 +1,72 @@
+import pytest
+
+from async_smsactivate.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpen
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make(clock, **kwargs):
+    return CircuitBreaker(failure_rate=0.5, window=4, min_calls=4, open_for=10, clock=clock, **kwargs)
+
+
+def test_opens_at_failure_rate():
+    clock = Clock()
+    breaker = make(clock)
+    for status in (200, 503, 200, 503):
+        breaker.acquire('h', 'getStatus').record(0.01, status, b'x')
+    assert breaker.state('h', 'getStatus') == OPEN
+    with pytest.raises(CircuitOpen) as e:
+        breaker.acquire('h', 'getStatus')
+    assert e.value.as_error()['error'] == 'CIRCUIT_OPEN'
+    # 其他接口单独统计
+    assert breaker.state('h', 'getBalance') == CLOSED
+
+
+def test_error_codes_count_as_failures():
+    breaker = make(Clock())
+    for _ in range(4):
+        breaker.acquire('h', 'getStatus').record(0.01, 200, b'NO_CONNECTION')
+    assert breaker.state('h', 'getStatus') == OPEN
+
+
+def test_half_open_probe_closes_or_reopens():
+    clock = Clock()
+    changes = []
+    breaker = make(clock, on_state_change=lambda *change: changes.append(change[2:]))
+    for _ in range(4):
+        breaker.acquire('h', 'a').failure(0.01)
+    clock.now = 10
+    assert breaker.state('h', 'a') == HALF_OPEN
+    probe = breaker.acquire('h', 'a')
+    with pytest.raises(CircuitOpen):
+        breaker.acquire('h', 'a')
+    probe.failure(0.01)
+    assert breaker.state('h', 'a') == OPEN
+    clock.now = 20
+    breaker.acquire('h', 'a').record(0.01, 200, b'ok')
+    assert breaker.state('h', 'a') == CLOSED
+    assert changes == [(CLOSED, OPEN), (OPEN, HALF_OPEN), (HALF_OPEN, OPEN), (OPEN, HALF_OPEN), (HALF_OPEN, CLOSED)]
+
+
+def test_released_probe_is_not_counted():
+    clock = Clock()
+    breaker = make(clock)
+    for _ in range(4):
+        breaker.acquire('h', 'a').failure(0.01)
+    clock.now = 10
+    breaker.acquire('h', 'a').release()
+    assert breaker.state('h', 'a') == HALF_OPEN
+    breaker.acquire('h', 'a')
+
+
+def test_slow_calls():
+    breaker = make(Clock(), slow_call_duration=1.0)
+    for _ in range(4):
+        breaker.acquire('h', 'a').record(2.0, 200, b'ok')
+    assert breaker.state('h', 'a') == OPEN
@@ -0,0 +1,99 @@
+import asyncio
+from collections import Counter
+
+from async_smsactivate.api import AsyncSMSActivateAPI, SMSActivateAPI
+from async_smsactivate.bulk import status_updates
+
+
+def buy(server, count, stop_after=None, **kwargs):
+    async def main():
+        async with AsyncSMSActivateAPI('test', api_url=server.url) as api:
+            results = []
+            numbers = api.getNumbers('vk', count, **kwargs)
+            try:
+                async for result in numbers:
+                    results.append(result)
+                    if len(results) == stop_after:
+                        break
+            finally:
+                await numbers.aclose()
+            return results
+
+    return asyncio.run(main())
+
+
+def test_buys_requested_count(server):
+    results = buy(server, 8, concurrency=3)
+    assert sorted(result.index for result in results) == list(range(8))
+    assert all(result.ok for result in results)
+    assert len(server.activations) == 8
+
+
+def test_falls_back_to_next_country(server):
+    server.sold_out = {'0'}
+    results = buy(server, 2, countries=[0, 6])
+    assert all(result.ok for result in results)
+    assert [result.country for result in results] == [6, 6]
+    assert sorted(activation['country'] for activation in server.activations.values()) == ['6', '6']
+
+
+def test_reports_no_numbers_when_every_country_is_empty(server):
+    results = buy(server, 2, countries=[0, 6], maxPrice='5')
+    assert [result.error['error'] for result in results] == ['NO_NUMBERS', 'NO_NUMBERS']
+    assert not server.activations
+
+
+def test_account_error_stops_purchases(server):
+    server.balance = 25
+    results = buy(server, 6, concurrency=1)
+    assert Counter(result.ok for result in results) == {True: 2, False: 4}
+    assert len(server.activations) == 2
+
+
+def test_early_stop_refunds_unyielded_numbers(server):
+    server.latency = 0.01
+    results = buy(server, 20, stop_after=3, concurrency=8)
+    assert len(results) == 3
+    kept = {result.activation['activation_id'] for result in results}
+    statuses = {id: activation['status'] for id, activation in server.activations.items()}
+    # 已交给调用方的号码保留，其余已购买的号码全部取消退款
+    assert all(statuses[id] == '0' for id in kept)
+    assert all(status == '8' for id, status in statuses.items() if id not in kept)
+    assert len(statuses) < 20
+    assert server.balance == 1000000 - 10 * len(kept)
+
+
+def test_cancels_are_ordered_first_oldest_purchase_first():
+    updates = status_updates({1: 6, 2: 8, 3: 1, 4: 8}, purchased_at={2: 200.0, 4: 100.0})
+    assert updates == [(4, 8), (2, 8), (1, 6), (3, 1)]
+    assert status_updates([5, 6], status=8) == [(5, 8), (6, 8)]
+
+
+def test_status_batches_on_both_clients(server):
+    sync_api = SMSActivateAPI('test', api_url=server.url)
+    ids = [sync_api.getNumber(service='vk')['activation_id'] for _ in range(6)]
+    done, cancelled = ids[:3], ids[3:]
+    results = sync_api.setStatusBatch({**{id: 6 for id in done}, **{id: 8 for id in cancelled}}, concurrency=4)
+    assert [results[id] for id in ids] == ['ACCESS_ACTIVATION'] * 3 + ['ACCESS_CANCEL'] * 3
+    assert {id: server.activations[id]['status'] for id in ids} == {**{id: '6' for id in done},
+                                                                      **{id: '8' for id in cancelled}}
+
+    async def main():
+        async with AsyncSMSActivateAPI('test', api_url=server.url) as api:
+            return await api.getStatusBatch(ids + [1], concurrency=3)
+
+    statuses = asyncio.run(main())
+    assert list(statuses) == ids + [1]
+    assert [statuses[id]['error'] for id in cancelled + [1]] == ['STATUS_CANCEL'] * 3 + ['NO_ACTIVATION']
+    assert [status['error'] for status in sync_api.getStatusBatch(cancelled).values()] == ['STATUS_CANCEL'] * 3
+
+
+def test_network_errors_become_error_dicts(dead_url):
+    results = SMSActivateAPI('test', api_url=dead_url).getStatusBatch([1, 2])
+    assert [result['error'] for result in results.values()] == ['ConnectionError', 'ConnectionError']
+
+    async def main():
+        async with AsyncSMSActivateAPI('test', api_url=dead_url) as api:
+            return await api.setStatusBatch([1, 2], status=8)
+
+    assert [result['error'] for result in asyncio.run(main()).values()] == ['ClientConnectorError'] * 2
@@ -0,0 +1,101 @@
+import asyncio
+
+from async_smsactivate.api import AsyncSMSActivateAPI
+from async_smsactivate.cache import CatalogCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def run(server, cache, scenario):
+    async def main():
+        async with AsyncSMSActivateAPI('test', api_url=server.url, cache=cache) as api:
+            return await scenario(api)
+
+    return asyncio.run(main())
+
+
+def test_concurrent_misses_share_one_request(server):
+    server.latency = 0.05
+    cache = CatalogCache()
+
+    async def scenario(api):
+        return await asyncio.gather(*(api.getCountries() for _ in range(50)))
+
+    results = run(server, cache, scenario)
+    assert all(result is results[0] for result in results)
+    assert server.requests == 1
+    assert (cache.hits, cache.misses) == (0, 50)
+
+
+def test_entries_expire_after_ttl(server):
+    clock = Clock()
+    cache = CatalogCache(ttls={'getCountries': 10}, clock=clock)
+
+    async def scenario(api):
+        await api.getCountries()
+        clock.now = 9
+        await api.getCountries()
+        clock.now = 11
+        await api.getCountries()
+        # 未缓存的接口、不同的参数各自请求
+        await api.getBalance()
+        await api.getOperators(country=0)
+
+    run(server, cache, scenario)
+    assert server.requests == 4
+    assert cache.hits == 1
+
+
+def test_stale_entry_is_served_while_refreshing(server):
+    clock = Clock()
+    cache = CatalogCache(ttls={'getCountries': 10}, stale_while_revalidate=30, clock=clock)
+
+    async def scenario(api):
+        first = await api.getCountries()
+        clock.now = 20
+        server.latency = 0.05
+        stale = await api.getCountries()
+        await asyncio.sleep(0.2)
+        fresh = await api.getCountries()
+        return first, stale, fresh
+
+    first, stale, fresh = run(server, cache, scenario)
+    assert stale is first
+    assert fresh is not first and fresh == first
+    assert server.requests == 2
+
+
+def test_errors_are_not_cached(server):
+    cache = CatalogCache()
+
+    async def scenario(api):
+        server.error_rate = 1.0
+        error = await api.getCountries()
+        server.error_rate = 0.0
+        return error, await api.getCountries()
+
+    error, countries = run(server, cache, scenario)
+    assert error['error'] == 'NO_CONNECTION'
+    assert '0' in countries
+    assert server.requests == 2
+
+
+def test_lru_bound_and_invalidate(server):
+    cache = CatalogCache(max_entries=2)
+
+    async def scenario(api):
+        for country in (0, 1, 2):
+            await api.getOperators(country=country)
+        await api.getOperators(country=0)
+        cache.invalidate('getOperators')
+        await api.getOperators(country=2)
+
+    run(server, cache, scenario)
+    # 0 被挤出后重新请求；invalidate 之后 2 也重新请求
+    assert server.requests == 5
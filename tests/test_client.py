@@ -0,0 +1,140 @@
+import asyncio
+import time
+
+import aiohttp
+import pytest
+import requests
+
+from async_smsactivate.api import AsyncSMSActivateAPI, SMSActivateAPI
+from async_smsactivate.breaker import CircuitBreaker
+from async_smsactivate.metrics import InMemoryMetrics
+from async_smsactivate.retry import RetryPolicy
+from async_smsactivate.transport import HttpxTransport
+
+
+def call(server, action, **kwargs):
+    async def main():
+        async with AsyncSMSActivateAPI('test', api_url=server.url, **kwargs) as api:
+            return await getattr(api, action)()
+
+    return asyncio.run(main())
+
+
+def test_async_and_sync_clients(server):
+    assert call(server, 'getBalance') == {'balance': '1000000.00'}
+    assert SMSActivateAPI('test', api_url=server.url).getBalance() == {'balance': '1000000.00'}
+
+
+def test_sync_client_has_default_timeouts(server):
+    assert SMSActivateAPI('test').timeout == (10.0, 30.0)
+    server.latency = 0.5
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        SMSActivateAPI('test', api_url=server.url, timeout=(1.0, 0.1)).getBalance()
+
+
+def test_http_error_is_returned_before_parsing(server):
+    server.http_error_rate = 1.0
+    for action in ('getBalance', 'getNumber', 'getPrices'):
+        assert call(server, action)['error'] == 'HTTP_503'
+    assert SMSActivateAPI('test', api_url=server.url).getPrices()['error'] == 'HTTP_503'
+
+
+def test_retry_until_answer(server):
+    server.error_rate = 0.5
+    metrics = InMemoryMetrics()
+    policy = RetryPolicy(max_attempts=10, base_delay=0.001)
+    for _ in range(5):
+        assert call(server, 'getBalance', retry_policy=policy, metrics=metrics) == {'balance': '1000000.00'}
+    snapshot = metrics.snapshot()
+    assert snapshot['requests']['getBalance'] == server.requests
+    assert snapshot['errors'].get(('getBalance', 'NO_CONNECTION'), 0) == server.requests - 5
+    assert snapshot['in_flight']['getBalance'] == 0
+
+
+def test_failover_to_live_mirror(server, dead_url):
+    api = SMSActivateAPI('test', api_urls=[dead_url, server.url])
+    assert api.getBalance() == {'balance': '1000000.00'}
+    snapshot = api.mirrors.snapshot()
+    assert snapshot[server.url]['requests'] == 1
+
+    async def main():
+        async with AsyncSMSActivateAPI('test', api_urls=api.mirrors) as client:
+            return [await client.getBalance() for _ in range(3)]
+
+    assert asyncio.run(main()) == [{'balance': '1000000.00'}] * 3
+    assert snapshot[dead_url]['failures'] == 1
+
+
+def test_open_circuit_refuses_requests(server):
+    server.http_error_rate = 1.0
+    breaker = CircuitBreaker(window=2, min_calls=2, open_for=60)
+    results = [call(server, 'getBalance', circuit_breaker=breaker)['error'] for _ in range(4)]
+    assert results == ['HTTP_503', 'HTTP_503', 'CIRCUIT_OPEN', 'CIRCUIT_OPEN']
+    assert server.requests == 2
+
+
+def wait(server, schedule, timeout=5.0, cancel=False):
+    async def main():
+        async with AsyncSMSActivateAPI('test', api_url=server.url) as api:
+            number = await api.getNumber(service='vk')
+            if cancel:
+                await api.setStatus(id=number['activation_id'], status=8)
+            server.error_rate = 0.5
+            return await api.wait_for_code(number['activation_id'], timeout=timeout, schedule=schedule)
+
+    return asyncio.run(main())
+
+
+def test_wait_for_code_repeats_last_delay(server):
+    server.code_delay = 0.2
+    status = wait(server, [0.01, 0.05])
+    assert status.received
+
+
+def test_wait_for_code_polls_through_transient_errors(server):
+    server.code_delay = 0.2
+    assert wait(server, [0.02]).received
+
+
+def test_wait_for_code_returns_terminal_error(server):
+    assert wait(server, [0.02], cancel=True)['error'] == 'STATUS_CANCEL'
+
+
+def test_wait_for_code_timeout(server):
+    server.code_delay = 60
+    with pytest.raises(asyncio.TimeoutError):
+        wait(server, [0.02], timeout=0.1)
+
+
+def test_wait_for_code_retries_network_errors_until_timeout(dead_url):
+    async def main():
+        async with AsyncSMSActivateAPI('test', api_url=dead_url) as api:
+            started = time.monotonic()
+            with pytest.raises(asyncio.TimeoutError):
+                await api.wait_for_code(1, timeout=0.3, schedule=[0.02])
+            return time.monotonic() - started
+
+    assert 0.25 < asyncio.run(main()) < 1.0
+
+
+def test_wait_for_code_timeout_bounds_a_slow_poll(server):
+    server.code_delay = 60
+    server.latency = 2.0
+    started = time.monotonic()
+    with pytest.raises(asyncio.TimeoutError):
+        wait(server, [0.02], timeout=0.5)
+    # getNumber 本身也要等待 2 秒
+    assert time.monotonic() - started < 3.5
+
+
+def test_session_only_exists_for_aiohttp():
+    async def main():
+        async with AsyncSMSActivateAPI('test') as api:
+            assert isinstance(api.session, aiohttp.ClientSession)
+        transport = HttpxTransport()
+        api = AsyncSMSActivateAPI('test', transport=transport)
+        assert not hasattr(api, 'session')
+        await transport.close()
+
+    pytest.importorskip('httpx')
+    asyncio.run(main())
@@ -0,0 +1,69 @@
+import asyncio
+import importlib
+import time
+
+import aiohttp
+import pytest
+
+import async_smsactivate
+from async_smsactivate.api import AsyncSMSActivateAPI, SMSActivateAPI
+from async_smsactivate.deadline import DeadlineExceeded, bounded_timeout, deadline, remaining
+from async_smsactivate.retry import RetryPolicy
+
+
+def test_package_exports_the_function_not_the_module():
+    importlib.import_module('async_smsactivate.deadline')
+    assert async_smsactivate.deadline is deadline
+    from async_smsactivate import deadline as exported
+    assert exported is deadline
+
+
+def test_nested_blocks_only_shorten_the_budget():
+    assert remaining() is None
+    with deadline(10):
+        with deadline(60):
+            assert remaining() <= 10
+        with deadline(1):
+            assert remaining() <= 1
+    assert remaining() is None
+    assert bounded_timeout((10.0, 30.0), 2.0) == (2.0, 2.0)
+    assert bounded_timeout(None, 2.0) == 2.0
+
+
+def test_async_block_cancels_a_slow_request(server):
+    server.latency = 2.0
+
+    async def main():
+        async with AsyncSMSActivateAPI('test', api_url=server.url) as api:
+            started = time.monotonic()
+            with pytest.raises(DeadlineExceeded):
+                async with deadline(0.3):
+                    await api.getBalance()
+            return time.monotonic() - started
+
+    assert asyncio.run(main()) < 1.0
+
+
+def test_sync_requests_are_bounded(server):
+    server.latency = 2.0
+    api = SMSActivateAPI('test', api_url=server.url)
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        with deadline(0.3):
+            api.getBalance()
+    assert time.monotonic() - started < 1.0
+
+
+def test_retries_stop_at_the_deadline(dead_url):
+    policy = RetryPolicy(max_attempts=50, base_delay=0.2, max_delay=0.2, deadline=None, rand=lambda: 1.0)
+
+    async def main():
+        async with AsyncSMSActivateAPI('test', api_url=dead_url, retry_policy=policy) as api:
+            started = time.monotonic()
+            # 下一次退避会超出预算时不再重试，抛出最后一次的网络错误
+            with pytest.raises((aiohttp.ClientError, asyncio.TimeoutError)):
+                async with deadline(0.5):
+                    await api.getBalance()
+            return time.monotonic() - started
+
+    assert asyncio.run(main()) < 1.0
@@ -0,0 +1,33 @@
+import inspect
+
+from async_smsactivate import endpoints
+from async_smsactivate.api import AsyncSMSActivateAPI, SMSActivateAPI
+from async_smsactivate.blocking import BlockingSMSActivateAPI
+
+
+def test_generated_module_is_up_to_date():
+    assert endpoints.main(['--check']) == 0
+
+
+def test_every_endpoint_is_a_method():
+    for endpoint in endpoints.ENDPOINTS:
+        for client in (SMSActivateAPI, AsyncSMSActivateAPI, BlockingSMSActivateAPI):
+            method = getattr(client, endpoint.action)
+            assert [name for name in inspect.signature(method).parameters][1:] == [
+                param.name for param in endpoint.params], (client, endpoint.action)
+        assert inspect.iscoroutinefunction(getattr(AsyncSMSActivateAPI, endpoint.action))
+
+
+def test_request_params():
+    sent = []
+
+    class Recorder(SMSActivateAPI):
+        def _request(self, action, params):
+            sent.append(params)
+
+    api = Recorder('test')
+    api.getPrices(country=0)
+    api.continueRentNumber(5, time='4')
+    api.createTaskForCall(7)
+    assert sent == [{'action': 'getPrices', 'country': 0}, {'action': 'continueRentNumber', 'id': 5, 'rent_time': '4'},
+                    {'action': 'createTaskForCall', 'activationId': 7}]
@@ -0,0 +1,33 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import async_smsactivate
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.parametrize('statement, forbidden', [
+    ('import async_smsactivate', ('aiohttp', 'requests')),
+    ('from async_smsactivate import SMSActivateAPI', ('aiohttp',)),
+    ('from async_smsactivate import AsyncSMSActivateAPI', ('requests',)),
+    ('from async_smsactivate.api import SMSActivateAPI', ('aiohttp',)),
+    ('from async_smsactivate import SMSActivatePool, RetryPolicy, deadline', ('aiohttp', 'requests')),
+])
+def test_imports_only_what_is_used(statement, forbidden):
+    # 每种导入方式都在新的解释器中检查
+    script = '%s\nimport sys\nprint(",".join(name for name in %r if name in sys.modules))' % (statement, forbidden)
+    output = subprocess.run([sys.executable, '-c', script], check=True, capture_output=True, text=True,
+                            cwd=ROOT).stdout.strip()
+    assert output == ''
+
+
+def test_every_export_resolves():
+    for name in async_smsactivate.__all__:
+        value = getattr(async_smsactivate, name)
+        assert getattr(value, '__name__', name) == name or name == 'API_URL'
+    assert set(async_smsactivate.__all__) <= set(dir(async_smsactivate))
+    with pytest.raises(AttributeError):
+        async_smsactivate.NoSuchName
@@ -0,0 +1,93 @@
+from async_smsactivate.journal import ActivationJournal
+
+
+def test_replay_keeps_open_activations(tmp_path):
+    path = tmp_path / 'journal.jsonl'
+    with ActivationJournal(path) as journal:
+        journal.purchased(1, 79000000001, 'vk', 0)
+        journal.purchased(2, 79000000002, 'vk', 0)
+        journal.code(1, '123456')
+        journal.code(1, '123456')
+        journal.status(2, 8)
+    journal = ActivationJournal(path)
+    assert list(journal.entries) == ['1']
+    assert journal.entries['1'].codes == ['123456']
+    assert journal.entries['1'].phone == 79000000001
+
+
+def test_torn_last_line_is_dropped(tmp_path):
+    path = tmp_path / 'journal.jsonl'
+    with ActivationJournal(path) as journal:
+        journal.purchased(1)
+    with open(path, 'a') as f:
+        f.write('{"op": "buy", "id": "2"')
+    journal = ActivationJournal(path)
+    assert list(journal.entries) == ['1']
+    journal.purchased(3)
+    journal.close()
+    assert list(ActivationJournal(path).entries) == ['1', '3']
+
+
+def test_observe_client_results(tmp_path):
+    path = tmp_path / 'journal.jsonl'
+    with ActivationJournal(path) as journal:
+        journal.observe('getNumber', {'service': 'vk', 'country': '0'}, {'activation_id': 5, 'phone': 7900})
+        journal.observe('getNumber', {'service': 'vk'}, {'error': 'NO_NUMBERS', 'message': ''})
+        journal.observe('getStatus', {'id': 5}, 'STATUS_OK:777777')
+        journal.observe('getNumberV2', {'service': 'vk'}, {'activationId': 6, 'phoneNumber': '7901'})
+        journal.observe('getStatus', {'id': 6}, {'error': 'STATUS_CANCEL', 'message': ''})
+    journal = ActivationJournal(path)
+    assert list(journal.entries) == ['5']
+    assert journal.entries['5'].codes == ['777777']
+    assert journal.entries['5'].service == 'vk'
+
+
+def test_compaction(tmp_path):
+    path = tmp_path / 'journal.jsonl'
+    journal = ActivationJournal(path, compact_min_lines=20, compact_ratio=2)
+    for id in range(30):
+        journal.purchased(id)
+        if id % 3:
+            journal.status(id, 6)
+    journal.flush()
+    assert journal.last_error is None
+    lines = path.read_text().splitlines()
+    assert len(lines) < 50
+    journal.compact()
+    assert len(path.read_text().splitlines()) == len(journal) == 10
+    journal.close()
+    assert sorted(ActivationJournal(path).entries, key=int) == [str(id) for id in range(0, 30, 3)]
+
+
+def test_one_daemon_writer_thread(tmp_path):
+    journal = ActivationJournal(tmp_path / 'journal.jsonl')
+    writer = journal._writer
+    assert writer.daemon and writer.is_alive()
+    for id in range(3):
+        journal.purchased(id)
+        journal.flush()
+        # 空闲后的下一次写入沿用同一个线程
+        assert journal._writer is writer
+    journal.close()
+    assert not writer.is_alive()
+    journal.purchased(3)
+    journal.close()
+    assert list(ActivationJournal(tmp_path / 'journal.jsonl').entries) == ['0', '1', '2', '3']
+
+
+def test_failed_compaction_keeps_pending_lines(tmp_path):
+    path = tmp_path / 'journal.jsonl'
+    journal = ActivationJournal(path)
+    journal.purchased(1)
+    journal.flush()
+    # 临时文件无法创建，压缩必然失败
+    (tmp_path / 'journal.jsonl.tmp').mkdir()
+    with journal._lock:
+        journal._pending.append(journal._dumps({"op": "buy", "id": "2"}))
+        journal._apply({"op": "buy", "id": "2"})
+        journal._compact_requested = True
+        journal._wake()
+    journal.flush()
+    assert isinstance(journal.last_error, OSError)
+    journal.close()
+    assert list(ActivationJournal(path).entries) == ['1', '2']
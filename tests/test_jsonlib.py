@@ -0,0 +1,50 @@
+import asyncio
+import json
+
+import pytest
+
+from async_smsactivate import jsonlib
+from async_smsactivate.api import AsyncSMSActivateAPI, SMSActivateAPI
+from async_smsactivate.jsonlib import get_loads
+
+
+@pytest.mark.parametrize('name', ['orjson', 'msgspec', 'ujson', 'json'])
+def test_backends_accept_str_and_bytes(name):
+    if name != 'json':
+        pytest.importorskip(name)
+    loads = get_loads(name)
+    assert loads('{"a": [1, "б"]}') == loads('{"a": [1, "б"]}'.encode()) == {'a': [1, 'б']}
+
+
+def test_auto_skips_missing_backends(monkeypatch):
+    def missing():
+        raise ImportError
+
+    backends = dict(jsonlib.BACKENDS, orjson=missing, msgspec=missing, ujson=missing)
+    monkeypatch.setattr(jsonlib, 'BACKENDS', backends)
+    assert get_loads('auto') is json.loads
+    assert get_loads(None) is json.loads
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        get_loads('simdjson')
+
+
+def test_clients_parse_with_the_chosen_backend(server):
+    calls = []
+
+    def loads(data):
+        calls.append(type(data))
+        return json.loads(data)
+
+    prices = SMSActivateAPI('test', api_url=server.url, json_backend=loads).getPrices(service='vk', country=0)
+    assert set(prices) == {'0'}
+
+    async def main():
+        async with AsyncSMSActivateAPI('test', api_url=server.url, json_backend=loads) as api:
+            return await api.getPrices(service='vk', country=0)
+
+    assert asyncio.run(main()) == prices
+    # 响应体直接以 bytes 交给解析函数，不先解码为 str
+    assert calls == [bytes, bytes]
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from async_smsactivate.api import AsyncSMSActivateAPI, SMSActivateAPI
+from async_smsactivate.metrics import (LATENCY_BUCKETS, CallbackSink, InMemoryMetrics, MultiSink,
+                                       OpenTelemetrySink, PrometheusSink)
+
+
+def test_in_memory_metrics_from_both_clients(server):
+    metrics = InMemoryMetrics()
+    api = SMSActivateAPI('test', api_url=server.url, metrics=metrics)
+    api.getBalance()
+    server.error_rate = 1.0
+    api.getBalance()
+    server.error_rate = 0.0
+
+    async def main():
+        async with AsyncSMSActivateAPI('test', api_url=server.url, metrics=metrics) as api:
+            await asyncio.gather(*(api.getNumber(service='vk') for _ in range(3)))
+
+    asyncio.run(main())
+    snapshot = metrics.snapshot()
+    assert snapshot['requests'] == {'getBalance': 2, 'getNumber': 3}
+    assert snapshot['errors'] == {('getBalance', 'NO_CONNECTION'): 1}
+    assert snapshot['in_flight'] == {'getBalance': 0, 'getNumber': 0}
+    assert snapshot['bytes_received']['getBalance'] == len(b'ACCESS_BALANCE:1000000.00') + len(b'NO_CONNECTION')
+    assert sum(snapshot['latency_buckets']['getNumber']) == 3
+    assert len(snapshot['latency_buckets']['getNumber']) == len(LATENCY_BUCKETS) + 1
+    assert snapshot['latency_sum']['getNumber'] > 0
+
+
+def test_network_failures_are_labelled_with_the_exception(dead_url):
+    calls = []
+    sink = MultiSink(InMemoryMetrics(), CallbackSink(lambda *args: calls.append(args), calls.append))
+    with pytest.raises(Exception):
+        SMSActivateAPI('test', api_url=dead_url, metrics=sink).getBalance()
+    assert calls[0] == 'getBalance'
+    action, latency, status, error, received = calls[1]
+    assert (action, status, error, received) == ('getBalance', None, 'ConnectionError', 0)
+    assert sink.sinks[0].snapshot()['errors'] == {('getBalance', 'ConnectionError'): 1}
+
+
+def test_http_errors_are_labelled_with_the_status(server):
+    metrics = InMemoryMetrics()
+    server.http_error_rate = 1.0
+    SMSActivateAPI('test', api_url=server.url, metrics=metrics).getBalance()
+    assert metrics.snapshot()['errors'] == {('getBalance', 'HTTP_503'): 1}
+
+
+class Instrument:
+    def __init__(self, name):
+        self.name = name
+        self.points = []
+
+    def add(self, value, attributes):
+        self.points.append((value, attributes))
+
+    record = add
+
+
+class Meter:
+    def __init__(self):
+        self.instruments = {}
+
+    def create(self, name, **kwargs):
+        return self.instruments.setdefault(name, Instrument(name))
+
+    create_counter = create_histogram = create_up_down_counter = create
+
+
+def test_open_telemetry_sink(server):
+    meter = Meter()
+    server.error_rate = 1.0
+    SMSActivateAPI('test', api_url=server.url, metrics=OpenTelemetrySink(meter)).getBalance()
+    points = {name: instrument.points for name, instrument in meter.instruments.items()}
+    assert points['smsactivate.requests'] == [(1, {'action': 'getBalance'})]
+    assert points['smsactivate.errors'] == [(1, {'action': 'getBalance', 'error': 'NO_CONNECTION'})]
+    assert [value for value, _ in points['smsactivate.requests.in_flight']] == [1, -1]
+    assert points['smsactivate.received'] == [(len(b'NO_CONNECTION'), {'action': 'getBalance'})]
+
+
+def test_prometheus_sink(server):
+    prometheus_client = pytest.importorskip('prometheus_client')
+    registry = prometheus_client.CollectorRegistry()
+    SMSActivateAPI('test', api_url=server.url, metrics=PrometheusSink(registry)).getBalance()
+    assert registry.get_sample_value('smsactivate_requests_total', {'action': 'getBalance'}) == 1
+    assert registry.get_sample_value('smsactivate_requests_in_flight', {'action': 'getBalance'}) == 0
@@ -0,0 +1,92 @@
+import pytest
+
+from async_smsactivate.breaker import CircuitBreaker, CircuitOpen
+from async_smsactivate.dispatch import Dispatch
+from async_smsactivate.mirrors import MirrorSelector
+from async_smsactivate.retry import RetryPolicy
+
+A = 'https://a.example/stubs/handler_api.php'
+B = 'https://b.example/stubs/handler_api.php'
+
+
+def selector(**kwargs):
+    return MirrorSelector([A, B], explore=0, clock=lambda: 0.0, **kwargs)
+
+
+def test_prefers_fastest_mirror():
+    mirrors = selector()
+    mirrors.record(A, 0.5, False)
+    mirrors.record(B, 0.1, False)
+    assert mirrors.choose() == B
+    assert mirrors.choose(exclude=[B]) == A
+    assert mirrors.choose(exclude=[A, B]) is None
+
+
+def test_failing_mirror_is_skipped():
+    mirrors = selector(error_threshold=0.3)
+    mirrors.record(A, 0.1, False)
+    mirrors.record(B, 0.5, False)
+    mirrors.record(A, 0.1, True)
+    mirrors.record(A, 0.1, True)
+    assert not mirrors.snapshot()[A]['healthy']
+    assert mirrors.choose() == B
+
+
+def test_never_succeeded_mirror_goes_last_after_failing():
+    mirrors = selector()
+    mirrors.record(A, 1.0, True)
+    mirrors.record(B, 2.0, False)
+    assert mirrors.choose() == B
+
+
+def dispatch(action='getStatus', mirrors=None, breaker=None, policy=None):
+    return Dispatch(action, A, 'a.example', mirrors, breaker, policy, None)
+
+
+def test_dispatch_without_mirrors_or_policy_returns_first_answer():
+    d = dispatch()
+    assert d.start() == A
+    d.sending()
+    assert d.answered(503, b'') is None
+
+
+def test_dispatch_fails_over_then_retries():
+    d = dispatch(mirrors=selector(), policy=RetryPolicy(max_attempts=2, base_delay=0.5, rand=lambda: 1.0))
+    first = d.start()
+    d.sending()
+    assert d.answered(503, b'') == 0.0
+    second = d.start()
+    assert {first, second} == {A, B}
+    d.sending()
+    assert d.answered(200, b'NO_CONNECTION') == 0.5
+    # 重试时重新从两个镜像中选择，全部失败且重试次数用完后返回最后的结果
+    d.start()
+    d.sending()
+    assert d.answered(200, b'NO_CONNECTION') == 0.0
+    d.start()
+    d.sending()
+    assert d.answered(200, b'NO_CONNECTION') is None
+
+
+def test_dispatch_does_not_fail_over_unsafe_purchase():
+    d = dispatch('getNumber', mirrors=selector())
+    d.start()
+    d.sending()
+    # 读取超时：无法确定是否已经扣费
+    assert d.failed(TimeoutError(), unsent=False) is None
+    d = dispatch('getNumber', mirrors=selector())
+    d.start()
+    d.sending()
+    assert d.failed(ConnectionRefusedError(), unsent=True) == 0.0
+
+
+def test_dispatch_skips_open_circuit():
+    breaker = CircuitBreaker(window=1, min_calls=1, open_for=60)
+    breaker.acquire('a.example', 'getStatus').failure(0.1)
+    mirrors = MirrorSelector([A, B], explore=0)
+    mirrors.record(A, 0.01, False)
+    d = dispatch(mirrors=mirrors, breaker=breaker)
+    assert d.start() == B
+    breaker.acquire('b.example', 'getStatus').failure(0.1)
+    with pytest.raises(CircuitOpen):
+        dispatch(mirrors=mirrors, breaker=breaker).start()
@@ -0,0 +1,31 @@
+import asyncio
+import logging
+
+from async_smsactivate.api import AsyncSMSActivateAPI
+from async_smsactivate.mock_server import MockSMSActivateServer
+
+
+def test_stop_cancels_connection_handlers(caplog):
+    async def main():
+        async with MockSMSActivateServer(latency=0.05) as server:
+            api = AsyncSMSActivateAPI('test', api_url=server.url)
+            assert await api.getBalance() == {'balance': '1000000.00'}
+            # 服务停止时仍在处理中的请求
+            pending = asyncio.ensure_future(api.getBalance())
+            await asyncio.sleep(0.01)
+        assert not server._tasks
+        pending.cancel()
+        await asyncio.gather(pending, return_exceptions=True)
+        await api.close()
+
+    with caplog.at_level(logging.ERROR, logger='asyncio'):
+        asyncio.run(main())
+    assert not caplog.records
+
+
+def test_handle_counts_requests():
+    server = MockSMSActivateServer(api_key='secret')
+    assert asyncio.run(server.handle({'action': 'getBalance', 'api_key': 'secret'})) == (200, b'ACCESS_BALANCE:1000000.00')
+    assert asyncio.run(server.handle({'action': 'getBalance', 'api_key': 'wrong'})) == (200, b'BAD_KEY')
+    assert asyncio.run(server.handle({'action': 'nope', 'api_key': 'secret'})) == (200, b'BAD_ACTION')
+    assert server.requests == 3
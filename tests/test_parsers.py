@@ -0,0 +1,57 @@
+import json
+
+from async_smsactivate.models import ActivationStatus, parse_operators, parse_prices, to_plain
+from async_smsactivate.parsers import TYPED_PARSERS, http_error, parse_response, parse_status
+
+
+def test_balance():
+    assert parse_response('getBalance', b'ACCESS_BALANCE:12.50') == {'balance': '12.50'}
+
+
+def test_number():
+    assert parse_response('getNumber', b'ACCESS_NUMBER:123:79000000000') == {'activation_id': 123,
+                                                                             'phone': 79000000000}
+
+
+def test_error_code():
+    assert parse_response('getNumber', b'NO_NUMBERS')['error'] == 'NO_NUMBERS'
+    assert parse_response('getPrices', b'BAD_KEY')['error'] == 'BAD_KEY'
+
+
+def test_empty_body():
+    assert parse_response('getBalance', b'')['error'] == ''
+
+
+def test_json_action():
+    assert parse_response('getPrices', b'{"0": {"vk": {"cost": 1.5, "count": 10}}}') == {
+        '0': {'vk': {'cost': 1.5, 'count': 10}}}
+
+
+def test_status():
+    assert parse_response('getStatus', b'STATUS_OK:123456') == 'STATUS_OK:123456'
+    status = parse_response('getStatus', b'STATUS_OK:123456', parsers=TYPED_PARSERS)
+    assert isinstance(status, ActivationStatus)
+    assert status.received and status.code == '123456'
+    assert not parse_status('STATUS_WAIT_CODE').received
+
+
+def test_http_error():
+    assert http_error(200) is None
+    assert http_error(503) == {'error': 'HTTP_503', 'message': 'Server responded with HTTP 503'}
+
+
+def test_typed_operators_match_plain_result():
+    body = b'{"status": "success", "countryOperators": {"0": ["mts", "beeline"], "6": ["mts"]}}'
+    typed = parse_operators(body, json.loads)
+    assert typed.to_dict() == parse_response('getOperators', body)
+    assert json.dumps(typed.to_dict()['countryOperators']) == '{"0": ["mts", "beeline"], "6": ["mts"]}'
+    operators = typed['countryOperators']
+    assert operators['0'] == ('mts', 'beeline')
+    # 相同的运营商名称只保存一份
+    assert operators['0'][0] is operators['6'][0]
+
+
+def test_typed_prices_convert_to_plain_json():
+    body = b'{"0": {"vk": {"cost": 10, "count": 5}}}'
+    typed = parse_prices(body, json.loads)
+    assert json.loads(json.dumps(to_plain(typed))) == json.loads(body)
@@ -0,0 +1,63 @@
+import asyncio
+
+from async_smsactivate.pool import AsyncSMSActivatePool, SMSActivatePool
+
+
+def test_calls_spread_over_keys_and_ids_stay_pinned(server):
+    with SMSActivatePool(['a', 'b', 'c'], api_url=server.url) as pool:
+        ids = [pool.getNumber(service='vk')['activation_id'] for _ in range(6)]
+        assert [state.requests for state in pool.states.values()] == [2, 2, 2]
+        owners = [pool.key_for(id) for id in ids]
+        assert owners == ['a', 'b', 'c', 'a', 'b', 'c']
+        before = {key: state.requests for key, state in pool.states.items()}
+        pool.getStatus(ids[1])
+        pool.setStatus(ids[1], status=8)
+        after = {key: state.requests for key, state in pool.states.items()}
+        assert after == dict(before, b=before['b'] + 2)
+        # 结束激活后解除绑定
+        assert pool.key_for(ids[1]) is None
+
+
+def test_unknown_id_is_looked_up_on_every_key(server):
+    with SMSActivatePool(['a', 'b'], api_url=server.url) as pool:
+        assert pool.getStatus(1)['error'] == 'NO_ACTIVATION'
+        assert server.requests == 2
+
+
+def test_rejected_key_leaves_rotation(server):
+    server.api_key = 'good'
+    with SMSActivatePool(['bad', 'good'], api_url=server.url) as pool:
+        assert pool.getBalance() == {'balance': '1000000.00'}
+        assert pool.active_keys == ['good']
+        assert pool.states['bad'].disabled == 'BAD_KEY'
+        pool.disable('good', 'BANNED')
+        assert pool.getBalance()['error'] == 'BAD_KEY'
+
+
+def test_empty_balance_recovers_after_refresh(server):
+    with SMSActivatePool(['a', 'b'], strategy='balance', balance_ttl=0, api_url=server.url) as pool:
+        server.balance = 0
+        assert pool.getNumber(service='vk')['error'] == 'NO_BALANCE'
+        assert pool.active_keys == []
+        assert pool.getNumber(service='vk')['error'] == 'NO_BALANCE'
+        server.balance = 100
+        activation = pool.getNumber(service='vk')
+        assert 'activation_id' in activation
+        assert pool.active_keys == ['a', 'b']
+        assert pool.states['a'].balance == 100
+
+
+def test_async_pool(server):
+    server.latency = 0.02
+
+    async def main():
+        async with AsyncSMSActivatePool(['a', 'b'], api_url=server.url) as pool:
+            activations = await asyncio.gather(*(pool.getNumber(service='vk') for _ in range(10)))
+            ids = [activation['activation_id'] for activation in activations]
+            statuses = await asyncio.gather(*(pool.getStatus(id) for id in ids))
+            return pool, ids, statuses
+
+    pool, ids, statuses = asyncio.run(main())
+    assert sorted(pool.key_for(id) for id in ids) == ['a'] * 5 + ['b'] * 5
+    assert all(status == 'STATUS_WAIT_CODE' or status.startswith('STATUS_OK') for status in statuses)
+    assert server.requests == 20
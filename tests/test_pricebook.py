@@ -0,0 +1,63 @@
+import asyncio
+
+from async_smsactivate.api import AsyncSMSActivateAPI
+from async_smsactivate.pricebook import PriceBook
+
+
+def refresh(server, book, **kwargs):
+    async def main():
+        async with AsyncSMSActivateAPI('test', api_url=server.url) as api:
+            await book.refresh(api, **kwargs)
+
+    asyncio.run(main())
+
+
+def test_refresh_indexes_cheapest_offers(server):
+    server.countries, server.services = 20, 5
+    book = PriceBook()
+    refresh(server, book)
+    assert len(book) == 100
+    offers = book.cheapest('vk', n=3)
+    costs = [offer.cost for offer in offers]
+    assert costs == sorted(costs)
+    assert costs[0] == min(book.get('vk', country).cost for country in range(20))
+
+
+def test_full_refresh_drops_vanished_offers(server):
+    server.countries, server.services = 3, 2
+    book = PriceBook()
+    refresh(server, book)
+    assert book.get('vk', 2) is not None
+    server.countries = 2
+    server._prices = None
+    refresh(server, book)
+    assert book.get('vk', 2) is None
+    assert len(book) == 4
+
+
+def test_scoped_refresh_keeps_offers_outside_its_scope():
+    book = PriceBook()
+    book.update_prices({'0': {'vk': {'cost': 10, 'count': 5}, 'tg': {'cost': 12, 'count': 5}},
+                        '6': {'vk': {'cost': 8, 'count': 5}}})
+    book.update_prices({'0': {'vk': {'cost': 11, 'count': 3}}}, service='vk')
+    assert book.get('vk', 6) is None
+    assert book.get('tg', 0).cost == 12
+    assert book.get('vk', 0).cost == 11
+
+
+def test_operator_counts_do_not_duplicate_countries():
+    book = PriceBook()
+    book.update_prices({'0': {'vk': {'cost': 10, 'count': 50}}, '6': {'vk': {'cost': 12, 'count': 50}}})
+    book.update_numbers_status({'vk_0': '7', 'vk_1': '9'}, country=0, operator='mts')
+    assert book.get('vk', 0, operator='mts').count == 7
+    assert [offer.country for offer in book.cheapest('vk', n=5)] == ['0', '6']
+    # 全国库存不足时退回有库存的运营商报价
+    assert [(offer.country, offer.operator) for offer in book.cheapest('vk', n=5, min_count=60)] == []
+    book.update_numbers_status({'vk_0': '70'}, country=0, operator='mts')
+    assert [(offer.country, offer.operator) for offer in book.cheapest('vk', n=5, min_count=60)] == [('0', 'mts')]
+
+
+def test_max_price_accepts_strings():
+    book = PriceBook()
+    book.update_prices({'0': {'vk': {'cost': 10, 'count': 5}}, '6': {'vk': {'cost': 12, 'count': 5}}})
+    assert [offer.country for offer in book.cheapest('vk', n=5, max_price='11')] == ['0']
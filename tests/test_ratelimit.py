@@ -0,0 +1,100 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from async_smsactivate.api import AsyncSMSActivateAPI, SMSActivateAPI
+from async_smsactivate.ratelimit import RateLimiter, TokenBucket, shared_limiter
+
+
+def elapsed(func):
+    started = time.monotonic()
+    func()
+    return time.monotonic() - started
+
+
+def test_bucket_serves_burst_then_rate():
+    bucket = TokenBucket(10, burst=2)
+    assert [bucket.reserve() for _ in range(2)] == [0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+
+
+def test_rate_limits_sync_client(server):
+    limiter = RateLimiter(rate=(20, 1))
+    api = SMSActivateAPI('test', api_url=server.url, rate_limiter=limiter)
+    assert elapsed(lambda: [api.getBalance() for _ in range(6)]) >= 0.24
+
+
+def test_action_rate_only_applies_to_its_action(server):
+    limiter = RateLimiter(action_rates={'getNumber': (5, 1)})
+
+    async def main():
+        async with AsyncSMSActivateAPI('test', api_url=server.url, rate_limiter=limiter) as api:
+            fast = elapsed_async(asyncio.gather(*(api.getBalance() for _ in range(10))))
+            slow = elapsed_async(asyncio.gather(*(api.getNumber(service='vk') for _ in range(3))))
+            return await fast, await slow
+
+    fast, slow = asyncio.run(main())
+    assert fast < 0.2
+    assert slow >= 0.35
+
+
+async def elapsed_async(awaitable):
+    started = time.monotonic()
+    await awaitable
+    return time.monotonic() - started
+
+
+def test_max_in_flight_is_shared_between_threads_and_loops(server):
+    server.latency = 0.05
+    limiter = RateLimiter(max_in_flight=2)
+    peak = []
+
+    def sample():
+        while not done.is_set():
+            peak.append(limiter.in_flight)
+            time.sleep(0.005)
+
+    async def main():
+        async with AsyncSMSActivateAPI('test', api_url=server.url, rate_limiter=limiter) as api:
+            await asyncio.gather(*(api.getBalance() for _ in range(6)))
+
+    sync_api = SMSActivateAPI('test', api_url=server.url, rate_limiter=limiter)
+    done = threading.Event()
+    threads = [threading.Thread(target=sample),
+               threading.Thread(target=lambda: [sync_api.getBalance() for _ in range(4)])]
+    for thread in threads:
+        thread.start()
+    asyncio.run(main())
+    threads[1].join()
+    done.set()
+    threads[0].join()
+    assert max(peak) == 2
+    assert limiter.in_flight == 0
+
+
+def test_cancelled_waiter_does_not_leak_a_slot():
+    limiter = RateLimiter(max_in_flight=1)
+
+    async def main():
+        await limiter.acquire_async('getBalance')
+        waiter = asyncio.ensure_future(limiter.acquire_async('getBalance'))
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        limiter.release()
+        await asyncio.gather(waiter, return_exceptions=True)
+        await asyncio.wait_for(limiter.acquire_async('getBalance'), 1)
+        limiter.release()
+
+    asyncio.run(main())
+    assert limiter.in_flight == 0
+
+
+def test_shared_limiter_is_created_once():
+    limiter = shared_limiter('tests', rate=5)
+    assert shared_limiter('tests', rate=100) is limiter
+    assert limiter.bucket.rate == 5
@@ -0,0 +1,74 @@
+import asyncio
+
+from async_smsactivate.api import AsyncSMSActivateAPI
+from async_smsactivate.rent import RentManager, parse_end_date
+
+
+class FakeAPI:
+    """Continue price 5; ``fail`` lists the rent ids whose next price request raises."""
+
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.renewed = []
+
+    async def getContinueRentPriceNumber(self, id):
+        if id in self.fail:
+            self.fail.discard(id)
+            raise OSError("connection reset")
+        return {'status': 'success', 'price': 5.0}
+
+    async def continueRentNumber(self, id, time=None):
+        self.renewed.append(id)
+        return {'status': 'success', 'phone': {'id': id, 'number': '79000000000', 'endDate': 5000}}
+
+
+def test_parse_end_date():
+    assert parse_end_date('1970-01-01T00:01:40') == 100.0
+    assert parse_end_date(12) == 12.0
+    assert parse_end_date('garbage') is None
+
+
+def test_renews_due_rents_within_price():
+    api = FakeAPI()
+    rents = RentManager(api, max_price=10, renew_before=100, clock=lambda: 1000)
+    rents.add(1, end=1050)
+    rents.add(2, end=3000)
+    results = asyncio.run(rents.renew_due())
+    assert list(results) == ['1']
+    assert rents.rents['1'].end == 5000 and rents.rents['1'].renewals == 1
+    assert rents.next_renewal() == 2900
+
+
+def test_declined_price_is_not_retried():
+    rents = RentManager(FakeAPI(), max_price=1, renew_before=100, clock=lambda: 1000)
+    rents.add(1, end=1050)
+    assert asyncio.run(rents.renew_due())['1']['error'] == 'PRICE_DECLINED'
+    assert rents.next_renewal() is None
+
+
+def test_failed_renewal_stays_scheduled():
+    api = FakeAPI(fail={'1'})
+    rents = RentManager(api, max_price=10, renew_before=100, clock=lambda: 1000)
+    rents.add(1, end=1050)
+    rents.add(2, end=1060)
+    results = asyncio.run(rents.renew_due())
+    assert results['1'] == {'error': 'OSError', 'message': 'connection reset'}
+    assert api.renewed == ['2']
+    assert rents.next_renewal() == 950
+    asyncio.run(rents.renew_due())
+    assert api.renewed == ['2', '1']
+
+
+def test_rent_and_poll_with_mock_server(server):
+    async def main():
+        async with AsyncSMSActivateAPI('test', api_url=server.url) as api:
+            rents = api.rent_manager()
+            result = await rents.rent('vk', time='4')
+            first = await rents.poll()
+            again = await rents.poll()
+            return result, rents, first, again
+
+    result, rents, first, again = asyncio.run(main())
+    assert str(result['phone']['id']) in rents
+    assert [message.text for message in first] == ['Your code: 12345']
+    assert again == []
@@ -0,0 +1,56 @@
+from async_smsactivate.metrics import error_code
+from async_smsactivate.retry import TERMINAL, TRANSIENT, RetryPolicy, classify, transient_error, transient_response
+
+
+def test_classify():
+    assert classify(b'') == TRANSIENT
+    assert classify(b'NO_CONNECTION') == TRANSIENT
+    assert classify(b'NO_BALANCE') == TERMINAL
+    assert classify(b'ACCESS_BALANCE:1.00') is None
+    assert classify(b'{"status": "success"}') is None
+
+
+def test_transient_response():
+    assert transient_response(503, b'')
+    assert transient_response(429, b'ok')
+    assert transient_response(200, b'ERROR_SQL')
+    assert not transient_response(200, b'BAD_KEY')
+
+
+def test_transient_error():
+    for code in ('NO_CONNECTION', 'ERROR_SQL', 'SQL_ERROR', '', 'HTTP_503', 'HTTP_429', 'CIRCUIT_OPEN'):
+        assert transient_error(code), code
+    for code in ('STATUS_CANCEL', 'NO_ACTIVATION', 'HTTP_404', None):
+        assert not transient_error(code), code
+
+
+def test_policy_uses_shared_classification():
+    policy = RetryPolicy(transient_errors={'BAD_KEY'})
+    assert policy.is_transient_response(200, b'BAD_KEY')
+    assert not policy.is_transient_response(200, b'NO_CONNECTION')
+    assert policy.is_transient_response(502, b'')
+
+
+def test_purchases_only_retried_when_not_executed():
+    policy = RetryPolicy()
+    assert policy.should_retry_response('getNumber', 200, b'NO_CONNECTION')
+    assert not policy.should_retry_response('getNumber', 503, b'')
+    assert not policy.should_retry_response('getNumber', 200, b'')
+    assert policy.should_retry_response('getStatus', 503, b'')
+    assert policy.should_retry_exception('getNumber', unsent=True)
+    assert not policy.should_retry_exception('getNumber', unsent=False)
+    assert policy.should_retry_exception('getStatus', unsent=False)
+
+
+def test_retry_budget():
+    state = RetryPolicy(max_attempts=3, base_delay=0.1, rand=lambda: 1.0).start()
+    assert state.next_delay() == 0.1
+    assert state.next_delay() == 0.2
+    assert state.next_delay() is None
+
+
+def test_metrics_error_code():
+    assert error_code(503, b'x') == 'HTTP_503'
+    assert error_code(200, b'') == 'EMPTY_BODY'
+    assert error_code(200, b'NO_BALANCE') == 'NO_BALANCE'
+    assert error_code(200, b'ACCESS_BALANCE:1') is None
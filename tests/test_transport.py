@@ -0,0 +1,99 @@
+import asyncio
+import time
+
+import pytest
+
+from async_smsactivate.api import AsyncSMSActivateAPI
+from async_smsactivate.deadline import Timeouts
+from async_smsactivate.mirrors import MirrorSelector
+from async_smsactivate.retry import RetryPolicy
+from async_smsactivate.transport import AiohttpTransport, HttpxTransport
+
+# 可选依赖：未安装 httpx 时跳过
+httpx = pytest.importorskip('httpx')
+
+
+def run(scenario):
+    return asyncio.run(scenario())
+
+
+def test_httpx_results_match_aiohttp(server):
+    async def scenario():
+        results = []
+        for transport in (AiohttpTransport(), HttpxTransport(http2=False)):
+            async with AsyncSMSActivateAPI('test', api_url=server.url, transport=transport) as api:
+                results.append((await api.getBalance(), await api.getCountries()))
+            await transport.close()
+        return results
+
+    aiohttp_results, httpx_results = run(scenario)
+    assert aiohttp_results == httpx_results
+
+
+def test_concurrent_requests_share_few_connections(server):
+    server.latency = 0.01
+
+    async def scenario():
+        transport = HttpxTransport(max_connections=2)
+        async with AsyncSMSActivateAPI('test', api_url=server.url, transport=transport) as api:
+            results = await asyncio.gather(*(api.getBalance() for _ in range(50)))
+        await transport.close()
+        return results
+
+    assert run(scenario) == [{'balance': '1000000.00'}] * 50
+    assert server.requests == 50
+
+
+def test_connect_errors_are_unsent_and_fail_over(server, dead_url):
+    transport = HttpxTransport()
+    assert transport.unsent(httpx.ConnectError('refused'))
+    assert not transport.unsent(httpx.ReadTimeout('slow'))
+    mirrors = MirrorSelector([dead_url, server.url], explore=0)
+
+    async def scenario():
+        async with AsyncSMSActivateAPI('test', api_urls=mirrors, transport=transport,
+                                       retry_policy=RetryPolicy()) as api:
+            # 购买接口不幂等：只有确定未发出的请求才会换镜像重发
+            result = await api.getNumber(service='vk')
+        await transport.close()
+        return result
+
+    assert 'activation_id' in run(scenario)
+
+
+def test_timeouts_bound_slow_answers(server):
+    server.latency = 1.0
+
+    async def scenario():
+        transport = HttpxTransport()
+        async with AsyncSMSActivateAPI('test', api_url=server.url, transport=transport,
+                                       timeout=Timeouts(connect=1.0, read=0.1)) as api:
+            started = time.monotonic()
+            with pytest.raises(httpx.ReadTimeout):
+                await api.getBalance()
+            read = time.monotonic() - started
+        async with AsyncSMSActivateAPI('test', api_url=server.url, transport=transport,
+                                       timeout=Timeouts(total=0.2)) as api:
+            started = time.monotonic()
+            with pytest.raises(asyncio.TimeoutError):
+                await api.getBalance()
+            total = time.monotonic() - started
+        await transport.close()
+        return read, total
+
+    read, total = run(scenario)
+    assert read < 0.6 and total < 0.6
+
+
+def test_shared_client_is_not_closed(server):
+    async def scenario():
+        client = httpx.AsyncClient()
+        transport = HttpxTransport(client=client)
+        async with AsyncSMSActivateAPI('test', api_url=server.url, transport=transport) as api:
+            await api.getBalance()
+        await transport.close()
+        closed = client.is_closed
+        await client.aclose()
+        return closed
+
+    assert run(scenario) is False
@@ -0,0 +1,88 @@
+import asyncio
+
+from async_smsactivate.api import AsyncSMSActivateAPI
+from async_smsactivate.watcher import ActivationWatcher
+
+
+def run(server, scenario):
+    async def main():
+        async with AsyncSMSActivateAPI('test', api_url=server.url) as api:
+            return await scenario(api)
+
+    return asyncio.run(main())
+
+
+def test_one_sweep_serves_every_watched_activation(server):
+    server.code_delay = 0.1
+
+    async def scenario(api):
+        ids = [(await api.getNumber(service='vk'))['activation_id'] for _ in range(20)]
+        before = server.requests
+        async with ActivationWatcher(api, interval=0.05) as watcher:
+            statuses = await asyncio.gather(*(watcher.wait(id, timeout=5) for id in ids))
+        return ids, statuses, server.requests - before
+
+    ids, statuses, requests = run(server, scenario)
+    assert [status.code for status in statuses] == [server.activations[id]['code'] for id in ids]
+    # 每个周期一次 getActiveActivations，而不是每个激活一次 getStatus
+    assert requests < 20
+
+
+def test_finished_activation_ends_waiters_and_iterators(server):
+    server.code_delay = 60
+
+    async def scenario(api):
+        id = (await api.getNumber(service='vk'))['activation_id']
+        async with ActivationWatcher(api, interval=0.02) as watcher:
+            future = watcher.watch(id)
+            codes = [code async for code in _cancel_after(api, id, watcher.codes(id))]
+            return await future, codes
+
+    ended, codes = run(server, scenario)
+    assert ended['error'] == 'NO_ACTIVATION'
+    assert codes == []
+
+
+async def _cancel_after(api, id, codes):
+    await asyncio.sleep(0.05)
+    await api.setStatus(id=id, status=8)
+    async for code in codes:
+        yield code
+
+
+def test_stream_codes_yields_each_code_once_with_full_text(server):
+    async def scenario(api):
+        ids = {str((await api.getNumber(service='vk'))['activation_id']) for _ in range(3)}
+        events = []
+        stream = api.stream_codes(interval=0.02)
+        async for event in stream:
+            events.append(event)
+            if len(events) == 3:
+                break
+        await stream.aclose()
+        return ids, events
+
+    ids, events = run(server, scenario)
+    assert {event.activation_id for event in events} == ids
+    for event in events:
+        assert event.full_text == 'Your code: %s' % event.code
+
+
+def test_stream_codes_falls_back_to_get_status(server):
+    server.code_delay = 0.2
+
+    async def scenario(api):
+        id = (await api.getNumber(service='vk'))['activation_id']
+        stream = api.stream_codes(interval=0.05, full_text=False)
+        first_sweep = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0.02)
+        # 第一次查询之后 getActiveActivations 一直失败
+        server._handlers['getActiveActivations'] = lambda params: 'NO_CONNECTION'
+        event = await asyncio.wait_for(first_sweep, 5)
+        await stream.aclose()
+        return id, event
+
+    id, event = run(server, scenario)
+    assert event.activation_id == str(id)
+    assert event.code == server.activations[id]['code']
+    assert event.full_text is None